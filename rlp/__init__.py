@@ -5,10 +5,28 @@ from importlib.metadata import (
 from . import (
     sedes,
 )
+from .aio import (
+    adecode,
+    adecode_stream,
+)
+from .builder import (
+    ListBuilder,
+)
+from .caches import (
+    DecodingCache,
+    EncodingCache,
+    InternTable,
+    cached_rlp_registry,
+)
 from .codec import (
     decode,
+    decode_columns,
+    element_hashes,
     encode,
+    encode_columns,
+    encode_iov,
     infer_sedes,
+    split_list,
 )
 from .exceptions import (
     DecodingError,
@@ -22,8 +40,21 @@ from .lazy import (
     decode_lazy,
     peek,
 )
+from .limits import (
+    DecodeLimits,
+)
+from .parallel import (
+    decode_many,
+    encode_parallel,
+)
+from .pipeline import (
+    Pipeline,
+)
 from .sedes import (
     Serializable,
 )
+from .validation import (
+    validate,
+)
 
 __version__ = __version("rlp")
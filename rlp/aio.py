@@ -0,0 +1,171 @@
+"""
+Decoding in asyncio applications without blocking the event loop.
+"""
+import asyncio
+import functools
+
+from rlp.codec import (
+    decode,
+    split_list,
+)
+from rlp.exceptions import (
+    DecodingError,
+    DeserializationError,
+)
+from rlp.sedes import (
+    CountableList,
+)
+
+# inputs up to this length are decoded right away, as handing them over to an
+# executor would take longer than decoding them
+INLINE_THRESHOLD = 64 * 1024
+
+
+async def adecode(
+    rlp,
+    sedes=None,
+    strict=True,
+    executor=None,
+    inline_threshold=INLINE_THRESHOLD,
+    yield_every=None,
+    **kwargs,
+):
+    """
+    Decode an RLP encoded object without blocking the event loop for long.
+
+    Short inputs are decoded right away. Longer ones are decoded in `executor`,
+    or, if `yield_every` is given and the input is a list decoded without a sedes
+    or with a :class:`rlp.sedes.CountableList`, element by element in the event
+    loop, which gets control back after every `yield_every` elements.
+
+    Usage example::
+
+        >>> import asyncio
+        >>> import rlp
+        >>> asyncio.run(rlp.adecode(rlp.encode([b"dog", b"cat"])))
+        [b'dog', b'cat']
+
+    :param sedes: the sedes to deserialize the result with, or `None`
+    :param strict: if false inputs that are longer than necessary don't cause an
+                   exception
+    :param executor: the :class:`concurrent.futures.Executor` to decode long
+                     inputs in, or `None` for the default executor of the loop
+    :param inline_threshold: the maximum length of inputs that are decoded right
+                             away
+    :param yield_every: the number of list elements to decode before yielding to
+                        the event loop, or `None` to use `executor` instead
+    :param `**kwargs`: further keyword arguments passed to :func:`rlp.decode`
+    :returns: the decoded and maybe deserialized Python object
+    :raises: :exc:`rlp.DecodingError` or :exc:`rlp.DeserializationError` as
+             :func:`rlp.decode`
+    """
+    if len(rlp) <= inline_threshold:
+        return decode(rlp, sedes, strict=strict, **kwargs)
+    if (
+        yield_every is not None
+        and not kwargs
+        and (sedes is None or isinstance(sedes, CountableList))
+    ):
+        try:
+            spans = split_list(rlp, strict=strict, spans=True)
+        except DecodingError:
+            # not a list, or invalid, which decoding at once will report
+            pass
+        else:
+            return await _decode_elements(rlp, spans, sedes, strict, yield_every)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(decode, rlp, sedes, strict=strict, **kwargs)
+    )
+
+
+async def adecode_stream(
+    reader,
+    sedes=None,
+    executor=None,
+    inline_threshold=INLINE_THRESHOLD,
+    limits=None,
+    **kwargs,
+):
+    """
+    Decode consecutive RLP encoded objects read from an asyncio stream.
+
+    Each item is read completely, guided by its length prefix, and then decoded
+    with :func:`adecode`. Iteration stops when the stream ends after an item.
+
+    :param reader: an :class:`asyncio.StreamReader` (or any object with an
+                   awaitable ``readexactly`` method)
+    :param sedes: the sedes to deserialize each item with, or `None`
+    :param executor: passed on to :func:`adecode`
+    :param inline_threshold: passed on to :func:`adecode`
+    :param limits: an optional :class:`rlp.DecodeLimits` object each item is
+                   checked against. The length announced by the prefix is checked
+                   against ``max_bytes`` before the payload is read.
+    :param `**kwargs`: further keyword arguments passed to :func:`rlp.decode`
+    :returns: an asynchronous iterator over the decoded objects
+    :raises: :exc:`rlp.DecodingError` if the stream ends within an item or an item
+             exceeds `limits`
+    """
+    while True:
+        try:
+            prefix = await reader.readexactly(1)
+        except asyncio.IncompleteReadError:
+            return
+        b0 = prefix[0]
+        if b0 < 0x80:  # single byte
+            length = 0
+        elif b0 < 0xB8:  # short string
+            length = b0 - 0x80
+        elif b0 < 0xC0:  # long string
+            prefix += await _read(reader, b0 - 0xB7, prefix)
+            length = int.from_bytes(prefix[1:], "big")
+        elif b0 < 0xF8:  # short list
+            length = b0 - 0xC0
+        else:  # long list
+            prefix += await _read(reader, b0 - 0xF7, prefix)
+            length = int.from_bytes(prefix[1:], "big")
+
+        if limits is not None and limits.max_bytes is not None:
+            if len(prefix) + length > limits.max_bytes:
+                raise DecodingError(
+                    f"Input too long ({len(prefix) + length} bytes, allowed "
+                    f"{limits.max_bytes})",
+                    prefix,
+                )
+        item_rlp = prefix + await _read(reader, length, prefix)
+        if limits is not None:
+            kwargs["limits"] = limits
+        yield await adecode(
+            item_rlp,
+            sedes,
+            executor=executor,
+            inline_threshold=inline_threshold,
+            **kwargs,
+        )
+
+
+async def _read(reader, length, prefix):
+    try:
+        return await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        raise DecodingError("RLP stream ends within an item", prefix + e.partial)
+
+
+async def _decode_elements(rlp, spans, sedes, strict, yield_every):
+    if sedes is None:
+        element_sedes = None
+    elif sedes.max_length is not None and len(spans) > sedes.max_length:
+        return decode(rlp, sedes, strict=strict)
+    else:
+        element_sedes = sedes.element_sedes
+
+    results = []
+    for index, (start, end) in enumerate(spans):
+        if index and index % yield_every == 0:
+            await asyncio.sleep(0)
+        try:
+            results.append(decode(rlp[start:end], element_sedes))
+        except (DecodingError, DeserializationError):
+            # decode the whole input to raise an error with the usual context
+            return decode(rlp, sedes, strict=strict)
+    return results if sedes is None else tuple(results)
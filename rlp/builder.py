@@ -0,0 +1,143 @@
+"""
+Incremental construction of RLP encoded lists.
+"""
+from rlp.codec import (
+    consume_length_prefix,
+    encode,
+    length_prefix,
+)
+from rlp.exceptions import (
+    DecodingError,
+    EncodingError,
+)
+
+
+class ListBuilder:
+    """
+    Builds the encoding of a list whose elements are added one after another.
+
+    The encoded elements are appended to a growable buffer, so adding an element
+    only costs encoding that element, and the size of the encoded list is known at
+    any time without encoding it. The prefix of the list is only added by
+    :meth:`encode`.
+
+    Usage example::
+
+        >>> import rlp
+        >>> from rlp.sedes import big_endian_int
+        >>> builder = rlp.ListBuilder(big_endian_int)
+        >>> builder.extend([1, 2])
+        >>> checkpoint = builder.checkpoint()
+        >>> builder.append_encoded(rlp.encode(3))
+        >>> len(builder), builder.encoded_size
+        (3, 4)
+        >>> builder.truncate(checkpoint)
+        >>> rlp.decode(builder.encode(), rlp.sedes.CountableList(big_endian_int))
+        (1, 2)
+
+    :param sedes: the sedes of the elements added unencoded, or `None` to infer it
+                  for each element
+    """
+
+    def __init__(self, sedes=None):
+        self.sedes = sedes
+        self._buffer = bytearray()
+        # a serial number for each element, to tell which checkpoints are still
+        # part of the current history
+        self._serials = []
+        self._next_serial = 1
+
+    def __len__(self):
+        return len(self._serials)
+
+    @property
+    def payload_size(self):
+        """The total length of the encoded elements in bytes."""
+        return len(self._buffer)
+
+    @property
+    def encoded_size(self):
+        """The length of the encoded list, including its prefix, in bytes."""
+        return len(self._prefix()) + len(self._buffer)
+
+    def append(self, obj):
+        """Encode `obj` and add it as the last element."""
+        if self.sedes is type(obj):
+            # serializable objects of the right class may have cached their encoding
+            self._buffer += encode(obj)
+        else:
+            self._buffer += encode(obj, self.sedes)
+        self._add_serial()
+
+    def extend(self, objs):
+        """Encode each object of the iterable `objs` and add it."""
+        for obj in objs:
+            self.append(obj)
+
+    def append_encoded(self, rlp):
+        """
+        Add an element that has been encoded already.
+
+        Only the length prefix of `rlp` is checked, to make sure that it is a
+        single item, the payload is taken as it is.
+
+        :raises: :exc:`rlp.DecodingError` if `rlp` is not exactly one item
+        """
+        try:
+            _, _, length, start = consume_length_prefix(rlp, 0)
+        except IndexError:
+            raise DecodingError("RLP string too short", rlp)
+        if start + length != len(rlp):
+            raise DecodingError(
+                f"Length prefix announced {length} bytes, but {len(rlp) - start} "
+                "are given",
+                rlp,
+                offset=start,
+            )
+        self._buffer += rlp
+        self._add_serial()
+
+    def extend_encoded(self, rlps):
+        """Add each encoded element of the iterable `rlps`."""
+        for rlp in rlps:
+            self.append_encoded(rlp)
+
+    def checkpoint(self):
+        """
+        Get a marker of the current state to return to with :meth:`truncate`.
+
+        :returns: an opaque object
+        """
+        serial = self._serials[-1] if self._serials else 0
+        return (len(self._serials), len(self._buffer), serial)
+
+    def truncate(self, checkpoint):
+        """
+        Remove all elements added since `checkpoint` was taken.
+
+        :raises: :exc:`ValueError` if any element that existed when `checkpoint`
+                 was taken has been removed since
+        """
+        count, size, serial = checkpoint
+        if count > len(self._serials) or (count and self._serials[count - 1] != serial):
+            raise ValueError("Checkpoint is not part of the current state")
+        del self._buffer[size:]
+        del self._serials[count:]
+
+    def encode(self):
+        """
+        Get the encoding of the list of all elements added so far.
+
+        :raises: :exc:`rlp.EncodingError` if the list is too big to encode
+        """
+        return b"".join((self._prefix(), self._buffer))
+
+    def _add_serial(self):
+        self._serials.append(self._next_serial)
+        self._next_serial += 1
+
+    def _prefix(self):
+        try:
+            return length_prefix(len(self._buffer), 0xC0)
+        except ValueError:
+            raise EncodingError("Item too big to encode", self)
@@ -0,0 +1,368 @@
+"""
+Opt-in caches that trade memory for speed when the same objects are processed
+repeatedly.
+"""
+import collections
+import contextvars
+import threading
+import weakref
+
+_active_encoding_cache = contextvars.ContextVar("encoding_cache", default=None)
+_active_decoding_cache = contextvars.ContextVar("decoding_cache", default=None)
+
+
+def get_active_encoding_cache():
+    """Get the :class:`EncodingCache` currently in use, or `None`."""
+    return _active_encoding_cache.get()
+
+
+def get_active_decoding_cache():
+    """Get the :class:`DecodingCache` currently in use, or `None`."""
+    return _active_decoding_cache.get()
+
+
+class _BoundedCache:
+    """
+    Base class for LRU caches that are activated with a ``with`` block.
+
+    Entries are tuples whose first element is an object that has to be identical
+    for a lookup to succeed (or `None`) and whose second element is the cached
+    value.
+    """
+
+    _context_var = None
+
+    def __init__(self, max_entries=4096, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = collections.OrderedDict()
+        self._tokens = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __enter__(self):
+        self._tokens.append(self._context_var.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._context_var.reset(self._tokens.pop())
+
+    @property
+    def hit_rate(self):
+        """The fraction of lookups that were answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, key, ref):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def _put(self, key, ref, value, size):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous[2]
+        self._entries[key] = (ref, value, size)
+        self.nbytes += size
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.nbytes -= evicted_size
+            self.evictions += 1
+
+
+class EncodingCache(_BoundedCache):
+    """
+    A bounded LRU cache for the RLP encodings of repeated objects.
+
+    While the cache is active (i.e. inside a ``with`` block), :func:`rlp.encode`
+    looks up every :class:`rlp.Serializable` object it encodes in the cache,
+    including the nested ones, and only encodes those that are missing. As
+    serializable objects are immutable, they are identified by object identity.
+    Other objects are only looked up as a whole, and only if they consist of
+    nothing but bytes, integers and tuples, in which case they are identified by
+    their content.
+
+    Usage example::
+
+        >>> import rlp
+        >>> with rlp.EncodingCache(max_entries=1000) as cache:
+        ...     encodings = [rlp.encode((b"a", 1)) for _ in range(3)]
+        >>> cache.hits, cache.misses
+        (2, 1)
+
+    Bear in mind that cached objects are kept alive until they are evicted. A cache
+    is activated for the current thread (or asyncio task) only and must not be
+    active in several threads at the same time.
+
+    :param max_entries: maximum number of encodings to keep, or `None` for no
+                        limit
+    :param max_bytes: maximum total length of the encodings to keep, or `None`
+                      for no limit
+    :ivar hits: number of encodings taken from the cache
+    :ivar misses: number of encodings that were not in the cache
+    :ivar evictions: number of encodings dropped to stay within the limits
+    """
+
+    _context_var = _active_encoding_cache
+
+    def get_by_identity(self, obj):
+        """Get the cached encoding of `obj` by identity, or `None`."""
+        return self._get(id(obj), obj)
+
+    def put_by_identity(self, obj, encoding):
+        """Cache the encoding of `obj` by identity."""
+        self._put(id(obj), obj, encoding, len(encoding))
+
+    def get_by_content(self, obj):
+        """
+        Get the cached encoding of `obj` by content, or `None`.
+
+        `obj` must be made of bytes, integers and tuples only, as objects of other
+        types may be equal to them but have a different encoding.
+        """
+        # the type is part of the key so that e.g. b"" and () don't share an entry
+        return self._get((type(obj), obj), None)
+
+    def put_by_content(self, obj, encoding):
+        """Cache the encoding of `obj` (see :meth:`get_by_content`) by content."""
+        self._put((type(obj), obj), None, encoding, len(encoding))
+
+
+class DecodingCache(_BoundedCache):
+    """
+    A bounded LRU cache for the results of decoding the same input repeatedly.
+
+    While the cache is active (i.e. inside a ``with`` block), :func:`rlp.decode`
+    looks up the input bytes together with the sedes in the cache and, on a hit,
+    returns the object that has been built before instead of decoding it again.
+    Only results that are immutable are cached, i.e. :class:`rlp.Serializable`
+    objects as well as tuples, strings and integers, and only if no additional
+    keyword arguments are passed to the sedes and neither `trusted`,
+    `recursive_cache` nor `intern_table` is given.
+
+    Usage example::
+
+        >>> import rlp
+        >>> from rlp.sedes import CountableList, big_endian_int
+        >>> sedes = CountableList(big_endian_int)
+        >>> encoded = rlp.encode([1, 2])
+        >>> with rlp.DecodingCache(max_entries=1000) as cache:
+        ...     results = [rlp.decode(encoded, sedes) for _ in range(4)]
+        >>> results[0] is results[3], cache.hit_rate
+        (True, 0.75)
+
+    Like an :class:`EncodingCache`, a decoding cache must not be active in several
+    threads at the same time.
+
+    :param max_entries: maximum number of results to keep, or `None` for no limit
+    :param max_bytes: maximum total length of the inputs of the results to keep, or
+                      `None` for no limit
+    :ivar hits: number of results taken from the cache
+    :ivar misses: number of inputs that were not in the cache
+    :ivar evictions: number of results dropped to stay within the limits
+    """
+
+    _context_var = _active_decoding_cache
+
+    def get(self, rlp, sedes, strict=True):
+        """Get the cached result of decoding `rlp` with `sedes`, or `None`."""
+        return self._get((id(sedes), strict, rlp), sedes)
+
+    def put(self, rlp, sedes, strict, obj):
+        """Cache the result of decoding `rlp` with `sedes`."""
+        # sedes are not necessarily hashable (e.g. lists), so they are keyed by
+        # identity and kept alive by the entry
+        self._put((id(sedes), strict, rlp), sedes, obj, len(rlp))
+
+
+class CachedRLPRegistry:
+    """
+    Keeps the total size of the encodings cached in :attr:`_cached_rlp` of
+    :class:`rlp.Serializable` objects within a budget.
+
+    Tracking is disabled by default. Once a budget has been set with
+    :meth:`set_budget`, every encoding cached from then on is registered, and when
+    the total exceeds the budget, the oldest caches are dropped until it fits
+    again. Objects whose cache has been dropped are simply encoded again when
+    needed. Objects are not kept alive by the registry.
+
+    Use the instance :data:`rlp.cached_rlp_registry`, e.g.::
+
+        >>> import rlp
+        >>> rlp.cached_rlp_registry.set_budget(256 * 1024 * 1024)
+        >>> rlp.cached_rlp_registry.set_budget(None)
+
+    The registry may be used from several threads. While tracking is disabled,
+    registering an encoding doesn't take a lock.
+
+    :ivar nbytes: total length of the registered encodings
+    :ivar evictions: number of caches dropped to stay within the budget
+    """
+
+    def __init__(self):
+        self.max_bytes = None
+        self.nbytes = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        # reentrant, as the weakref callbacks may run while it is held
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def set_budget(self, max_bytes):
+        """
+        Set the maximum total length of cached encodings.
+
+        If `max_bytes` is `None` tracking is disabled and all caches are kept.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            if max_bytes is None:
+                self._entries.clear()
+                self.nbytes = 0
+            else:
+                self._evict()
+
+    def track(self, obj, rlp):
+        """Register that `obj` has cached the encoding `rlp` (or `None`)."""
+        if self.max_bytes is None:
+            return
+        key = id(obj)
+        with self._lock:
+            if self.max_bytes is None:
+                return
+            self._forget(key)
+            if rlp is not None:
+                ref = weakref.ref(obj, lambda ref: self._forget(key, ref))
+                self._entries[key] = (ref, len(rlp))
+                self.nbytes += len(rlp)
+                self._evict()
+
+    def _forget(self, key, ref=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (ref is None or entry[0] is ref):
+                del self._entries[key]
+                self.nbytes -= entry[1]
+
+    def _evict(self):
+        while self._entries and self.nbytes > self.max_bytes:
+            _, (ref, length) = self._entries.popitem(last=False)
+            self.nbytes -= length
+            self.evictions += 1
+            obj = ref()
+            if obj is not None:
+                obj._drop_cached_rlp()
+
+
+cached_rlp_registry = CachedRLPRegistry()
+
+
+class InternTable:
+    """
+    A bounded table of byte strings shared between decoded objects.
+
+    Decoded data often contains the same short values over and over again (e.g.
+    addresses, empty strings or common hashes). Passing an intern table to
+    :func:`rlp.decode` or :meth:`rlp.sedes.CountableList.deserialize` replaces
+    each repeated string by the instance seen first, so that only one copy is kept
+    in memory.
+
+    Usage example::
+
+        >>> import rlp
+        >>> table = rlp.InternTable()
+        >>> first, second = rlp.decode(rlp.encode([b"dog", b"dog"]), intern_table=table)
+        >>> first is second
+        True
+
+    A table must only be used by one thread at a time.
+
+    :param max_entries: maximum number of strings to keep, or `None` for no limit
+    :param max_bytes: maximum total length of the strings to keep, or `None` for no
+                      limit
+    :param max_length: strings longer than this are never interned
+    :ivar hits: number of strings replaced by a shared instance
+    :ivar misses: number of strings added to the table
+    :ivar evictions: number of strings dropped to stay within the limits
+    """
+
+    def __init__(self, max_entries=65536, max_bytes=None, max_length=32):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_length = max_length
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def intern(self, value):
+        """
+        Get the shared instance of the byte string `value`.
+
+        Strings that are too long or not of type :class:`bytes` are returned as
+        they are.
+        """
+        if type(value) is not bytes or len(value) > self.max_length:
+            return value
+        shared = self._entries.get(value)
+        if shared is not None:
+            self.hits += 1
+            return shared
+        self.misses += 1
+        self._entries[value] = value
+        self.nbytes += len(value)
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            # dictionaries are ordered, so this drops the oldest entry
+            evicted = self._entries.pop(next(iter(self._entries)))
+            self.nbytes -= len(evicted)
+            self.evictions += 1
+        return value
+
+    def intern_item(self, item):
+        """
+        Intern all strings in a decoded item, i.e. a string or a (nested) list of
+        strings.
+
+        :returns: the item with the strings replaced by their shared instances
+        """
+        if type(item) is list:
+            return [self.intern_item(element) for element in item]
+        else:
+            return self.intern(item)
+
+    def clear(self):
+        """Remove all strings and reset the counters."""
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
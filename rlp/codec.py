@@ -1,16 +1,27 @@
 import collections
+import functools
 
 from eth_utils import (
-    big_endian_to_int,
-    int_to_big_endian,
     is_bytes,
+    keccak,
 )
 
+from rlp.atomic import (
+    Atomic,
+)
+from rlp.caches import (
+    get_active_decoding_cache,
+    get_active_encoding_cache,
+)
 from rlp.exceptions import (
     DecodingError,
+    DeserializationError,
     EncodingError,
+    FastFailError,
+    SerializationError,
 )
 from rlp.sedes import (
+    LazyInt,
     big_endian_int,
     binary,
     boolean,
@@ -20,7 +31,9 @@ from rlp.sedes.binary import (
     Binary as BinaryClass,
 )
 from rlp.sedes.lists import (
+    CountableList,
     List,
+    get_deserializer,
     is_sedes,
     is_sequence,
 )
@@ -36,10 +49,6 @@ try:
 except ImportError:
     import logging
 
-    from rlp.atomic import (
-        Atomic,
-    )
-
     logger = logging.getLogger("rlp.codec")
     logger.debug(
         "Consider installing rusty-rlp to improve pyrlp performance with a rust based"
@@ -74,10 +83,29 @@ except ImportError:
             raise DecodingError("RLP string too short", item)
         if end != len(item) and strict:
             msg = f"RLP string ends with {len(item) - end} superfluous bytes"
-            raise DecodingError(msg, item)
+            raise DecodingError(msg, item, offset=end)
 
         return result, per_item_rlp
 
+    def decode_raw_trusted(item, strict):
+        """
+        Decode input that is known to be canonical RLP.
+
+        The length prefixes are not checked to be canonical, but the announced
+        lengths are still checked against the enclosing items.
+
+        :returns: a tuple ``(result, end)``, where ``end`` is the position after
+                  the root item
+        """
+        try:
+            result, end = _consume_item_trusted(item, 0, len(item))
+        except IndexError:
+            raise DecodingError("RLP string too short", item)
+        if end != len(item) and strict:
+            msg = f"RLP string ends with {len(item) - end} superfluous bytes"
+            raise DecodingError(msg, item, offset=end)
+        return result, end
+
 else:
 
     def decode_raw(item, strict, preserve_per_item_rlp):
@@ -86,6 +114,11 @@ else:
         except (TypeError, rusty_rlp.DecodingError) as e:
             raise DecodingError(e, item)
 
+    def decode_raw_trusted(item, strict):
+        result = decode_raw(item, strict, False)[0]
+        _, _, length, start = consume_length_prefix(item, 0)
+        return result, start + length
+
     def encode_raw(obj):
         try:
             if isinstance(obj, bytearray):
@@ -126,6 +159,13 @@ def encode(obj, sedes=None, infer_serializer=True, cache=True):
              big to encode (will not happen)
     :raises: :exc:`rlp.SerializationError` if the serialization fails
     """
+    if (
+        type(obj) is int
+        and 0 <= obj < SMALL_INT_LIMIT
+        and (sedes is big_endian_int or (sedes is None and infer_serializer))
+    ):
+        return SMALL_INT_RLP[obj]
+
     if isinstance(obj, Serializable):
         cached_rlp = obj._cached_rlp
         if sedes is None and cached_rlp:
@@ -135,10 +175,21 @@ def encode(obj, sedes=None, infer_serializer=True, cache=True):
     else:
         really_cache = False
 
+    encoding_cache = get_active_encoding_cache()
+    if encoding_cache is not None and (sedes or infer_serializer):
+        result = _encode_with_encoding_cache(obj, sedes, encoding_cache)
+        if really_cache:
+            obj._cached_rlp = result
+        return result
+
     if sedes:
         item = sedes.serialize(obj)
     elif infer_serializer:
-        item = infer_sedes(obj).serialize(obj)
+        try:
+            item = _serialize_inferred(obj)
+        except SerializationError:
+            # repeat with the full sedes to raise an error with the usual context
+            item = _infer_shared_sedes(obj).serialize(obj)
     else:
         item = obj
 
@@ -148,6 +199,179 @@ def encode(obj, sedes=None, infer_serializer=True, cache=True):
     return result
 
 
+def _encode_with_encoding_cache(obj, sedes, encoding_cache):
+    try:
+        if sedes or isinstance(obj, Serializable):
+            return _encode_cached_subobjects(obj, sedes, encoding_cache)
+
+        if not _is_plain_content(obj):
+            # equal objects of other types (e.g. serializable objects of different
+            # classes) may have different encodings, so the content can't be used
+            # as key
+            return _encode_cached_subobjects(obj, None, encoding_cache)
+        result = encoding_cache.get_by_content(obj)
+        if result is None:
+            result = _encode_cached_subobjects(obj, None, encoding_cache)
+            encoding_cache.put_by_content(obj, result)
+        return result
+    except SerializationError:
+        # repeat without the cache to raise an error with the usual context
+        return encode_raw((sedes or _infer_shared_sedes(obj)).serialize(obj))
+
+
+def _is_plain_content(obj):
+    """Check if `obj` consists of nothing but bytes, integers and tuples."""
+    obj_type = type(obj)
+    if obj_type is tuple:
+        return all(_is_plain_content(element) for element in obj)
+    return obj_type is bytes or obj_type is int
+
+
+def _encode_cached_subobjects(obj, sedes, encoding_cache):
+    """
+    Encode `obj` using the encoding cache for all serializable objects in it.
+
+    :param sedes: the sedes of `obj`, or `None` to infer it
+    """
+    obj_type = type(obj)
+    if isinstance(obj, Serializable) and (sedes is None or sedes is obj_type):
+        result = obj._cached_rlp or encoding_cache.get_by_identity(obj)
+        if result is None:
+            result = _encode_list_elements(obj, obj._meta.sedes, encoding_cache)
+            encoding_cache.put_by_identity(obj, result)
+        return result
+    elif sedes is None and (obj_type is list or obj_type is tuple):
+        return _encode_list_elements(obj, [None] * len(obj), encoding_cache)
+    elif isinstance(sedes, List) and is_sequence(obj) and len(sedes) == len(obj):
+        return _encode_list_elements(obj, sedes, encoding_cache)
+    elif (
+        isinstance(sedes, CountableList)
+        and is_sequence(obj)
+        and (sedes.max_length is None or len(obj) <= sedes.max_length)
+    ):
+        element_sedes = [sedes.element_sedes] * len(obj)
+        return _encode_list_elements(obj, element_sedes, encoding_cache)
+    elif sedes is None:
+        return encode_raw(_serialize_inferred(obj))
+    else:
+        return encode_raw(sedes.serialize(obj))
+
+
+def _encode_list_elements(obj, element_sedes, encoding_cache):
+    payload = b"".join(
+        [
+            _encode_cached_subobjects(element, sedes, encoding_cache)
+            for element, sedes in zip(obj, element_sedes)
+        ]
+    )
+    try:
+        return length_prefix(len(payload), 0xC0) + payload
+    except ValueError:
+        raise EncodingError("Item too big to encode", obj)
+
+
+# payloads at least this long are referenced by the result of encode_iov instead of
+# being copied together with their neighbours
+IOV_THRESHOLD = 1024
+
+
+def encode_iov(obj, sedes=None, infer_serializer=True, threshold=IOV_THRESHOLD):
+    """
+    Encode a Python object in RLP format as a list of buffers.
+
+    The concatenation of the buffers is the same as the result of
+    :func:`rlp.encode`, but strings of at least `threshold` bytes are not copied:
+    the serialized strings themselves are part of the list, with their length
+    prefixes as separate buffers. Everything in between is joined into as few
+    buffers as possible. The list can be passed to e.g. :meth:`socket.sendmsg` or
+    :func:`os.writev`, so that large payloads are written without being copied.
+
+    Usage example::
+
+        >>> import rlp
+        >>> blob = b"x" * 4096
+        >>> buffers = rlp.encode_iov([1, blob, 2])
+        >>> len(buffers), buffers[1] is blob
+        (3, True)
+        >>> b"".join(buffers) == rlp.encode([1, blob, 2])
+        True
+
+    :param sedes: the sedes to serialize `obj` with, or `None` as in
+                  :func:`rlp.encode`
+    :param infer_serializer: if ``True`` an appropriate serializer will be selected
+                             using :func:`rlp.infer_sedes` to serialize `obj` before
+                             encoding
+    :param threshold: the minimum length of strings that are not copied
+    :returns: a list of bytes-like objects
+    :raises: :exc:`rlp.EncodingError` if the item is too big to encode or not a
+             (nested) sequence of strings
+    :raises: :exc:`rlp.SerializationError` if the serialization fails
+    """
+    if isinstance(obj, Serializable) and sedes is None and obj._cached_rlp:
+        return [obj._cached_rlp]
+
+    if sedes:
+        item = sedes.serialize(obj)
+    elif infer_serializer:
+        try:
+            item = _serialize_inferred(obj)
+        except SerializationError:
+            # repeat with the full sedes to raise an error with the usual context
+            item = _infer_shared_sedes(obj).serialize(obj)
+    else:
+        item = obj
+
+    chunks = []
+    _encode_iov_item(item, chunks, threshold)
+
+    # join the runs of small chunks
+    buffers = []
+    run = []
+    for chunk in chunks:
+        if len(chunk) >= threshold:
+            if run:
+                buffers.append(b"".join(run))
+                run = []
+            buffers.append(chunk)
+        else:
+            run.append(chunk)
+    if run:
+        buffers.append(b"".join(run))
+    return buffers
+
+
+def _encode_iov_item(item, chunks, threshold):
+    """
+    Append the encoding of `item` to `chunks`.
+
+    :returns: the length of the encoding
+    """
+    if isinstance(item, Atomic):
+        if len(item) == 1 and item[0] < 128:
+            chunks.append(item)
+            return 1
+        prefix_offset = 0x80
+        index = len(chunks)
+        chunks.append(None)
+        chunks.append(item)
+        length = len(item)
+    elif not isinstance(item, str) and isinstance(item, collections.abc.Sequence):
+        prefix_offset = 0xC0
+        index = len(chunks)
+        chunks.append(None)
+        length = sum([_encode_iov_item(element, chunks, threshold) for element in item])
+    else:
+        msg = f"Cannot encode object of type {type(item).__name__}"
+        raise EncodingError(msg, item)
+
+    try:
+        prefix = length_prefix(length, prefix_offset)
+    except ValueError:
+        raise EncodingError("Item too big to encode", item)
+    chunks[index] = prefix
+    return len(prefix) + length
+
+
 LONG_LENGTH = 256**8
 
 
@@ -162,12 +386,20 @@ def length_prefix(length, offset):
     if length < 56:
         return ALL_BYTES[offset + length]
     elif length < LONG_LENGTH:
-        length_string = int_to_big_endian(length)
+        length_string = length.to_bytes((length.bit_length() + 7) // 8, "big")
         return ALL_BYTES[offset + 56 - 1 + len(length_string)] + length_string
     else:
         raise ValueError("Length greater than 256**8")
 
 
+# Final encodings of the integers that are most commonly encoded on their own, like
+# nonces, gas values or signature `v`s, so that they don't have to be built each time
+SMALL_INT_LIMIT = 1024
+SMALL_INT_RLP = tuple(
+    encode_raw(big_endian_int.serialize(i)) for i in range(SMALL_INT_LIMIT)
+)
+
+
 SHORT_STRING = 128 + 56
 
 
@@ -188,28 +420,34 @@ def consume_length_prefix(rlp, start):
     elif b0 < SHORT_STRING:  # short string
         if b0 - 128 == 1 and rlp[start + 1] < 128:
             raise DecodingError(
-                "Encoded as short string although single byte was possible", rlp
+                "Encoded as short string although single byte was possible",
+                rlp,
+                offset=start,
             )
         return (rlp[start : start + 1], bytes, b0 - 128, start + 1)
     elif b0 < 192:  # long string
         ll = b0 - 183  # - (128 + 56 - 1)
         if rlp[start + 1 : start + 2] == b"\x00":
-            raise DecodingError("Length starts with zero bytes", rlp)
+            raise DecodingError("Length starts with zero bytes", rlp, offset=start)
         len_prefix = rlp[start + 1 : start + 1 + ll]
-        l = big_endian_to_int(len_prefix)  # noqa: E741
+        l = int.from_bytes(len_prefix, "big")  # noqa: E741
         if l < 56:
-            raise DecodingError("Long string prefix used for short string", rlp)
+            raise DecodingError(
+                "Long string prefix used for short string", rlp, offset=start
+            )
         return (rlp[start : start + 1] + len_prefix, bytes, l, start + 1 + ll)
     elif b0 < 192 + 56:  # short list
         return (rlp[start : start + 1], list, b0 - 192, start + 1)
     else:  # long list
         ll = b0 - 192 - 56 + 1
         if rlp[start + 1 : start + 2] == b"\x00":
-            raise DecodingError("Length starts with zero bytes", rlp)
+            raise DecodingError("Length starts with zero bytes", rlp, offset=start)
         len_prefix = rlp[start + 1 : start + 1 + ll]
-        l = big_endian_to_int(len_prefix)  # noqa: E741
+        l = int.from_bytes(len_prefix, "big")  # noqa: E741
         if l < 56:
-            raise DecodingError("Long list prefix used for short list", rlp)
+            raise DecodingError(
+                "Long list prefix used for short list", rlp, offset=start
+            )
         return (rlp[start : start + 1] + len_prefix, list, l, start + 1 + ll)
 
 
@@ -230,30 +468,114 @@ def consume_payload(rlp, prefix, start, type_, length):
         item = rlp[start : start + length]
         return (item, [prefix + item], start + length)
     elif type_ is list:
+        end = start + length
+        layout = fixed_width_layout(rlp, start, end)
+        if layout is not None:
+            prefix_length, stride = layout
+            per_item_rlp = [prefix + rlp[start:end]]
+            per_item_rlp.extend(
+                [rlp[i : i + stride]] for i in range(start, end, stride)
+            )
+            items = [
+                rlp[i + prefix_length : i + stride] for i in range(start, end, stride)
+            ]
+            return (items, per_item_rlp, end)
+
         items = []
-        per_item_rlp = []
-        list_rlp = prefix
+        per_item_rlp = [None]
         next_item_start = start
-        end = next_item_start + length
         while next_item_start < end:
             p, t, l, s = consume_length_prefix(rlp, next_item_start)
             item, item_rlp, next_item_start = consume_payload(rlp, p, s, t, l)
             per_item_rlp.append(item_rlp)
-            # When the item returned above is a single element, item_rlp will also
-            # contain a single element, but when it's a list, the first element will be
-            # the RLP of the whole List, which is what we want here.
-            list_rlp += item_rlp[0]
             items.append(item)
-        per_item_rlp.insert(0, list_rlp)
         if next_item_start > end:
             raise DecodingError(
-                "List length prefix announced a too small " "length", rlp
+                "List length prefix announced a too small " "length", rlp, offset=start
             )
+        # The items are contiguous, so the RLP of the whole list is the concatenation
+        # of the RLP of each of them, which is exactly what we have just consumed.
+        per_item_rlp[0] = prefix + rlp[start:end]
         return (items, per_item_rlp, next_item_start)
     else:
         raise TypeError("Type must be either list or bytes")
 
 
+def _consume_item_trusted(rlp, start, bound):
+    b0 = rlp[start]
+    if b0 < 0x80:  # single byte
+        return rlp[start : start + 1], start + 1
+    elif b0 < 0xB8:  # short string
+        payload_start = start + 1
+        end = payload_start + b0 - 0x80
+    elif b0 < 0xC0:  # long string
+        payload_start = start + b0 - 0xB6
+        end = payload_start + int.from_bytes(rlp[start + 1 : payload_start], "big")
+    elif b0 < 0xF8:  # short list
+        payload_start = start + 1
+        end = payload_start + b0 - 0xC0
+    else:  # long list
+        payload_start = start + b0 - 0xF6
+        end = payload_start + int.from_bytes(rlp[start + 1 : payload_start], "big")
+
+    if end > bound:
+        raise DecodingError(
+            "Length prefix announced more bytes than available", rlp, offset=start
+        )
+    if b0 < 0xC0:
+        return rlp[payload_start:end], end
+
+    layout = fixed_width_layout(rlp, payload_start, end)
+    if layout is not None:
+        prefix_length, stride = layout
+        items = [
+            rlp[i + prefix_length : i + stride]
+            for i in range(payload_start, end, stride)
+        ]
+        return items, end
+    items = []
+    position = payload_start
+    while position < end:
+        item, position = _consume_item_trusted(rlp, position, end)
+        items.append(item)
+    return items, end
+
+
+def fixed_width_layout(rlp, start, end):
+    """
+    Check if all elements of an RLP list are strings of the same length.
+
+    In that case every element is encoded with the same prefix and their
+    boundaries are known in advance. This is validated by comparing the prefix
+    bytes at all those boundaries at once, rather than reading the prefixes one by
+    one.
+
+    :param rlp: the rlp string in which the list is encoded
+    :param start: the position of the first payload byte of the encoded list
+    :param end: the position after the last payload byte of the encoded list
+    :returns: a tuple ``(prefix_length, stride)`` with the length of the prefix of
+              each element and the length of each encoded element, or `None` if
+              the elements don't all have the same fixed width
+    """
+    # the end may come from an unchecked length prefix
+    if start >= end or end > len(rlp):
+        return None
+    prefix, type_, length, _ = consume_length_prefix(rlp, start)
+    # single bytes are encoded without a prefix, and whether a string of length one
+    # has one depends on its value
+    if type_ is not bytes or not prefix or length == 1:
+        return None
+    stride = len(prefix) + length
+    count, remainder = divmod(end - start, stride)
+    if remainder:
+        return None
+    for offset in range(len(prefix)):
+        column = bytes(rlp[start + offset : end : stride])
+        if column.count(prefix[offset]) != count:
+            return None
+    return (len(prefix), stride)
+
+
 def consume_item(rlp, start):
     """
     Read an item from an RLP string.
@@ -269,7 +591,81 @@ def consume_item(rlp, start):
     return consume_payload(rlp, p, s, t, l)
 
 
-def decode(rlp, sedes=None, strict=True, recursive_cache=False, **kwargs):
+def list_element_spans(rlp, path=(), strict=True):
+    """
+    Locate the elements of an RLP encoded list by reading length prefixes only.
+
+    The payloads are neither copied nor checked, only the prefixes on the way to
+    the list and the prefixes of its elements are read.
+
+    :param rlp: the rlp string in which the list is encoded
+    :param path: the indices leading to a nested list, or an empty tuple for the
+                 outermost one
+    :param strict: if false inputs that are longer than necessary don't cause an
+                   exception
+    :returns: a list of ``(start, end)`` tuples locating the full encoding,
+              including the prefix, of each element
+    :raises: :exc:`rlp.DecodingError` if the prefixes are invalid or the item at
+             `path` is not a list
+    :raises: :exc:`IndexError` if `path` is invalid
+    """
+    try:
+        _, type_, length, start = consume_length_prefix(rlp, 0)
+    except IndexError:
+        raise DecodingError("RLP string too short", rlp)
+    end = start + length
+    if end > len(rlp):
+        raise DecodingError("RLP string too short", rlp)
+    if strict and end != len(rlp):
+        msg = f"RLP string ends with {len(rlp) - end} superfluous bytes"
+        raise DecodingError(msg, rlp, offset=end)
+
+    for index in path:
+        if type_ is not list:
+            raise IndexError("Too many indices given")
+        spans = _element_spans(rlp, start, end)
+        item_start, _ = spans[index]
+        _, type_, length, start = consume_length_prefix(rlp, item_start)
+        end = start + length
+
+    if type_ is not list:
+        raise DecodingError("Expected a list, got a string", rlp, offset=start)
+    return _element_spans(rlp, start, end)
+
+
+def _element_spans(rlp, start, end):
+    layout = fixed_width_layout(rlp, start, end)
+    if layout is not None:
+        stride = layout[1]
+        return [(i, i + stride) for i in range(start, end, stride)]
+
+    spans = []
+    position = start
+    try:
+        while position < end:
+            _, _, length, payload_start = consume_length_prefix(rlp, position)
+            spans.append((position, payload_start + length))
+            position = payload_start + length
+    except IndexError:
+        raise DecodingError("RLP string too short", rlp, offset=position)
+    if position > end:
+        raise DecodingError(
+            "List length prefix announced a too small length", rlp, offset=start
+        )
+    return spans
+
+
+def decode(
+    rlp,
+    sedes=None,
+    strict=True,
+    recursive_cache=False,
+    intern_table=None,
+    limits=None,
+    fast_fail=False,
+    trusted=False,
+    **kwargs,
+):
     """
     Decode an RLP encoded object.
 
@@ -280,6 +676,9 @@ def decode(rlp, sedes=None, strict=True, recursive_cache=False, **kwargs):
     fields changes or prevent such changes entirely (:class:`rlp.sedes.Serializable`
     does the latter).
 
+    If a :class:`rlp.DecodingCache` is active, immutable results are taken from and
+    stored in it.
+
     :param sedes: an object implementing a function ``deserialize(code)`` which will be
                   applied after decoding, or ``None`` if no deserialization should be
                   performed
@@ -287,9 +686,23 @@ def decode(rlp, sedes=None, strict=True, recursive_cache=False, **kwargs):
                        deserializer
     :param strict: if false inputs that are longer than necessary don't cause an
                    exception
+    :param intern_table: an optional :class:`rlp.InternTable` used to share
+                         repeated strings between the decoded objects
+    :param limits: an optional :class:`rlp.DecodeLimits` object the input is
+                   checked against before it is decoded
+    :param fast_fail: if true, all decoding and deserialization errors are replaced
+                      by a :exc:`rlp.exceptions.FastFailError` without any
+                      details, which is cheaper when invalid input is simply
+                      dropped
+    :param trusted: if true, the input is assumed to be the canonical encoding of
+                    a valid object (e.g. because it has been validated before it
+                    has been stored), so length prefixes and serializations are not
+                    checked to be canonical and the built-in sedes skip their
+                    validation. Announced lengths are still checked against the
+                    input.
     :returns: the decoded and maybe deserialized Python object
     :raises: :exc:`rlp.DecodingError` if the input string does not end after the root
-             item and `strict` is true
+             item and `strict` is true, or if it exceeds `limits`
     :raises: :exc:`rlp.DeserializationError` if the deserialization fails
     """
     if not is_bytes(rlp):
@@ -297,13 +710,63 @@ def decode(rlp, sedes=None, strict=True, recursive_cache=False, **kwargs):
             "Can only decode RLP bytes, got type %s" % type(rlp).__name__, rlp
         )
 
-    item, per_item_rlp = decode_raw(rlp, strict, recursive_cache)
+    if fast_fail:
+        try:
+            return decode(
+                rlp,
+                sedes,
+                strict,
+                recursive_cache,
+                intern_table,
+                limits,
+                trusted=trusted,
+                **kwargs,
+            )
+        except (DecodingError, DeserializationError):
+            pass
+        # raised outside of the handler so that it doesn't keep the original error
+        # (and with it the input) alive
+        raise FastFailError() from None
+
+    if limits is not None:
+        limits.check(rlp)
+
+    decoding_cache = get_active_decoding_cache()
+    if (
+        decoding_cache is not None
+        and sedes
+        and not kwargs
+        # the cached results may differ from what these options produce
+        and not (trusted or recursive_cache or intern_table is not None)
+    ):
+        rlp = bytes(rlp)
+        obj = decoding_cache.get(rlp, sedes, strict)
+        if obj is None:
+            obj = _decode(
+                rlp, sedes, strict, recursive_cache, intern_table, trusted, kwargs
+            )
+            if isinstance(obj, _IMMUTABLE_TYPES):
+                decoding_cache.put(rlp, sedes, strict, obj)
+        return obj
+
+    return _decode(rlp, sedes, strict, recursive_cache, intern_table, trusted, kwargs)
+
+
+def _decode(rlp, sedes, strict, recursive_cache, intern_table, trusted, kwargs):
+    if trusted and not recursive_cache:
+        item, end = decode_raw_trusted(rlp, strict)
+        # without the superfluous bytes that are tolerated if not strict
+        per_item_rlp = [rlp[:end]]
+    else:
+        item, per_item_rlp = decode_raw(rlp, strict, recursive_cache)
+    if intern_table is not None:
+        item = intern_table.intern_item(item)
 
     if len(per_item_rlp) == 0:
         per_item_rlp = [rlp]
 
     if sedes:
-        obj = sedes.deserialize(item, **kwargs)
+        obj = get_deserializer(sedes, trusted)(item, **kwargs)
         if is_sequence(obj) or hasattr(obj, "_cached_rlp"):
             _apply_rlp_cache(obj, per_item_rlp, recursive_cache)
         return obj
@@ -311,6 +774,126 @@ def decode(rlp, sedes=None, strict=True, recursive_cache=False, **kwargs):
         return item
 
 
+def encode_columns(columns, sedes):
+    """
+    Encode a list of :class:`rlp.Serializable` objects given as columns.
+
+    The result is the same as encoding the list of objects built from the columns
+    with `sedes`, but the objects are never created.
+
+    :param columns: a mapping from each field name of the element class to a
+                    sequence of the values of that field
+    :param sedes: a :class:`rlp.sedes.CountableList` of a :class:`rlp.Serializable`
+                  class
+    :returns: the RLP encoded list
+    :raises: :exc:`rlp.SerializationError` if the serialization fails
+    """
+    return encode_raw(sedes.serialize_columns(columns))
+
+
+def decode_columns(rlp, sedes, strict=True):
+    """
+    Decode an RLP encoded list of :class:`rlp.Serializable` objects into columns.
+
+    Each field of each element is deserialized, but no objects of the element class
+    are created. This is considerably faster if only the field values are needed.
+
+    :param sedes: a :class:`rlp.sedes.CountableList` of a :class:`rlp.Serializable`
+                  class
+    :param strict: if false inputs that are longer than necessary don't cause an
+                   exception
+    :returns: a dictionary mapping each field name of the element class to a tuple
+              of the values of that field
+    :raises: :exc:`rlp.DecodingError` if the input is not valid RLP
+    :raises: :exc:`rlp.DeserializationError` if the deserialization fails
+    """
+    if not is_bytes(rlp):
+        raise DecodingError(
+            "Can only decode RLP bytes, got type %s" % type(rlp).__name__, rlp
+        )
+
+    item, _ = decode_raw(rlp, strict, False)
+    return sedes.deserialize_columns(item)
+
+
+def split_list(rlp, path=(), strict=True, spans=False):
+    """
+    Get the full encoding of each element of an RLP encoded list.
+
+    Only the length prefixes are read (see :func:`rlp.codec.list_element_spans`)
+    and the encodings are returned as memoryviews into `rlp`, so nothing is copied.
+    This is useful to relay, hash or store the elements without decoding them.
+
+    Usage example::
+
+        >>> import rlp
+        >>> encoded = rlp.encode([b"dog", [b"cat", b"cow"]])
+        >>> dog, cats = rlp.split_list(encoded)
+        >>> rlp.decode(bytes(dog)), rlp.decode(bytes(cats))
+        (b'dog', [b'cat', b'cow'])
+        >>> rlp.split_list(encoded, path=[1], spans=True)
+        [(6, 10), (10, 14)]
+
+    :param rlp: the rlp string in which the list is encoded
+    :param path: the indices leading to a nested list, or an empty tuple for the
+                 outermost one
+    :param strict: if false inputs that are longer than necessary don't cause an
+                   exception
+    :param spans: if true, ``(start, end)`` tuples locating the encodings in `rlp`
+                  are returned instead of memoryviews
+    :returns: a list of memoryviews or tuples, one per element
+    :raises: :exc:`rlp.DecodingError` if the prefixes are invalid or the item at
+             `path` is not a list
+    :raises: :exc:`IndexError` if `path` is invalid
+    """
+    element_spans = list_element_spans(rlp, path, strict)
+    if spans:
+        return element_spans
+    view = memoryview(rlp)
+    return [view[start:end] for start, end in element_spans]
+
+
+def element_hashes(rlp, path=(), strict=True, hash_function=keccak):
+    """
+    Hash the encoding of each element of an RLP encoded list without decoding it.
+
+    This gives e.g. the hashes of all transactions in a block body at the cost of
+    reading the length prefixes (see :func:`rlp.codec.list_element_spans`).
+    The elements themselves are not checked, so untrusted input should be
+    validated first (see :func:`rlp.validate`).
+
+    Usage example::
+
+        >>> import rlp
+        >>> from eth_utils import keccak
+        >>> body = rlp.encode([[b"tx1", b"tx2"], []])
+        >>> rlp.element_hashes(body, path=[0]) == [
+        ...     keccak(rlp.encode(b"tx1")),
+        ...     keccak(rlp.encode(b"tx2")),
+        ... ]
+        True
+
+    :param rlp: the rlp string in which the list is encoded
+    :param path: the indices leading to a nested list, or an empty tuple for the
+                 outermost one
+    :param strict: if false inputs that are longer than necessary don't cause an
+                   exception
+    :param hash_function: the function applied to each encoded element, keccak256
+                          by default
+    :returns: a list of the hashes
+    :raises: :exc:`rlp.DecodingError` if the prefixes are invalid or the item at
+             `path` is not a list
+    """
+    return [
+        hash_function(bytes(rlp[start:end]))
+        for start, end in list_element_spans(rlp, path, strict)
+    ]
+
+
+# results of these types can be shared between callers by the decoding cache
+_IMMUTABLE_TYPES = (Serializable, tuple, bytes, int)
+
+
 def _apply_rlp_cache(obj, split_rlp, recursive):
     item_rlp = split_rlp.pop(0)
     if isinstance(obj, (int, bool, str, bytes, bytearray)):
@@ -327,28 +910,91 @@ def _apply_rlp_cache(obj, split_rlp, recursive):
             _apply_rlp_cache(sub, sub_rlp, recursive)
 
 
+def _serialize_inferred(obj):
+    """
+    Serialize `obj` in the same way as the sedes inferred for it would.
+
+    Trees of bytes and non-negative integers (including lazy ones) are serialized
+    directly without building any sedes objects, other subtrees are left to
+    :func:`infer_sedes`.
+    """
+    obj_type = type(obj)
+    if obj_type is bytes or obj_type is bytearray:
+        return obj
+    elif obj_type is list or obj_type is tuple:
+        return [_serialize_inferred(element) for element in obj]
+    elif obj_type is int and obj >= 0:
+        return obj.to_bytes((obj.bit_length() + 7) // 8, "big")
+    elif obj_type is LazyInt:
+        return big_endian_int.serialize(obj)
+    else:
+        return _infer_shared_sedes(obj).serialize(obj)
+
+
 def infer_sedes(obj):
     """
     Try to find a sedes objects suitable for a given Python object.
 
-    The sedes objects considered are `obj`'s class, `big_endian_int` and
-    `binary`. If `obj` is a sequence, a :class:`rlp.sedes.List` will be
-    constructed recursively.
+    The sedes objects considered are `obj`'s class, `big_endian_int` (also for
+    :class:`rlp.sedes.LazyInt` objects) and `binary`. If `obj` is a sequence, a
+    :class:`rlp.sedes.CountableList` is inferred if a common sedes can be found
+    for all of its elements, otherwise a :class:`rlp.sedes.List` is constructed
+    recursively.
 
     :param obj: the python object for which to find a sedes object
     :raises: :exc:`TypeError` if no appropriate sedes could be found
     """
+    return _sedes_from_signature(_infer_signature(obj))
+
+
+def _infer_shared_sedes(obj):
+    """
+    Like :func:`infer_sedes`, but the sedes objects are cached and shared between
+    objects of the same structure, so they must not be modified or handed out.
+    """
+    return _shared_sedes_from_signature(_infer_signature(obj))
+
+
+def _infer_signature(obj):
+    """
+    Get a hashable description of the sedes that should be inferred for `obj`.
+
+    For non-sequences this is the sedes itself, for sequences it is a tuple
+    ``(CountableList, element_signature)`` if all elements share the same
+    signature or ``(List, element_signatures)`` otherwise.
+    """
     if is_sedes(obj.__class__):
         return obj.__class__
     elif not isinstance(obj, bool) and isinstance(obj, int) and obj >= 0:
         return big_endian_int
+    elif isinstance(obj, LazyInt):
+        return big_endian_int
     elif BinaryClass.is_valid_type(obj):
         return binary
     elif not isinstance(obj, str) and isinstance(obj, collections.abc.Sequence):
-        return List(map(infer_sedes, obj))
+        element_signatures = tuple(map(_infer_signature, obj))
+        if element_signatures and all(
+            signature == element_signatures[0] for signature in element_signatures
+        ):
+            return (CountableList, element_signatures[0])
+        else:
+            return (List, element_signatures)
     elif isinstance(obj, bool):
         return boolean
     elif isinstance(obj, str):
         return text
     msg = f"Did not find sedes handling type {type(obj).__name__}"
     raise TypeError(msg)
+
+
+def _sedes_from_signature(signature):
+    if not isinstance(signature, tuple):
+        return signature
+    kind, elements = signature
+    if kind is CountableList:
+        return CountableList(_sedes_from_signature(elements))
+    else:
+        return List(map(_sedes_from_signature, elements))
+
+
+_shared_sedes_from_signature = functools.lru_cache(maxsize=1024)(_sedes_from_signature)
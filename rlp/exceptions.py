@@ -2,6 +2,43 @@ class RLPException(Exception):
     """Base class for exceptions raised by this package."""
 
 
+class _LazyMessage:
+    """
+    An exception message that is only formatted when it is displayed.
+
+    Errors of nested lists wrap the errors of their elements, so formatting the
+    messages eagerly would repeatedly format the whole chain while the error
+    propagates, even if it is never displayed.
+    """
+
+    __slots__ = ("_format", "_args")
+
+    def __init__(self, format_, *args):
+        self._format = format_
+        self._args = args
+
+    def __str__(self):
+        return self._format(*self._args)
+
+    def __repr__(self):
+        return repr(str(self))
+
+
+def _format_element_message(action, index, element_exception):
+    return (
+        f"{action} failed because of element at index {index} "
+        f'("{str(element_exception)}")'
+    )
+
+
+def _format_field_message(action, field, element_exception):
+    return f'{action} failed because of field {field} ("{str(element_exception)}")'
+
+
+def _format_list_message(action, list_exception):
+    return f'{action} failed because of underlying list ("{str(list_exception)}")'
+
+
 class EncodingError(RLPException):
     """
     Exception raised if encoding fails.
@@ -19,11 +56,14 @@ class DecodingError(RLPException):
     Exception raised if decoding fails.
 
     :ivar rlp: the RLP string that could not be decoded
+    :ivar offset: the position in `rlp` at which decoding failed, or `None` if
+                  unknown
     """
 
-    def __init__(self, message, rlp):
+    def __init__(self, message, rlp, offset=None):
         super().__init__(message)
         self.rlp = rlp
+        self.offset = offset
 
 
 class SerializationError(RLPException):
@@ -31,8 +71,12 @@ class SerializationError(RLPException):
     Exception raised if serialization fails.
 
     :ivar obj: the object that could not be serialized
+    :ivar path: the indices leading from `obj` to the element that could not be
+                serialized
     """
 
+    path = ()
+
     def __init__(self, message, obj):
         super().__init__(message)
         self.obj = obj
@@ -53,14 +97,19 @@ class ListSerializationError(SerializationError):
         if message is None:
             assert index is not None
             assert element_exception is not None
-            message = (
-                f"Serialization failed because of element at index {index} "
-                f'("{str(element_exception)}")'
+            message = _LazyMessage(
+                _format_element_message, "Serialization", index, element_exception
             )
         super().__init__(message, obj)
         self.index = index
         self.element_exception = element_exception
 
+    @property
+    def path(self):
+        if self.index is None:
+            return ()
+        return (self.index,) + self.element_exception.path
+
 
 class ObjectSerializationError(SerializationError):
     """
@@ -78,16 +127,17 @@ class ObjectSerializationError(SerializationError):
             assert list_exception is not None
             if list_exception.element_exception is None:
                 field = None
-                message = (
-                    "Serialization failed because of underlying list "
-                    f'("{str(list_exception)}")'
+                message = _LazyMessage(
+                    _format_list_message, "Serialization", list_exception
                 )
             else:
                 assert sedes is not None
                 field = sedes._meta.field_names[list_exception.index]
-                message = (
-                    f"Serialization failed because of field {field} "
-                    f'("{str(list_exception.element_exception)}")'
+                message = _LazyMessage(
+                    _format_field_message,
+                    "Serialization",
+                    field,
+                    list_exception.element_exception,
                 )
         else:
             field = None
@@ -95,14 +145,24 @@ class ObjectSerializationError(SerializationError):
         self.field = field
         self.list_exception = list_exception
 
+    @property
+    def path(self):
+        if self.list_exception is None:
+            return ()
+        return self.list_exception.path
+
 
 class DeserializationError(RLPException):
     """
     Exception raised if deserialization fails.
 
     :ivar serial: the decoded RLP string that could not be deserialized
+    :ivar path: the indices leading from `serial` to the element that could not be
+                deserialized
     """
 
+    path = ()
+
     def __init__(self, message, serial):
         super().__init__(message)
         self.serial = serial
@@ -123,14 +183,19 @@ class ListDeserializationError(DeserializationError):
         if not message:
             assert index is not None
             assert element_exception is not None
-            message = (
-                f"Deserialization failed because of element at index {index} "
-                f'("{str(element_exception)}")'
+            message = _LazyMessage(
+                _format_element_message, "Deserialization", index, element_exception
             )
         super().__init__(message, serial)
         self.index = index
         self.element_exception = element_exception
 
+    @property
+    def path(self):
+        if self.index is None:
+            return ()
+        return (self.index,) + self.element_exception.path
+
 
 class ObjectDeserializationError(DeserializationError):
     """
@@ -148,18 +213,43 @@ class ObjectDeserializationError(DeserializationError):
             assert list_exception is not None
             if list_exception.element_exception is None:
                 field = None
-                message = (
-                    "Deserialization failed because of underlying list "
-                    f'("{str(list_exception)}")'
+                message = _LazyMessage(
+                    _format_list_message, "Deserialization", list_exception
                 )
             else:
                 assert sedes is not None
                 field = sedes._meta.field_names[list_exception.index]
-                message = (
-                    f"Deserialization failed because of field {field} "
-                    f'("{str(list_exception.element_exception)}")'
+                message = _LazyMessage(
+                    _format_field_message,
+                    "Deserialization",
+                    field,
+                    list_exception.element_exception,
                 )
         super().__init__(message, serial)
         self.sedes = sedes
         self.list_exception = list_exception
         self.field = field
+
+    @property
+    def path(self):
+        if self.list_exception is None:
+            return ()
+        return self.list_exception.path
+
+
+class FastFailError(DecodingError, DeserializationError):
+    """
+    Lightweight exception raised instead of any decoding or deserialization error
+    if :func:`rlp.decode` is called with ``fast_fail=True``.
+
+    It carries no information about the input, and its message and attributes
+    are the same for every instance, so creating one is cheap.
+    """
+
+    message = "Invalid input"
+    rlp = None
+    offset = None
+    serial = None
+
+    def __init__(self):
+        RLPException.__init__(self, self.message)
@@ -2,6 +2,7 @@ from collections.abc import (
     Iterable,
     Sequence,
 )
+import threading
 
 from .atomic import (
     Atomic,
@@ -9,13 +10,17 @@ from .atomic import (
 from .codec import (
     consume_length_prefix,
     consume_payload,
+    fixed_width_layout,
 )
 from .exceptions import (
     DecodingError,
 )
+from .limits import (
+    LimitTracker,
+)
 
 
-def decode_lazy(rlp, sedes=None, **sedes_kwargs):
+def decode_lazy(rlp, sedes=None, limits=None, **sedes_kwargs):
     """
     Decode an RLP encoded object in a lazy fashion.
 
@@ -34,14 +39,20 @@ def decode_lazy(rlp, sedes=None, **sedes_kwargs):
     :param sedes: an object implementing a method ``deserialize(code)`` which
                   is used as described above, or ``None`` if no
                   deserialization should be performed
+    :param limits: an optional :class:`rlp.DecodeLimits` object that the
+                   returned list enforces while it is being decoded
     :param `**sedes_kwargs`: additional keyword arguments that will be passed
                              to the deserializers
     :returns: either the already decoded and deserialized object (if encoded as
               a string) or an instance of :class:`rlp.LazyList`
     """
-    item, end = consume_item_lazy(rlp, 0)
+    if limits is None:
+        item, end = consume_item_lazy(rlp, 0)
+    else:
+        limits.check_size(rlp)
+        item, end = _consume_item_limited(rlp, 0, len(rlp), 1, LimitTracker(limits))
     if end != len(rlp):
-        raise DecodingError("RLP length prefix announced wrong length", rlp)
+        raise DecodingError("RLP length prefix announced wrong length", rlp, offset=end)
     if isinstance(item, LazyList):
         item.sedes = sedes
         item.sedes_kwargs = sedes_kwargs
@@ -74,6 +85,21 @@ def consume_item_lazy(rlp, start):
         return LazyList(rlp, s, s + l), s + l
 
 
+def _consume_item_limited(rlp, start, bound, depth, tracker):
+    try:
+        p, t, l, s = consume_length_prefix(rlp, start)
+    except IndexError:
+        raise DecodingError("RLP string too short", rlp)
+    tracker.check_item(rlp, t, l, s, bound, depth)
+    if t is bytes:
+        return rlp[s : s + l], s + l
+    else:
+        lazy_list = LazyList(rlp, s, s + l)
+        lazy_list._limit_tracker = tracker
+        lazy_list._depth = depth
+        return lazy_list, s + l
+
+
 class LazyList(Sequence):
     """
     A RLP encoded list which decodes itself when necessary.
@@ -82,6 +108,14 @@ class LazyList(Sequence):
     Getting the length with :func:`len` is possible as well but requires full
     horizontal encoding.
 
+    If all elements are strings of the same length, their positions are known
+    without decoding the preceding ones, so indexing and :func:`len` take
+    constant time (and negative indices are supported as well).
+
+    Lists can be shared between threads. Decoding further elements is serialized
+    by a lock, while elements that have been decoded already are read without
+    locking.
+
     :param rlp: the rlp string in which the list is encoded
     :param start: the position of the first payload byte of the encoded list
     :param end: the position of the last payload byte of the encoded list
@@ -98,22 +132,75 @@ class LazyList(Sequence):
         self.index = start
         self._elements = []
         self._len = None
+        self._layout = None
+        self._limit_tracker = None
+        self._depth = 1
+        # reentrant, as the layout is also needed while decoding the next element
+        self._lock = threading.RLock()
         self.sedes = sedes
         self.sedes_kwargs = sedes_kwargs
 
+    def _get_layout(self):
+        layout = self._layout
+        if layout is None:
+            with self._lock:
+                if self._layout is None:
+                    layout = fixed_width_layout(self.rlp, self.start, self.end) or ()
+                    if layout and self._limit_tracker is not None:
+                        self._limit_tracker.check_fixed_width(
+                            self.rlp, self.start, self.end
+                        )
+                    self._layout = layout
+                layout = self._layout
+        return layout
+
+    def _get_fixed_width_element(self, i, prefix_length, stride):
+        count = (self.end - self.start) // stride
+        if i < 0:
+            i += count
+        if not 0 <= i < count:
+            raise IndexError("Index %s out of range" % i)
+        item_start = self.start + i * stride
+        item = self.rlp[item_start + prefix_length : item_start + stride]
+        if self.sedes:
+            item = self.sedes.deserialize(item, **self.sedes_kwargs)
+        return item
+
     def next(self):
+        with self._lock:
+            return self._next()
+
+    def _next(self):
+        # must only be called with the lock held
         if self.index == self.end:
             self._len = len(self._elements)
             raise StopIteration
         assert self.index < self.end
-        item, end = consume_item_lazy(self.rlp, self.index)
-        self.index = end
+        if self._limit_tracker is None or self._get_layout():
+            item, end = consume_item_lazy(self.rlp, self.index)
+        else:
+            item, end = _consume_item_limited(
+                self.rlp, self.index, self.end, self._depth + 1, self._limit_tracker
+            )
         if self.sedes:
             item = self.sedes.deserialize(item, **self.sedes_kwargs)
+        # the element is published only once it is complete, so that readers don't
+        # need the lock
+        self.index = end
         self._elements.append(item)
         return item
 
     def __getitem__(self, i):
+        layout = self._get_layout()
+        if layout:
+            if isinstance(i, slice):
+                if i.step is not None:
+                    raise TypeError("Step not supported")
+                indices = range(*i.indices(len(self)))
+                return [self._get_fixed_width_element(j, *layout) for j in indices]
+            else:
+                return self._get_fixed_width_element(i, *layout)
+
         if isinstance(i, slice):
             if i.step is not None:
                 raise TypeError("Step not supported")
@@ -126,12 +213,14 @@ class LazyList(Sequence):
         if stop is None:
             stop = self.end - 1
 
-        try:
-            while len(self._elements) < stop:
-                self.next()
-        except StopIteration:
-            assert self.index == self.end
-            raise IndexError("Index %s out of range" % i)
+        if len(self._elements) < stop:
+            with self._lock:
+                try:
+                    while len(self._elements) < stop:
+                        self._next()
+                except StopIteration:
+                    assert self.index == self.end
+                    raise IndexError("Index %s out of range" % i)
 
         if isinstance(i, slice):
             return self._elements[start:stop]
@@ -139,13 +228,18 @@ class LazyList(Sequence):
             return self._elements[start]
 
     def __len__(self):
-        if not self._len:
-            try:
-                while True:
-                    self.next()
-            except StopIteration:
-                self._len = len(self._elements)
-        return self._len
+        layout = self._get_layout()
+        if layout:
+            return (self.end - self.start) // layout[1]
+        length = self._len
+        if length is None:
+            with self._lock:
+                try:
+                    while True:
+                        self._next()
+                except StopIteration:
+                    length = self._len
+        return length
 
 
 def peek(rlp, index, sedes=None):
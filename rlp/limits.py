@@ -0,0 +1,175 @@
+"""
+Limits that protect decoding of untrusted input from wasting time and memory.
+"""
+from rlp.codec import (
+    consume_length_prefix,
+    fixed_width_layout,
+)
+from rlp.exceptions import (
+    DecodingError,
+)
+
+
+class DecodeLimits:
+    """
+    Resource limits for decoding RLP strings from untrusted sources.
+
+    They can be passed to :func:`rlp.decode` and :func:`rlp.decode_lazy`. The
+    former checks the whole input against the limits before decoding anything,
+    the latter checks each item as the returned :class:`rlp.LazyList` reaches it,
+    which also covers the sedes deserializing it. In both cases, the length
+    announced by each prefix is checked against the rest of the enclosing item
+    before the payload is read.
+
+    Usage example::
+
+        >>> import rlp
+        >>> limits = rlp.DecodeLimits(max_depth=2)
+        >>> rlp.decode(rlp.encode([[b"a"]]), limits=limits)
+        [[b'a']]
+        >>> rlp.decode(rlp.encode([[[b"a"]]]), limits=limits)
+        Traceback (most recent call last):
+        ...
+        rlp.exceptions.DecodingError: Nesting too deep (more than 2 levels of lists)
+
+    :param max_bytes: maximum length of the input in bytes
+    :param max_items: maximum total number of strings and lists
+    :param max_depth: maximum number of nested lists
+    :param max_length: maximum payload length of a single string or list in bytes
+    """
+
+    def __init__(self, max_bytes=None, max_items=None, max_depth=None, max_length=None):
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.max_length = max_length
+
+    def check(self, rlp):
+        """
+        Check that an RLP string can be decoded within the limits.
+
+        Only the structure of the root item is inspected, nothing is decoded.
+
+        :raises: :exc:`rlp.DecodingError` if a limit is exceeded or a length
+                 prefix announces more bytes than available
+        """
+        self.check_size(rlp)
+        tracker = LimitTracker(self)
+        try:
+            prefix, type_, length, start = consume_length_prefix(rlp, 0)
+            tracker.check_item(rlp, type_, length, start, len(rlp), 1)
+            if type_ is bytes:
+                return
+            if tracker.check_fixed_width(rlp, start, start + length):
+                return
+            # the ends of the lists that contain the current position
+            ends = [start + length]
+            position = start
+            while ends:
+                end = ends[-1]
+                if position == end:
+                    ends.pop()
+                    continue
+                prefix, type_, length, start = consume_length_prefix(rlp, position)
+                tracker.check_item(rlp, type_, length, start, end, len(ends) + 1)
+                if type_ is list and not tracker.check_fixed_width(
+                    rlp, start, start + length
+                ):
+                    ends.append(start + length)
+                    position = start
+                else:
+                    position = start + length
+        except IndexError:
+            raise DecodingError("RLP string too short", rlp)
+
+    def check_size(self, rlp):
+        """
+        Check the length of the whole input.
+
+        :raises: :exc:`rlp.DecodingError` if the input is too long
+        """
+        if self.max_bytes is not None and len(rlp) > self.max_bytes:
+            raise DecodingError(
+                f"Input too long ({len(rlp)} bytes, allowed {self.max_bytes})", rlp
+            )
+
+
+class LimitTracker:
+    """
+    Keeps track of the resources used while decoding a single input.
+
+    :param limits: the :class:`DecodeLimits` to enforce
+    :ivar items: number of items seen so far
+    """
+
+    def __init__(self, limits):
+        self.limits = limits
+        self.items = 0
+
+    def check_item(self, rlp, type_, length, start, bound, depth):
+        """
+        Account for an item whose length prefix has been read.
+
+        :param type_: the type of the item (``bytes`` or ``list``)
+        :param length: the announced payload length
+        :param start: the position of the first payload byte
+        :param bound: the position after the last byte of the enclosing item
+        :param depth: the nesting depth of the item if it is a list (``1`` for the
+                      outermost one)
+        :raises: :exc:`rlp.DecodingError` if a limit is exceeded
+        """
+        limits = self.limits
+        if start + length > bound:
+            raise DecodingError(
+                f"Length prefix announced {length} bytes, but only "
+                f"{max(bound - start, 0)} are left",
+                rlp,
+                offset=start,
+            )
+        if limits.max_length is not None and length > limits.max_length:
+            raise DecodingError(
+                f"Item too long ({length} bytes, allowed {limits.max_length})",
+                rlp,
+                offset=start,
+            )
+        if type_ is list and limits.max_depth is not None and depth > limits.max_depth:
+            raise DecodingError(
+                f"Nesting too deep (more than {limits.max_depth} levels of lists)",
+                rlp,
+                offset=start,
+            )
+        self.add_items(rlp, 1)
+
+    def check_fixed_width(self, rlp, start, end):
+        """
+        Account for all elements of a list at once if they are strings of the same
+        length.
+
+        :returns: `True` if the elements have been accounted for, `False` if they
+                  have to be checked one by one
+        """
+        layout = fixed_width_layout(rlp, start, end)
+        if layout is None:
+            return False
+        prefix_length, stride = layout
+        max_length = self.limits.max_length
+        if max_length is not None and stride - prefix_length > max_length:
+            raise DecodingError(
+                f"Item too long ({stride - prefix_length} bytes, allowed "
+                f"{max_length})",
+                rlp,
+                offset=start,
+            )
+        self.add_items(rlp, (end - start) // stride)
+        return True
+
+    def add_items(self, rlp, count):
+        """
+        Account for `count` items.
+
+        :raises: :exc:`rlp.DecodingError` if there are too many items
+        """
+        self.items += count
+        max_items = self.limits.max_items
+        if max_items is not None and self.items > max_items:
+            raise DecodingError(f"Too many items (more than {max_items})", rlp)
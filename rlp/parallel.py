@@ -0,0 +1,364 @@
+"""
+Decoding and encoding of large batches using multiple processes.
+"""
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+import io
+from itertools import (
+    accumulate,
+)
+from multiprocessing import (
+    shared_memory,
+)
+import os
+import pickle
+
+from rlp.codec import (
+    decode,
+    encode,
+    length_prefix,
+)
+from rlp.exceptions import (
+    DecodingError,
+    DeserializationError,
+    EncodingError,
+    RLPException,
+)
+from rlp.sedes import (
+    CountableList,
+    Serializable,
+)
+
+# number of chunks per worker, so that workers finishing early can take over work
+CHUNKS_PER_WORKER = 4
+
+
+def decode_many(
+    buffers_or_spans,
+    sedes=None,
+    workers=None,
+    buffer=None,
+    strict=True,
+    columns=False,
+    executor=None,
+):
+    """
+    Decode many RLP strings in parallel.
+
+    The input is copied into a :mod:`multiprocessing.shared_memory` block once,
+    the items are split into consecutive chunks which are decoded by a pool of
+    processes, and the results are sent back in order. Each item is decoded like
+    :func:`rlp.decode` would. :class:`rlp.Serializable` objects are sent back as
+    their RLP encoding (see :meth:`rlp.Serializable.__reduce__`), so the main
+    process has to build them again. Use `columns` to avoid this.
+
+    An invalid item doesn't abort the batch. Instead, its result is the
+    :exc:`rlp.DecodingError` or :exc:`rlp.DeserializationError` explaining why
+    it couldn't be decoded.
+
+    Usage example::
+
+        >>> import rlp
+        >>> from rlp.sedes import big_endian_int
+        >>> encoded = [rlp.encode(i) for i in range(3)] + [rlp.encode([1])[:1]]
+        >>> rlp.decode_many(encoded, big_endian_int, workers=1)
+        [0, 1, 2, DecodingError('RLP string too short')]
+
+    :param buffers_or_spans: a sequence of RLP strings, or if `buffer` is given, of
+                             ``(start, end)`` tuples locating them in `buffer`
+    :param sedes: the sedes to deserialize each item with, or `None`
+    :param workers: the number of processes to use, by default one per CPU. If
+                    ``1``, everything is decoded in the current process.
+    :param buffer: an optional bytes-like object containing all items
+    :param strict: if false items that are longer than necessary don't cause an
+                   error
+    :param columns: if true, `sedes` must be a :class:`rlp.Serializable` class and
+                    the result is a dictionary mapping each field name to a tuple
+                    of the values of all items, without building the objects
+                    (rows of invalid items contain the error in every column)
+    :param executor: an optional :class:`concurrent.futures.ProcessPoolExecutor`
+                     to use instead of starting a new one
+    :returns: a list of the decoded objects or errors, or a dictionary of columns
+    """
+    if buffer is None:
+        buffers = list(buffers_or_spans)
+        ends = list(accumulate(map(len, buffers)))
+        spans = list(zip([0] + ends[:-1], ends))
+        data = b"".join(buffers)
+    else:
+        spans = [tuple(span) for span in buffers_or_spans]
+        data = buffer
+    if columns:
+        field_names = sedes._meta.field_names
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if (workers <= 1 and executor is None) or not spans:
+        results = _decode_spans(memoryview(data), spans, sedes, strict, columns)
+    else:
+        results = _decode_in_processes(
+            data, spans, sedes, strict, columns, workers, executor
+        )
+
+    for index, result in enumerate(results):
+        if isinstance(result, _Failure):
+            start, end = spans[index]
+            results[index] = result.to_exception(bytes(data[start:end]))
+
+    if columns:
+        return {
+            name: tuple(
+                result if isinstance(result, RLPException) else result[field_index]
+                for result in results
+            )
+            for field_index, name in enumerate(field_names)
+        }
+    else:
+        return results
+
+
+def _decode_in_processes(data, spans, sedes, strict, columns, workers, executor):
+    chunk_count = min(len(spans), workers * CHUNKS_PER_WORKER)
+    chunk_size = -(-len(spans) // chunk_count)
+    chunks = [spans[i : i + chunk_size] for i in range(0, len(spans), chunk_size)]
+
+    memory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    try:
+        memory.buf[: len(data)] = data
+        if executor is None:
+            with ProcessPoolExecutor(workers) as own_executor:
+                chunk_results = _map_chunks(
+                    own_executor, memory.name, chunks, sedes, strict, columns
+                )
+        else:
+            chunk_results = _map_chunks(
+                executor, memory.name, chunks, sedes, strict, columns
+            )
+    finally:
+        memory.close()
+        memory.unlink()
+    return [result for chunk_result in chunk_results for result in chunk_result]
+
+
+def _map_chunks(executor, name, chunks, sedes, strict, columns):
+    futures = [
+        executor.submit(_decode_shared_chunk, name, chunk, sedes, strict, columns)
+        for chunk in chunks
+    ]
+    return [future.result() for future in futures]
+
+
+def _decode_shared_chunk(name, spans, sedes, strict, columns):
+    # the block stays registered with the resource tracker shared with the calling
+    # process, which removes it once all chunks have been decoded
+    memory = shared_memory.SharedMemory(name)
+    try:
+        return _decode_spans(memory.buf, spans, sedes, strict, columns)
+    finally:
+        memory.close()
+
+
+def _decode_spans(buf, spans, sedes, strict, columns):
+    """
+    Decode the items at `spans` in `buf`.
+
+    :returns: a list of the results, or of tuples of field values if `columns` is
+              true, with :class:`_Failure` objects for the invalid items
+    """
+    results = []
+    for start, end in spans:
+        try:
+            if columns:
+                item = decode(bytes(buf[start:end]), strict=strict)
+                try:
+                    results.append(sedes._meta.sedes.deserialize(item))
+                except DeserializationError as e:
+                    raise DeserializationError(
+                        f"Deserialization as {sedes.__name__} failed ({e})", item
+                    )
+            else:
+                results.append(decode(bytes(buf[start:end]), sedes, strict=strict))
+        except (DecodingError, DeserializationError) as e:
+            results.append(_Failure(isinstance(e, DecodingError), str(e)))
+    return results
+
+
+class _Failure:
+    """
+    The picklable description of an error, which is turned into an exception once
+    it has been sent to the calling process.
+    """
+
+    __slots__ = ("decoding", "message")
+
+    def __init__(self, decoding, message):
+        self.decoding = decoding
+        self.message = message
+
+    def __getstate__(self):
+        return (self.decoding, self.message)
+
+    def __setstate__(self, state):
+        self.decoding, self.message = state
+
+    def to_exception(self, rlp):
+        if self.decoding:
+            return DecodingError(self.message, rlp)
+        else:
+            return DeserializationError(self.message, rlp)
+
+
+def encode_parallel(obj, sedes=None, workers=None, executor=None):
+    """
+    Encode a long list by encoding chunks of its elements in parallel.
+
+    The elements are split into consecutive chunks which are encoded by a pool of
+    processes. The encoded chunks are concatenated and prefixed in the calling
+    process, so the result is identical to the one of :func:`rlp.encode`.
+    :class:`rlp.Serializable` elements are sent to the workers as their field
+    values, not as their encoding (see :meth:`rlp.Serializable.__reduce__`), so
+    that the encoding actually happens in the workers. Only elements that have
+    cached their encoding already are sent as that.
+
+    Only lists and tuples without `sedes` and sequences with a
+    :class:`rlp.sedes.CountableList` as `sedes` are encoded in parallel, any other
+    object is passed on to :func:`rlp.encode`.
+
+    Usage example::
+
+        >>> import rlp
+        >>> from rlp.sedes import CountableList, big_endian_int
+        >>> values, sedes = range(1000), CountableList(big_endian_int)
+        >>> rlp.encode_parallel(values, sedes, workers=2) == rlp.encode(values, sedes)
+        True
+
+    :param obj: the list to encode
+    :param sedes: a :class:`rlp.sedes.CountableList`, or `None` to infer the sedes
+                  of each element
+    :param workers: the number of processes to use, by default one per CPU. If
+                    ``1``, everything is encoded in the current process.
+    :param executor: an optional executor to use instead of starting a new
+                     process pool. With a :class:`concurrent.futures.ThreadPoolExecutor`
+                     the elements are passed to the workers as they are, which
+                     only pays off if the interpreter runs threads in parallel.
+    :returns: the RLP encoded item
+    :raises: :exc:`rlp.SerializationError` if the serialization fails
+    """
+    if sedes is None and type(obj) in (list, tuple):
+        element_sedes = None
+    elif (
+        isinstance(sedes, CountableList)
+        and not isinstance(obj, (str, bytes, bytearray))
+        and (sedes.max_length is None or len(obj) <= sedes.max_length)
+    ):
+        element_sedes = sedes.element_sedes
+    else:
+        return encode(obj, sedes)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if (workers <= 1 and executor is None) or not obj:
+        return encode(obj, sedes)
+
+    elements = list(obj)
+    chunk_count = min(len(elements), workers * CHUNKS_PER_WORKER)
+    chunk_size = -(-len(elements) // chunk_count)
+    chunks = [elements[i : i + chunk_size] for i in range(0, len(elements), chunk_size)]
+    if executor is None:
+        with ProcessPoolExecutor(workers) as own_executor:
+            encoded_chunks = _map_encode_chunks(own_executor, chunks, element_sedes)
+    else:
+        encoded_chunks = _map_encode_chunks(executor, chunks, element_sedes)
+
+    if None in encoded_chunks:
+        # repeat serially to raise an error with the usual context
+        return encode(obj, sedes)
+    payload = b"".join(encoded_chunks)
+    try:
+        return length_prefix(len(payload), 0xC0) + payload
+    except ValueError:
+        raise EncodingError("Item too big to encode", obj)
+
+
+def _map_encode_chunks(executor, chunks, element_sedes):
+    if isinstance(executor, ProcessPoolExecutor):
+        futures = [
+            executor.submit(
+                _encode_pickled_chunk,
+                _dump_fields(_with_cached_encodings(chunk, element_sedes)),
+                element_sedes,
+            )
+            for chunk in chunks
+        ]
+    else:
+        futures = [
+            executor.submit(_encode_chunk, chunk, element_sedes) for chunk in chunks
+        ]
+    return [future.result() for future in futures]
+
+
+class _Encoded(bytes):
+    """The encoding of an element, sent to a worker instead of the element."""
+
+
+def _with_cached_encodings(elements, element_sedes):
+    """Replace the elements that have cached their encoding by that encoding."""
+    return [
+        _Encoded(element._cached_rlp)
+        if isinstance(element, Serializable)
+        and element._cached_rlp
+        and (element_sedes is None or element_sedes is type(element))
+        else element
+        for element in elements
+    ]
+
+
+def _encode_pickled_chunk(data, element_sedes):
+    return _encode_chunk(pickle.loads(data), element_sedes)
+
+
+def _encode_chunk(elements, element_sedes):
+    """
+    Encode and concatenate `elements`.
+
+    :returns: the concatenated encodings, or `None` if an element can't be encoded
+    """
+    try:
+        return b"".join(
+            [
+                element
+                if type(element) is _Encoded
+                else encode(element, element_sedes, cache=False)
+                for element in elements
+            ]
+        )
+    except RLPException:
+        # custom exceptions can't be pickled, so the caller raises it again
+        return None
+
+
+class _FieldPickler(pickle.Pickler):
+    """
+    Pickles :class:`rlp.Serializable` objects as their field values instead of
+    their encoding.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, Serializable):
+            return (_rebuild_serializable, (type(obj), tuple(obj)))
+        return NotImplemented
+
+
+def _dump_fields(obj):
+    file = io.BytesIO()
+    _FieldPickler(file, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return file.getvalue()
+
+
+def _rebuild_serializable(cls, values):
+    # the values have been taken from a valid object, so they aren't checked again
+    obj = cls.__new__(cls)
+    for value, attr in zip(values, cls._meta.field_attrs):
+        setattr(obj, attr, value)
+    return obj
@@ -0,0 +1,211 @@
+"""
+Staged processing of streams of RLP encoded items.
+"""
+import collections
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import functools
+import time
+
+from rlp.codec import (
+    decode,
+)
+
+
+class StageStats:
+    """
+    Throughput counters of a pipeline stage.
+
+    :ivar name: the name of the stage
+    :ivar items: number of items that have passed the stage
+    :ivar busy_time: total time spent in the stage's function in seconds, summed up
+                     over all workers
+    :ivar wall_time: time from the first item entering the stage until the last
+                     one leaving it in seconds
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy_time = 0.0
+        self.wall_time = 0.0
+
+    @property
+    def rate(self):
+        """The number of items that have passed the stage per second."""
+        return self.items / self.wall_time if self.wall_time else 0.0
+
+    def __repr__(self):
+        return (
+            f"StageStats({self.name!r}, items={self.items}, "
+            f"busy_time={self.busy_time:.3f}, rate={self.rate:.1f}/s)"
+        )
+
+
+class _Stage:
+    def __init__(self, function, name, workers, queue_size, executor):
+        self.function = function
+        self.workers = workers
+        self.queue_size = queue_size
+        self.executor = executor
+        self.stats = StageStats(name)
+
+
+class Pipeline:
+    """
+    A chain of processing stages that items flow through one after another.
+
+    Each stage applies a function to every item it receives and passes the result
+    on to the next stage. A stage with more than one worker (or an executor of its
+    own) processes several items at the same time, while the items leave it in the
+    order they came in. At most `queue_size` items are in flight in each stage, so
+    a slow stage holds back the earlier ones instead of letting items pile up in
+    memory.
+
+    Nothing happens until the pipeline is iterated over or :meth:`run` is called.
+
+    Usage example::
+
+        >>> import rlp
+        >>> from rlp.sedes import big_endian_int
+        >>> source = [rlp.encode(i) for i in range(100)]
+        >>> pipeline = (
+        ...     rlp.Pipeline(source)
+        ...     .decode(big_endian_int, workers=2)
+        ...     .stage(lambda i: i * i, name="square")
+        ... )
+        >>> sum(pipeline)
+        328350
+        >>> pipeline.stats["square"].items
+        100
+
+    :param source: an iterable of the items to feed into the first stage, e.g.
+                   RLP strings
+    :ivar stats: a dictionary mapping the name of each stage to its
+                 :class:`StageStats`
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._stages = []
+        self.stats = {}
+
+    def stage(self, function, name=None, workers=1, queue_size=None, executor=None):
+        """
+        Add a stage at the end of the pipeline.
+
+        :param function: the function applied to each item
+        :param name: the name of the stage in :attr:`stats`, by default the name
+                     of the function (with the position of the stage appended if
+                     the name is taken already)
+        :param workers: the number of threads processing items in parallel. If
+                        ``1``, the stage runs in the thread iterating over the
+                        pipeline.
+        :param queue_size: the maximum number of items in flight in the stage, by
+                           default four per worker
+        :param executor: an optional :class:`concurrent.futures.Executor` to use
+                         instead of a pool of `workers` threads, e.g. a
+                         :class:`concurrent.futures.ProcessPoolExecutor` (in which
+                         case `function` has to be picklable)
+        :returns: the pipeline itself, so that calls can be chained
+        """
+        if name is None:
+            name = getattr(function, "__name__", "stage")
+            if name in self.stats:
+                name = f"{name}-{len(self._stages)}"
+        elif name in self.stats:
+            raise ValueError(f"Duplicate stage name {name!r}")
+        if queue_size is None:
+            queue_size = 4 * workers
+        stage = _Stage(function, name, workers, queue_size, executor)
+        self._stages.append(stage)
+        self.stats[name] = stage.stats
+        return self
+
+    def decode(self, sedes=None, name="decode", **kwargs):
+        """
+        Add a stage decoding each item with :func:`rlp.decode`.
+
+        :param sedes: the sedes to deserialize each item with, or `None`
+        :param `**kwargs`: the arguments of :meth:`stage` and further keyword
+                           arguments passed to :func:`rlp.decode`
+        :returns: the pipeline itself, so that calls can be chained
+        """
+        stage_kwargs = {
+            key: kwargs.pop(key)
+            for key in ("workers", "queue_size", "executor")
+            if key in kwargs
+        }
+        function = functools.partial(decode, sedes=sedes, **kwargs)
+        return self.stage(function, name=name, **stage_kwargs)
+
+    def __iter__(self):
+        items = iter(self.source)
+        for stage in self._stages:
+            items = _run_stage(stage, items)
+        return items
+
+    def run(self, sink=None):
+        """
+        Push all items through the pipeline.
+
+        :param sink: an optional function called with each item leaving the last
+                     stage, e.g. to write it to storage
+        :returns: the number of items that left the last stage
+        """
+        count = 0
+        for item in self:
+            if sink is not None:
+                sink(item)
+            count += 1
+        return count
+
+
+def _timed_call(function, item):
+    start = time.perf_counter()
+    result = function(item)
+    return result, time.perf_counter() - start
+
+
+def _run_stage(stage, items):
+    stats = stage.stats
+    started = None
+    if stage.executor is None and stage.workers <= 1:
+        for item in items:
+            if started is None:
+                started = time.perf_counter()
+            result, busy_time = _timed_call(stage.function, item)
+            stats.items += 1
+            stats.busy_time += busy_time
+            stats.wall_time = time.perf_counter() - started
+            yield result
+        return
+
+    if stage.executor is None:
+        executor = ThreadPoolExecutor(stage.workers)
+    else:
+        executor = stage.executor
+    pending = collections.deque()
+    try:
+        items = iter(items)
+        while True:
+            # keep the stage busy until it holds `queue_size` items
+            for item in items:
+                if started is None:
+                    started = time.perf_counter()
+                pending.append(executor.submit(_timed_call, stage.function, item))
+                if len(pending) >= stage.queue_size:
+                    break
+            if not pending:
+                return
+            result, busy_time = pending.popleft().result()
+            stats.items += 1
+            stats.busy_time += busy_time
+            stats.wall_time = time.perf_counter() - started
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        if stage.executor is None:
+            executor.shutdown()
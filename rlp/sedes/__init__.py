@@ -3,6 +3,7 @@ from . import (
 )
 from .big_endian_int import (
     BigEndianInt,
+    LazyInt,
     big_endian_int,
 )
 from .binary import (
@@ -0,0 +1,289 @@
+"""
+Sedes objects for homogeneous lists that (de)serialize from and to NumPy arrays.
+
+Compared to :class:`rlp.sedes.CountableList`, whole lists are converted with a
+handful of vectorized operations instead of creating one Python object per element.
+The fastest way to use them is :meth:`decode` and :meth:`encode` which work
+directly on RLP strings, but they are also regular sedes objects that can for
+instance be used as field of a :class:`rlp.Serializable`. When deserializing the
+:class:`rlp.LazyList` s returned by :func:`rlp.decode_lazy`, the elements are read
+straight from the underlying buffer as well.
+
+This module requires NumPy (``pip install rlp[numpy]``).
+"""
+from collections.abc import (
+    Sequence,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(
+        "rlp.sedes.arrays requires numpy, install it with `pip install rlp[numpy]`"
+    )
+
+from rlp.atomic import (
+    Atomic,
+)
+from rlp.codec import (
+    consume_length_prefix,
+    length_prefix,
+)
+from rlp.exceptions import (
+    DecodingError,
+    DeserializationError,
+    SerializationError,
+)
+from rlp.lazy import (
+    LazyList,
+)
+
+
+class _ArraySedes:
+    def __init__(self, max_length=None):
+        self.max_length = max_length
+
+    def serialize(self, obj):
+        array = self._to_array(obj, SerializationError)
+        return self._split_elements(array)
+
+    def deserialize(self, serial):
+        if isinstance(serial, LazyList) and serial.sedes is None:
+            buf = np.frombuffer(
+                serial.rlp, np.uint8, serial.end - serial.start, serial.start
+            )
+            return self._from_payload(buf, serial)
+        elif isinstance(serial, Sequence) and not isinstance(serial, (str, Atomic)):
+            if not all(isinstance(element, Atomic) for element in serial):
+                raise DeserializationError(
+                    "Can only deserialize lists of strings", serial
+                )
+            self._check_count(len(serial), serial, DeserializationError)
+            lengths = np.fromiter(map(len, serial), np.intp, len(serial))
+            starts = np.cumsum(lengths) - lengths
+            buf = np.frombuffer(b"".join(serial), np.uint8)
+            return self._from_elements(buf, starts, lengths, serial)
+        else:
+            raise DeserializationError("Can only deserialize sequences", serial)
+
+    def encode(self, obj):
+        """
+        RLP encode an array with the same result as :func:`rlp.encode` would give.
+        """
+        array = self._to_array(obj, SerializationError)
+        payload = self._encode_elements(array).tobytes()
+        return length_prefix(len(payload), 0xC0) + payload
+
+    def decode(self, rlp):
+        """
+        Decode an RLP encoded list straight into an array.
+
+        :raises: :exc:`rlp.DecodingError` if `rlp` is not a single encoded list of
+                 strings
+        :raises: :exc:`rlp.DeserializationError` if the elements don't fit the array
+        """
+        try:
+            _, type_, length, start = consume_length_prefix(rlp, 0)
+        except IndexError:
+            raise DecodingError("RLP string too short", rlp)
+        if type_ is not list:
+            raise DeserializationError("Can only deserialize lists", rlp)
+        if start + length != len(rlp):
+            raise DecodingError("RLP length prefix announced wrong length", rlp)
+        return self._from_payload(np.frombuffer(rlp, np.uint8, length, start), rlp)
+
+    def _check_count(self, count, obj, exception_class):
+        if self.max_length is not None and count > self.max_length:
+            raise exception_class(
+                f"Too many elements ({count}, allowed {self.max_length})", obj
+            )
+
+    def _from_payload(self, buf, serial):
+        starts, lengths = _scan_short_strings(buf, serial)
+        self._check_count(len(starts), serial, DeserializationError)
+        return self._from_elements(buf, starts, lengths, serial)
+
+
+class IntArray(_ArraySedes):
+    """
+    A sedes for lists of big endian integers, deserialized to ``uint64`` arrays.
+
+    Serializes the same as ``CountableList(big_endian_int)``, but only for integers
+    that fit into 64 bits.
+
+    :param max_length: maximum number of allowed elements, or `None` for no limit
+    """
+
+    def _to_array(self, obj, exception_class):
+        array = np.asarray(obj)
+        if array.ndim != 1 or not (array.size == 0 or array.dtype.kind in "iu"):
+            raise exception_class("Can only serialize 1-d integer arrays", obj)
+        if array.dtype.kind == "i" and (array < 0).any():
+            raise exception_class("Cannot serialize negative integers", obj)
+        self._check_count(len(array), obj, exception_class)
+        return array.astype(np.uint64)
+
+    def _split_elements(self, array):
+        return [
+            int(value).to_bytes((int(value).bit_length() + 7) // 8, "big")
+            for value in array
+        ]
+
+    def _from_elements(self, buf, starts, lengths, serial):
+        if (lengths > 8).any():
+            raise DeserializationError(
+                "Integer too large (does not fit in 64 bits)", serial
+            )
+        first_bytes = buf[np.minimum(starts, len(buf) - 1)] if len(buf) else lengths
+        if ((lengths > 0) & (first_bytes == 0)).any():
+            raise DeserializationError(
+                "Invalid serialization (not minimal length)", serial
+            )
+        padded = _gather_right_aligned(buf, starts, lengths, 8)
+        return padded.view(">u8").reshape(len(starts)).astype(np.uint64)
+
+    def _encode_elements(self, array):
+        big_endian = array.astype(">u8").view(np.uint8).reshape(len(array), 8)
+        lengths = sum((array >= 256**k).astype(np.intp) for k in range(8))
+        single = (array > 0) & (array < 0x80)
+        widths = np.where(single, 1, lengths + 1)
+        offsets = np.cumsum(widths) - widths
+
+        out = np.empty(int(widths.sum()), np.uint8)
+        out[offsets] = np.where(
+            single, array.astype(np.uint8), (0x80 + lengths).astype(np.uint8)
+        )
+        for column in range(8):
+            mask = ~single & (column >= 8 - lengths)
+            positions = offsets + 1 + column - (8 - lengths)
+            out[positions[mask]] = big_endian[mask, column]
+        return out
+
+
+class BytesArray(_ArraySedes):
+    """
+    A sedes for lists of fixed length byte strings, deserialized to ``uint8`` arrays
+    of shape ``(N, width)``.
+
+    Serializes the same as ``CountableList(Binary.fixed_length(width))``.
+
+    :param width: the length of each element in bytes
+    :param max_length: maximum number of allowed elements, or `None` for no limit
+    """
+
+    def __init__(self, width, max_length=None):
+        super().__init__(max_length)
+        self.width = width
+        if width != 1:
+            self._prefix = np.frombuffer(length_prefix(width, 0x80), np.uint8)
+
+    def _to_array(self, obj, exception_class):
+        array = np.asarray(obj)
+        if array.ndim == 1 and array.size == 0:
+            array = array.reshape(0, self.width).astype(np.uint8)
+        if array.ndim != 2 or array.shape[1] != self.width:
+            raise exception_class(
+                f"Can only serialize arrays of shape (N, {self.width})", obj
+            )
+        if array.dtype != np.uint8:
+            raise exception_class("Can only serialize uint8 arrays", obj)
+        self._check_count(len(array), obj, exception_class)
+        return array
+
+    def _split_elements(self, array):
+        if self.width == 0:
+            return [b""] * len(array)
+        data = array.tobytes()
+        return [data[i : i + self.width] for i in range(0, len(data), self.width)]
+
+    def _from_payload(self, buf, serial):
+        # all elements are encoded with the same prefix, so they can be located
+        # without reading the prefixes one by one
+        if self.width != 1 and len(buf) % (len(self._prefix) + self.width) == 0:
+            rows = buf.reshape(-1, len(self._prefix) + self.width)
+            if (rows[:, : len(self._prefix)] == self._prefix).all():
+                self._check_count(len(rows), serial, DeserializationError)
+                return rows[:, len(self._prefix) :].copy()
+        if self.width < 56:
+            return super()._from_payload(buf, serial)
+        else:
+            raise DeserializationError(
+                f"Elements must have length {self.width}", serial
+            )
+
+    def _from_elements(self, buf, starts, lengths, serial):
+        if (lengths != self.width).any():
+            raise DeserializationError(
+                f"Elements must have length {self.width}", serial
+            )
+        return buf[starts[:, None] + np.arange(self.width)]
+
+    def _encode_elements(self, array):
+        if self.width != 1:
+            rows = np.empty((len(array), len(self._prefix) + self.width), np.uint8)
+            rows[:, : len(self._prefix)] = self._prefix
+            rows[:, len(self._prefix) :] = array
+            return rows
+
+        values = array.reshape(len(array))
+        single = values < 0x80
+        widths = np.where(single, 1, 2)
+        offsets = np.cumsum(widths) - widths
+        out = np.empty(int(widths.sum()), np.uint8)
+        out[offsets] = np.where(single, values, 0x81)
+        out[offsets[~single] + 1] = values[~single]
+        return out
+
+
+def _scan_short_strings(buf, serial):
+    """
+    Locate the elements of a list payload consisting of short strings only.
+
+    Rather than reading one prefix after another, the element boundaries are found
+    by repeatedly doubling the jumps from each byte to the element following it,
+    so the number of NumPy operations only grows logarithmically with the length
+    of the list.
+
+    :returns: arrays of the payload offsets and lengths of each element
+    """
+    size = len(buf)
+    if size == 0:
+        return np.zeros(0, np.intp), np.zeros(0, np.intp)
+
+    first_bytes = buf.astype(np.intp)
+    ends = np.arange(size) + np.where(first_bytes < 0x80, 1, first_bytes - 0x80 + 1)
+    jumps = np.append(np.minimum(ends, size), size)
+    starts = np.zeros(1, np.intp)
+    while starts[-1] != size:
+        starts = np.concatenate((starts, jumps[starts]))
+        jumps = jumps[jumps]
+    starts = starts[: np.searchsorted(starts, size)]
+
+    prefixes = first_bytes[starts]
+    if (prefixes >= 0xB8).any():
+        raise DeserializationError(
+            "Can only deserialize lists of short strings", serial
+        )
+    if ends[starts[-1]] != size:
+        raise DecodingError("List length prefix announced a too small length", serial)
+    is_short = prefixes >= 0x80
+    if (
+        (prefixes == 0x81) & (first_bytes[np.minimum(starts + 1, size - 1)] < 0x80)
+    ).any():
+        raise DecodingError(
+            "Encoded as short string although single byte was possible", serial
+        )
+    return starts + is_short, np.where(is_short, prefixes - 0x80, 1)
+
+
+def _gather_right_aligned(buf, starts, lengths, width):
+    """
+    Copy variable length byte strings into the rows of a ``(N, width)`` array,
+    right aligned and padded with zeros.
+    """
+    if len(starts) == 0 or len(buf) == 0:
+        return np.zeros((len(starts), width), np.uint8)
+    columns = np.arange(width)
+    padding = width - lengths[:, None]
+    indices = np.clip(starts[:, None] + columns - padding, 0, len(buf) - 1)
+    return np.where(columns >= padding, buf[indices], 0).astype(np.uint8)
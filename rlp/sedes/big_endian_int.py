@@ -1,7 +1,6 @@
-from eth_utils import (
-    big_endian_to_int,
-    int_to_big_endian,
-)
+import math
+import numbers
+import operator
 
 from rlp.exceptions import (
     DeserializationError,
@@ -15,15 +14,23 @@ class BigEndianInt:
 
     :param l: the size of the serialized representation in bytes or `None` to
               use the shortest possible one
+    :param lazy: if true, deserialize to :class:`LazyInt` objects which are only
+                 converted to :class:`int` once their value is needed
     """
 
-    def __init__(self, length=None):
+    def __init__(self, length=None, lazy=False):
         self.length = length
+        self.lazy = lazy
+        self._max_value = None if length is None else 256**length
 
     def serialize(self, obj):
+        if isinstance(obj, LazyInt):
+            if self._is_valid_serial(obj.serial):
+                return obj.serial
+            obj = obj.value
         if isinstance(obj, bool) or not isinstance(obj, int):
             raise SerializationError("Can only serialize integers", obj)
-        if self.length is not None and obj >= 256**self.length:
+        if self._max_value is not None and obj >= self._max_value:
             raise SerializationError(
                 f"Integer too large (does not fit in {self.length} bytes)",
                 obj,
@@ -31,17 +38,15 @@ class BigEndianInt:
         if obj < 0:
             raise SerializationError("Cannot serialize negative integers", obj)
 
-        if obj == 0:
-            s = b""
-        else:
-            s = int_to_big_endian(obj)
-
         if self.length is not None:
-            return b"\x00" * max(0, self.length - len(s)) + s
+            return obj.to_bytes(self.length, "big")
         else:
-            return s
+            return obj.to_bytes((obj.bit_length() + 7) // 8, "big")
 
-    def deserialize(self, serial):
+    def deserialize(self, serial, trusted=False):
+        if trusted:
+            # the serialization is known to be canonical
+            return LazyInt(serial) if self.lazy else int.from_bytes(serial, "big")
         if self.length is not None and len(serial) != self.length:
             raise DeserializationError("Invalid serialization (wrong size)", serial)
         if self.length is None and len(serial) > 0 and serial[0:1] == b"\x00":
@@ -49,8 +54,147 @@ class BigEndianInt:
                 "Invalid serialization (not minimal " "length)", serial
             )
 
-        serial = serial or b"\x00"
-        return big_endian_to_int(serial)
+        if self.lazy:
+            return LazyInt(serial)
+        else:
+            return int.from_bytes(serial, "big")
+
+    def _is_valid_serial(self, serial):
+        if self.length is None:
+            return len(serial) == 0 or serial[0] != 0
+        else:
+            return len(serial) == self.length
 
 
 big_endian_int = BigEndianInt()
+
+
+class LazyInt:
+    """
+    A non-negative integer backed by its big endian serialization.
+
+    The serialization is only converted to an :class:`int` when the value is
+    needed, e.g. for arithmetic, comparisons or hashing. Serializing it again with a
+    :class:`BigEndianInt` of the same length returns the original bytes.
+
+    :param serial: the big endian representation of the integer
+    """
+
+    __slots__ = ("serial", "_value")
+
+    def __init__(self, serial):
+        self.serial = bytes(serial)
+        self._value = None
+
+    @property
+    def value(self):
+        if self._value is None:
+            self._value = int.from_bytes(self.serial, "big")
+        return self._value
+
+    # the rest of the interface of numbers.Integral, as LazyInt is registered
+    # as one
+
+    @property
+    def numerator(self):
+        return self.value
+
+    @property
+    def denominator(self):
+        return 1
+
+    @property
+    def real(self):
+        return self.value
+
+    @property
+    def imag(self):
+        return 0
+
+    def __int__(self):
+        return self.value
+
+    def __index__(self):
+        return self.value
+
+    def __bool__(self):
+        return self.serial.count(0) != len(self.serial)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyInt):
+            return self.serial == other.serial or self.value == other.value
+        return self.value == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.serial!r})"
+
+    def __str__(self):
+        return str(self.value)
+
+    def __format__(self, format_spec):
+        return format(self.value, format_spec)
+
+    def __reduce__(self):
+        return (type(self), (self.serial,))
+
+
+def _mk_int_operator(name, function, reflected=False):
+    # the functions of the operator module (rather than the methods of int) are
+    # called, so that operations with other types like float work as with int
+    def method(self, *args, **kwargs):
+        args = tuple(arg.value if isinstance(arg, LazyInt) else arg for arg in args)
+        if reflected:
+            return function(args[0], self.value, *args[1:])
+        return function(self.value, *args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+for _name, _function in (
+    ("__lt__", operator.lt),
+    ("__le__", operator.le),
+    ("__gt__", operator.gt),
+    ("__ge__", operator.ge),
+    ("__neg__", operator.neg),
+    ("__pos__", operator.pos),
+    ("__abs__", operator.abs),
+    ("__invert__", operator.invert),
+    ("__float__", float),
+    ("__round__", round),
+    ("__trunc__", math.trunc),
+    ("__floor__", math.floor),
+    ("__ceil__", math.ceil),
+    ("conjugate", int.conjugate),
+    ("bit_length", int.bit_length),
+    ("to_bytes", int.to_bytes),
+):
+    setattr(LazyInt, _name, _mk_int_operator(_name, _function))
+
+for _name, _function in (
+    ("add", operator.add),
+    ("sub", operator.sub),
+    ("mul", operator.mul),
+    ("truediv", operator.truediv),
+    ("floordiv", operator.floordiv),
+    ("mod", operator.mod),
+    ("divmod", divmod),
+    ("pow", pow),
+    ("lshift", operator.lshift),
+    ("rshift", operator.rshift),
+    ("and", operator.and_),
+    ("or", operator.or_),
+    ("xor", operator.xor),
+):
+    setattr(LazyInt, f"__{_name}__", _mk_int_operator(f"__{_name}__", _function))
+    setattr(
+        LazyInt,
+        f"__r{_name}__",
+        _mk_int_operator(f"__r{_name}__", _function, reflected=True),
+    )
+del _name, _function
+
+numbers.Integral.register(LazyInt)
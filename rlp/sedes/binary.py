@@ -51,14 +51,14 @@ class Binary:
 
         return obj
 
-    def deserialize(self, serial):
+    def deserialize(self, serial, trusted=False):
         if not isinstance(serial, Atomic):
             raise DeserializationError(
                 f"Objects of type {type(serial).__name__} cannot be deserialized",
                 serial,
             )
 
-        if self.is_valid_length(len(serial)):
+        if trusted or self.is_valid_length(len(serial)):
             return serial
         else:
             raise DeserializationError(f"{type(serial)} has invalid length", serial)
@@ -4,6 +4,7 @@ Module for sedes objects that use lists as serialization format.
 from collections.abc import (
     Sequence,
 )
+import functools
 
 from eth_utils import (
     to_list,
@@ -14,9 +15,14 @@ from rlp.exceptions import (
     DeserializationError,
     ListDeserializationError,
     ListSerializationError,
+    ObjectDeserializationError,
+    ObjectSerializationError,
     SerializationError,
 )
 
+from .big_endian_int import (
+    BigEndianInt,
+)
 from .binary import (
     Binary as BinaryClass,
 )
@@ -32,6 +38,37 @@ def is_sedes(obj):
     return hasattr(obj, "serialize") and hasattr(obj, "deserialize")
 
 
+def get_deserializer(sedes, trusted):
+    """
+    Get the function that deserializes with `sedes`.
+
+    If `trusted` is true and `sedes` supports it, the function skips the checks
+    for canonical serializations, otherwise it is just ``sedes.deserialize``.
+    """
+    if trusted and (
+        isinstance(sedes, (BinaryClass, BigEndianInt, List, CountableList))
+        or _has_base_deserialize(sedes)
+    ):
+        return functools.partial(sedes.deserialize, trusted=True)
+    return sedes.deserialize
+
+
+def _has_base_deserialize(sedes):
+    """
+    Check if `sedes` is a serializable class that deserializes with the
+    implementation of :class:`rlp.Serializable`, rather than one of its own that
+    may not take `trusted`.
+    """
+    if getattr(sedes, "_meta", None) is None:
+        return False
+    from rlp.sedes.serializable import (
+        BaseSerializable,
+    )
+
+    deserialize = getattr(sedes.deserialize, "__func__", None)
+    return deserialize is BaseSerializable.deserialize.__func__
+
+
 def is_sequence(obj):
     """Check if `obj` is a sequence, but not a string or bytes."""
     return isinstance(obj, Sequence) and not (
@@ -83,7 +120,14 @@ class List(list):
                 raise ListSerializationError(obj=obj, element_exception=e, index=index)
 
     @to_tuple
-    def deserialize(self, serial):
+    def deserialize(self, serial, trusted=False):
+        """
+        Deserialize a list by deserializing each element with its sedes.
+
+        :param trusted: if true, the elements are deserialized without checking
+                        that their serialization is canonical (e.g. for data that
+                        has been validated before)
+        """
         if not is_sequence(serial):
             raise ListDeserializationError("Can only deserialize sequences", serial)
 
@@ -96,7 +140,10 @@ class List(list):
 
         for idx, (sedes, element) in enumerate(zip(self, serial)):
             try:
-                yield sedes.deserialize(element)
+                if trusted:
+                    yield get_deserializer(sedes, trusted)(element)
+                else:
+                    yield sedes.deserialize(element)
             except DeserializationError as e:
                 raise ListDeserializationError(
                     serial=serial, element_exception=e, index=idx
@@ -134,7 +181,17 @@ class CountableList:
                 raise ListSerializationError(obj=obj, element_exception=e, index=index)
 
     @to_tuple
-    def deserialize(self, serial):
+    def deserialize(self, serial, intern_table=None, trusted=False):
+        """
+        Deserialize a list by deserializing each element.
+
+        :param intern_table: an optional :class:`rlp.InternTable` used to share
+                             repeated strings between the elements
+        :param trusted: if true, the elements are deserialized without checking
+                        that their serialization is canonical (e.g. for data that
+                        has been validated before)
+        """
+        deserialize = get_deserializer(self.element_sedes, trusted)
         if not is_sequence(serial):
             raise ListDeserializationError(
                 "Can only deserialize sequences", serial=serial
@@ -146,9 +203,146 @@ class CountableList:
                     serial=serial,
                 )
 
+            if intern_table is not None:
+                element = intern_table.intern_item(element)
             try:
-                yield self.element_sedes.deserialize(element)
+                yield deserialize(element)
             except DeserializationError as e:
                 raise ListDeserializationError(
                     serial=serial, element_exception=e, index=index
                 )
+
+    def serialize_columns(self, columns):
+        """
+        Serialize a list of :class:`rlp.Serializable` objects given as columns.
+
+        This gives the same result as serializing the list of objects built from
+        the columns, without actually building them.
+
+        :param columns: a mapping from each field name of the element sedes to a
+                        sequence of the values of that field
+        """
+        meta = self._get_element_meta()
+        missing = set(meta.field_names).difference(columns.keys())
+        if missing:
+            raise SerializationError(f"Missing columns: {sorted(missing)}", columns)
+        lengths = {len(columns[name]) for name in meta.field_names}
+        if len(lengths) > 1:
+            raise SerializationError("Columns differ in length", columns)
+        length = lengths.pop() if lengths else 0
+        if self.max_length is not None and length > self.max_length:
+            raise ListSerializationError(
+                f"Too many elements ({length}, allowed {self.max_length})",
+                obj=columns,
+            )
+
+        serialized_columns = []
+        for field_index, (name, sedes) in enumerate(meta.fields):
+            try:
+                serialized_columns.append(list(map(sedes.serialize, columns[name])))
+            except SerializationError:
+                self._raise_column_serialization_error(columns, field_index)
+        if not serialized_columns:
+            return [[] for _ in range(length)]
+        return [list(row) for row in zip(*serialized_columns)]
+
+    def deserialize_columns(self, serial):
+        """
+        Deserialize a list of :class:`rlp.Serializable` objects into columns.
+
+        Each field is deserialized by its sedes, but no objects of the element
+        class are created (so a custom ``__init__`` is not called either).
+
+        :returns: a dictionary mapping each field name of the element sedes to a
+                  tuple of the values of that field
+        """
+        meta = self._get_element_meta()
+        if not is_sequence(serial):
+            raise ListDeserializationError(
+                "Can only deserialize sequences", serial=serial
+            )
+        if self.max_length is not None and len(serial) > self.max_length:
+            raise ListDeserializationError(
+                f"Too many elements (more than {self.max_length})",
+                serial=serial,
+            )
+        for index, element in enumerate(serial):
+            try:
+                if not is_sequence(element):
+                    raise ListDeserializationError(
+                        "Can only deserialize sequences", element
+                    )
+                if len(element) != len(meta.fields):
+                    raise ListDeserializationError(
+                        "Deserializing list length (%d) does not match sedes (%d)"
+                        % (len(element), len(meta.fields)),
+                        element,
+                    )
+            except ListDeserializationError as e:
+                raise ListDeserializationError(
+                    serial=serial,
+                    element_exception=ObjectDeserializationError(
+                        serial=element, sedes=self.element_sedes, list_exception=e
+                    ),
+                    index=index,
+                )
+
+        columns = {}
+        for field_index, (name, sedes) in enumerate(meta.fields):
+            try:
+                columns[name] = tuple(
+                    map(sedes.deserialize, (element[field_index] for element in serial))
+                )
+            except DeserializationError:
+                self._raise_column_deserialization_error(serial, field_index)
+        return columns
+
+    def _get_element_meta(self):
+        meta = getattr(self.element_sedes, "_meta", None)
+        if meta is None:
+            raise TypeError(
+                "Columnar (de)serialization requires a Serializable element sedes"
+            )
+        return meta
+
+    def _raise_column_serialization_error(self, columns, field_index):
+        meta = self.element_sedes._meta
+        name, sedes = meta.fields[field_index]
+        for index, value in enumerate(columns[name]):
+            try:
+                sedes.serialize(value)
+            except SerializationError as e:
+                element = tuple(columns[field][index] for field in meta.field_names)
+                list_exception = ListSerializationError(
+                    obj=element, element_exception=e, index=field_index
+                )
+                raise ListSerializationError(
+                    obj=columns,
+                    element_exception=ObjectSerializationError(
+                        obj=element,
+                        sedes=self.element_sedes,
+                        list_exception=list_exception,
+                    ),
+                    index=index,
+                )
+        raise AssertionError("Invariant: serialization error did not repeat")
+
+    def _raise_column_deserialization_error(self, serial, field_index):
+        sedes = self.element_sedes._meta.fields[field_index][1]
+        for index, element in enumerate(serial):
+            try:
+                sedes.deserialize(element[field_index])
+            except DeserializationError as e:
+                list_exception = ListDeserializationError(
+                    serial=element, element_exception=e, index=field_index
+                )
+                raise ListDeserializationError(
+                    serial=serial,
+                    element_exception=ObjectDeserializationError(
+                        serial=element,
+                        sedes=self.element_sedes,
+                        list_exception=list_exception,
+                    ),
+                    index=index,
+                )
+        raise AssertionError("Invariant: deserialization error did not repeat")
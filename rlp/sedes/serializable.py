@@ -5,16 +5,22 @@ import enum
 import re
 
 from eth_utils import (
+    keccak,
     to_dict,
     to_set,
     to_tuple,
 )
 
+from rlp.caches import (
+    cached_rlp_registry,
+)
 from rlp.exceptions import (
+    EncodingError,
     ListDeserializationError,
     ListSerializationError,
     ObjectDeserializationError,
     ObjectSerializationError,
+    SerializationError,
 )
 
 from .lists import (
@@ -202,7 +208,19 @@ class BaseSerializable(collections.abc.Sequence):
         for value, attr in zip(field_values, self._meta.field_attrs):
             setattr(self, attr, make_immutable(value))
 
-    _cached_rlp = None
+    _rlp_cache = None
+
+    @property
+    def _cached_rlp(self):
+        return self._rlp_cache
+
+    @_cached_rlp.setter
+    def _cached_rlp(self, value):
+        self._rlp_cache = value
+        cached_rlp_registry.track(self, value)
+
+    def _drop_cached_rlp(self):
+        self._rlp_cache = None
 
     def as_dict(self):
         return {field: value for field, value in zip(self._meta.field_names, self)}
@@ -227,7 +245,17 @@ class BaseSerializable(collections.abc.Sequence):
         return len(self._meta.fields)
 
     def __eq__(self, other):
-        return isinstance(other, Serializable) and hash(self) == hash(other)
+        if not isinstance(other, Serializable):
+            return False
+        elif self is other:
+            return True
+        elif type(self) is type(other):
+            # Both encodings are canonical for the same sedes, so matching caches
+            # imply matching fields and we can skip walking the object tree.
+            self_rlp = self._cached_rlp
+            if self_rlp is not None and self_rlp == other._cached_rlp:
+                return True
+        return _eq(tuple(self), tuple(other))
 
     def __getstate__(self):
         state = self.__dict__.copy()
@@ -238,13 +266,74 @@ class BaseSerializable(collections.abc.Sequence):
         state["_hash_cache"] = None
         return state
 
+    def __reduce_ex__(self, protocol):
+        # Pickle as the RLP encoding, which is usually cached already and much more
+        # compact than the instance dictionaries of all nested objects. Only
+        # attributes that are not part of the encoding are carried as state.
+        from rlp.codec import (
+            encode,
+        )
+
+        # Unpickling the encoding goes through `deserialize` and `__init__`, which
+        # subclasses may have changed, and objects with invalid fields can't be
+        # encoded. Those are pickled as their instance dictionaries (see
+        # `__getstate__`).
+        cls = type(self)
+        if (
+            cls.__init__ is not BaseSerializable.__init__
+            or cls.deserialize.__func__ is not BaseSerializable.deserialize.__func__
+        ):
+            return super().__reduce_ex__(protocol)
+        try:
+            rlp = encode(self)
+        except (EncodingError, SerializationError):
+            return super().__reduce_ex__(protocol)
+
+        state = {
+            key: value
+            for key, value in self.__getstate__().items()
+            if key not in self._meta.field_attrs
+            and key not in ("_rlp_cache", "_hash_cache")
+        }
+        if state:
+            return (_unpickle_serializable, (cls, rlp), state)
+        else:
+            return (_unpickle_serializable, (cls, rlp))
+
     _hash_cache = None
 
     def __hash__(self):
-        if self._hash_cache is None:
-            self._hash_cache = hash(tuple(self))
+        # The lazily computed caches are read only once and written without
+        # locking: objects are immutable, so threads racing to fill in a cache
+        # store equal values.
+        hash_ = self._hash_cache
+        if hash_ is None:
+            hash_ = self._hash_cache = hash(tuple(self))
+
+        return hash_
+
+    _content_hash_cache = None
+
+    def content_hash(self):
+        """
+        Get the keccak256 hash of the RLP encoding of this object.
+
+        Contrary to :func:`hash`, the result is stable across processes and can be
+        used to identify objects outside of the current interpreter. It is computed
+        from :attr:`_cached_rlp` if available and cached on the instance.
+
+        Note that computing the hash requires one of the backends of ``eth-hash``
+        to be installed.
+        """
+        content_hash = self._content_hash_cache
+        if content_hash is None:
+            from rlp.codec import (
+                encode,
+            )
 
-        return self._hash_cache
+            content_hash = self._content_hash_cache = keccak(encode(self))
+
+        return content_hash
 
     def __repr__(self):
         keyword_args = tuple(f"{k}={v!r}" for k, v in self.as_dict().items())
@@ -258,14 +347,31 @@ class BaseSerializable(collections.abc.Sequence):
             raise ObjectSerializationError(obj=obj, sedes=cls, list_exception=e)
 
     @classmethod
-    def deserialize(cls, serial, **extra_kwargs):
+    def deserialize(cls, serial, trusted=False, **extra_kwargs):
+        """
+        Deserialize an object of this class.
+
+        :param trusted: if true, neither the serializations of the fields are
+                        checked to be canonical nor the field values passed to the
+                        constructor (e.g. for data that has been validated before)
+        :param `**extra_kwargs`: additional keyword arguments passed to the
+                                 constructor
+        """
         try:
-            values = cls._meta.sedes.deserialize(serial)
+            values = cls._meta.sedes.deserialize(serial, trusted=trusted)
         except ListDeserializationError as e:
             raise ObjectDeserializationError(serial=serial, sedes=cls, list_exception=e)
 
-        args_as_kwargs = merge_args_to_kwargs(values, {}, cls._meta.field_names)
-        return cls(**args_as_kwargs, **extra_kwargs)
+        if not trusted:
+            args_as_kwargs = merge_args_to_kwargs(values, {}, cls._meta.field_names)
+            return cls(**args_as_kwargs, **extra_kwargs)
+        elif cls.__init__ is BaseSerializable.__init__ and not extra_kwargs:
+            obj = cls.__new__(cls)
+            for value, attr in zip(values, cls._meta.field_attrs):
+                setattr(obj, attr, make_immutable(value))
+            return obj
+        else:
+            return cls(**dict(zip(cls._meta.field_names, values)), **extra_kwargs)
 
     def copy(self, *args, **kwargs):
         missing_overrides = (
@@ -300,6 +406,15 @@ class BaseSerializable(collections.abc.Sequence):
         return Changeset(self, changes=args_as_kwargs)
 
 
+def _unpickle_serializable(cls, rlp):
+    from rlp.codec import (
+        decode,
+    )
+
+    # the encoding has been created by `__reduce__` from a valid object
+    return decode(rlp, cls, trusted=True)
+
+
 def make_immutable(value):
     if isinstance(value, list):
         return tuple(make_immutable(item) for item in value)
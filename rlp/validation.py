@@ -0,0 +1,237 @@
+"""
+Checks whether RLP strings are well-formed without decoding them.
+"""
+from rlp.codec import (
+    decode,
+)
+from rlp.exceptions import (
+    DecodingError,
+    DeserializationError,
+)
+from rlp.sedes import (
+    BigEndianInt,
+    Binary,
+    Boolean,
+    CountableList,
+    List,
+    raw,
+)
+from rlp.sedes.serializable import (
+    BaseSerializable,
+)
+
+# returned instead of an end position if the input is invalid
+INVALID = -1
+
+
+def validate(rlp, sedes=None, strict=True):
+    """
+    Check if a string is valid canonical RLP, optionally also for a sedes.
+
+    In contrast to :func:`rlp.decode`, only the length prefixes are read and
+    neither the payloads are copied nor any results are created, so that checking
+    invalid input is cheap. The same rules as for decoding apply: every announced
+    length must fit into the enclosing item and each item has to be encoded with
+    the shortest possible prefix.
+
+    If `sedes` is given, the length constraints of :class:`rlp.sedes.Binary` and
+    :class:`rlp.sedes.BigEndianInt`, the values of :class:`rlp.sedes.Boolean` and
+    the number of elements of :class:`rlp.sedes.List`,
+    :class:`rlp.sedes.CountableList` and :class:`rlp.Serializable` are checked as
+    well. Other sedes are checked by decoding and deserializing the corresponding
+    part of the input. Note that this doesn't run any custom constructors of
+    serializable classes.
+
+    Usage example::
+
+        >>> import rlp
+        >>> from rlp.sedes import CountableList, big_endian_int
+        >>> rlp.validate(rlp.encode([1, 2, 3]))
+        True
+        >>> rlp.validate(rlp.encode([1, 2, 3]), CountableList(big_endian_int, 2))
+        False
+        >>> rlp.validate(rlp.encode(bytes([0, 1])), big_endian_int)
+        False
+
+    :param rlp: the RLP string to check
+    :param sedes: an optional sedes the encoded object must be deserializable with
+    :param strict: if false inputs that are longer than necessary are considered
+                   valid
+    :returns: `True` if the input is valid, `False` otherwise
+    """
+    if not isinstance(rlp, (bytes, bytearray, memoryview)):
+        return False
+    if sedes is None:
+        end = _scan(rlp, 0, len(rlp))
+    else:
+        end = _validate(rlp, 0, len(rlp), sedes)
+    return end != INVALID and (end == len(rlp) or not strict)
+
+
+def _read_prefix(rlp, start, bound):
+    """
+    Read the length prefix at `start` and check that it is canonical and that the
+    payload ends before `bound`.
+
+    :returns: a tuple ``(is_list, length, payload_start)``, or `None` if invalid
+    """
+    if start >= bound:
+        return None
+    b0 = rlp[start]
+    if b0 < 0x80:  # single byte
+        return (False, 1, start)
+    elif b0 < 0xB8:  # short string
+        length = b0 - 0x80
+        if length == 1 and (start + 1 >= bound or rlp[start + 1] < 0x80):
+            return None
+        is_list = False
+        payload_start = start + 1
+    elif b0 < 0xC0:  # long string
+        is_list = False
+        payload_start = start + 1 + b0 - 0xB7
+        length = _read_long_length(rlp, start + 1, payload_start, bound)
+    elif b0 < 0xF8:  # short list
+        length = b0 - 0xC0
+        is_list = True
+        payload_start = start + 1
+    else:  # long list
+        is_list = True
+        payload_start = start + 1 + b0 - 0xF7
+        length = _read_long_length(rlp, start + 1, payload_start, bound)
+
+    if length is None or payload_start + length > bound:
+        return None
+    return (is_list, length, payload_start)
+
+
+def _read_long_length(rlp, start, end, bound):
+    """
+    Read the length of a long string or list from ``rlp[start:end]``.
+
+    :returns: the length, or `None` if it isn't canonical or exceeds `bound`
+    """
+    if end > bound or rlp[start] == 0:
+        return None
+    length = 0
+    for position in range(start, end):
+        length = (length << 8) | rlp[position]
+    if length < 56:
+        # should have used a short prefix
+        return None
+    return length
+
+
+def _scan(rlp, start, bound):
+    """
+    Check the structure of the item at `start` without recursion.
+
+    :returns: the end position of the item, or :data:`INVALID`
+    """
+    header = _read_prefix(rlp, start, bound)
+    if header is None:
+        return INVALID
+    is_list, length, position = header
+    if not is_list:
+        return position + length
+    end = position + length
+    # the ends of the lists containing the current position
+    ends = [end]
+    while ends:
+        list_end = ends[-1]
+        if position == list_end:
+            ends.pop()
+            continue
+        header = _read_prefix(rlp, position, list_end)
+        if header is None:
+            return INVALID
+        is_list, length, position = header
+        if is_list:
+            ends.append(position + length)
+        else:
+            position += length
+    return end
+
+
+def _validate(rlp, start, bound, sedes):
+    """
+    Check the item at `start` for `sedes`.
+
+    :returns: the end position of the item, or :data:`INVALID`
+    """
+    if sedes is raw:
+        return _scan(rlp, start, bound)
+
+    header = _read_prefix(rlp, start, bound)
+    if header is None:
+        return INVALID
+    is_list, length, payload_start = header
+    end = payload_start + length
+
+    if isinstance(sedes, Binary):
+        valid = not is_list and sedes.is_valid_length(length)
+    elif isinstance(sedes, BigEndianInt):
+        if sedes.length is None:
+            valid = not is_list and (length == 0 or rlp[payload_start] != 0)
+        else:
+            valid = not is_list and length == sedes.length
+    elif isinstance(sedes, Boolean):
+        valid = not is_list and (
+            length == 0 or (length == 1 and rlp[payload_start] == 1)
+        )
+    elif isinstance(sedes, type) and issubclass(sedes, BaseSerializable):
+        valid = is_list and _validate_elements(
+            rlp, payload_start, end, sedes._meta.sedes, None, True
+        )
+    elif isinstance(sedes, List):
+        valid = is_list and _validate_elements(
+            rlp, payload_start, end, sedes, None, sedes.strict
+        )
+    elif isinstance(sedes, CountableList):
+        valid = is_list and _validate_elements(
+            rlp, payload_start, end, (), sedes.element_sedes, False, sedes.max_length
+        )
+    else:
+        return _validate_generic(rlp, start, bound, sedes)
+
+    return end if valid else INVALID
+
+
+def _validate_elements(
+    rlp, start, end, element_sedes, repeated_sedes, exact, max_count=None
+):
+    """
+    Check the elements of a list payload.
+
+    :param element_sedes: the sedes of the first elements
+    :param repeated_sedes: the sedes of all further elements, or `None` if they
+                           only have to be valid RLP
+    :param exact: if true, there must be exactly one element for each sedes in
+                  `element_sedes`
+    :param max_count: the maximum number of elements, or `None`
+    """
+    position = start
+    count = 0
+    while position < end:
+        if count < len(element_sedes):
+            position = _validate(rlp, position, end, element_sedes[count])
+        elif repeated_sedes is not None:
+            position = _validate(rlp, position, end, repeated_sedes)
+        else:
+            position = _scan(rlp, position, end)
+        if position == INVALID:
+            return False
+        count += 1
+        if max_count is not None and count > max_count:
+            return False
+    return not exact or count == len(element_sedes)
+
+
+def _validate_generic(rlp, start, bound, sedes):
+    end = _scan(rlp, start, bound)
+    if end == INVALID:
+        return INVALID
+    try:
+        decode(bytes(rlp[start:end]), sedes)
+    except (DecodingError, DeserializationError):
+        return INVALID
+    return end
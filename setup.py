@@ -21,11 +21,14 @@ extras_require = {
         "towncrier>=24,<25",
     ],
     "test": [
+        "eth-hash[pycryptodome]",
         "pytest>=7.0.0",
         "pytest-xdist>=2.4.0",
         "hypothesis>=6.22.0,<6.108.7",
+        "numpy",
     ],
     "rust-backend": ["rusty-rlp>=0.2.1"],
+    "numpy": ["numpy"],
 }
 
 
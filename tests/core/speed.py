@@ -1,6 +1,9 @@
 """
 util to benchmark known usecase
 """
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
 import random
 import time
 
@@ -155,12 +158,58 @@ def do_test_serialize(block, rounds=100):
     return x
 
 
-def do_test_deserialize(data, rounds=100, sedes=Block):
+def do_test_deserialize(data, rounds=100, sedes=Block, trusted=False):
     for _ in range(rounds):
-        x = rlp.decode(data, sedes)
+        x = rlp.decode(data, sedes, trusted=trusted)
     return x
 
 
+def do_test_lazy_reads(lazy_block, rounds=100):
+    # only the first round decodes the transactions, the others read them
+    for _ in range(rounds):
+        x = tuple(lazy_block[1])
+    return x
+
+
+def do_test_threads(function, arg, threads, rounds=100):
+    # every thread works on the same object, to also cover the shared caches
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [
+            executor.submit(function, arg, rounds // threads) for _ in range(threads)
+        ]
+        for future in futures:
+            future.result()
+
+
+def main_threads(rounds=10000, thread_counts=(1, 2, 4, 8)):
+    block = mk_block()
+    data = rlp.encode(block, cache=False)
+    for threads in thread_counts:
+        st = time.time()
+        do_test_threads(do_test_serialize, block, threads, rounds)
+        elapsed = time.time() - st
+        print(
+            "Block serializations / sec with %d threads: %.2f"
+            % (threads, rounds / elapsed)
+        )
+
+        st = time.time()
+        do_test_threads(do_test_deserialize, data, threads, rounds)
+        elapsed = time.time() - st
+        print(
+            "Block deserializations / sec with %d threads: %.2f"
+            % (threads, rounds / elapsed)
+        )
+
+        st = time.time()
+        do_test_threads(do_test_lazy_reads, rlp.decode_lazy(data), threads, rounds)
+        elapsed = time.time() - st
+        print(
+            "Shared lazy list reads / sec with %d threads: %.2f"
+            % (threads, rounds / elapsed)
+        )
+
+
 def main(rounds=10000):
     st = time.time()
     d = do_test_serialize(mk_block(), rounds)
@@ -168,23 +217,34 @@ def main(rounds=10000):
     print("Block serializations / sec: %.2f" % (rounds / elapsed))
 
     st = time.time()
-    d = do_test_deserialize(d, rounds)
+    do_test_deserialize(d, rounds)
     elapsed = time.time() - st
     print("Block deserializations / sec: %.2f" % (rounds / elapsed))
 
+    st = time.time()
+    d = do_test_deserialize(d, rounds, trusted=True)
+    elapsed = time.time() - st
+    print("Block trusted deserializations / sec: %.2f" % (rounds / elapsed))
+
     st = time.time()
     d = do_test_serialize(mk_transaction(), rounds)
     elapsed = time.time() - st
     print("TX serializations / sec: %.2f" % (rounds / elapsed))
 
     st = time.time()
-    d = do_test_deserialize(d, rounds, sedes=Transaction)
+    do_test_deserialize(d, rounds, sedes=Transaction)
     elapsed = time.time() - st
     print("TX deserializations / sec: %.2f" % (rounds / elapsed))
 
+    st = time.time()
+    d = do_test_deserialize(d, rounds, sedes=Transaction, trusted=True)
+    elapsed = time.time() - st
+    print("TX trusted deserializations / sec: %.2f" % (rounds / elapsed))
+
 
 if __name__ == "__main__":
     main()
+    main_threads()
     """
     py2
     serializations / sec: 658.64
@@ -0,0 +1,171 @@
+import pytest
+import asyncio
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+
+import rlp
+from rlp import (
+    DecodeLimits,
+    DecodingError,
+    DeserializationError,
+    adecode,
+    adecode_stream,
+)
+from rlp.sedes import (
+    CountableList,
+    big_endian_int,
+    binary,
+)
+
+
+class Transaction(rlp.Serializable):
+    fields = [
+        ("nonce", big_endian_int),
+        ("data", binary),
+    ]
+
+
+transactions = [Transaction(i, b"x" * (i % 100)) for i in range(2000)]
+encoded = rlp.encode(transactions)
+sedes = CountableList(Transaction)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"inline_threshold": 0},
+        {"inline_threshold": 0, "yield_every": 100},
+        {"inline_threshold": 0, "yield_every": 1},
+    ),
+    ids=("inline", "executor", "slices", "single-slices"),
+)
+@pytest.mark.parametrize("sedes", (None, sedes), ids=("raw", "countable"))
+def test_adecode(sedes, kwargs):
+    assert run(adecode(encoded, sedes, **kwargs)) == rlp.decode(encoded, sedes)
+
+
+def test_adecode_other_sedes():
+    assert run(adecode(rlp.encode(transactions[5]), Transaction)) == transactions[5]
+    assert run(adecode(rlp.encode(b"x" * 1000), binary, inline_threshold=0)) == (
+        b"x" * 1000
+    )
+    # not a list, so decoded at once
+    assert run(
+        adecode(rlp.encode(b"x" * 1000), binary, inline_threshold=0, yield_every=10)
+    ) == (b"x" * 1000)
+
+
+def test_adecode_executor():
+    with ThreadPoolExecutor(1) as executor:
+        result = run(adecode(encoded, sedes, executor=executor, inline_threshold=0))
+    assert result == tuple(transactions)
+
+
+def test_adecode_yields():
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        result = await adecode(encoded, sedes, inline_threshold=0, yield_every=100)
+        ticker.cancel()
+        return result
+
+    assert run(main()) == tuple(transactions)
+    assert len(ticks) >= len(transactions) // 100
+
+
+@pytest.mark.parametrize("yield_every", (None, 10))
+def test_adecode_errors(yield_every):
+    invalid = rlp.encode(transactions[:50] + [[b"\x00", b""]])
+    with pytest.raises(DeserializationError) as excinfo:
+        run(adecode(invalid, sedes, inline_threshold=0, yield_every=yield_every))
+    with pytest.raises(DeserializationError) as expected:
+        rlp.decode(invalid, sedes)
+    assert str(excinfo.value) == str(expected.value)
+
+    with pytest.raises(DeserializationError):
+        run(
+            adecode(
+                encoded,
+                CountableList(Transaction, max_length=10),
+                inline_threshold=0,
+                yield_every=yield_every,
+            )
+        )
+    for truncated in (encoded[:-1], encoded + b"\x00"):
+        with pytest.raises(DecodingError):
+            run(adecode(truncated, inline_threshold=0, yield_every=yield_every))
+    assert run(
+        adecode(encoded + b"\x00", strict=False, inline_threshold=0, yield_every=10)
+    ) == rlp.decode(encoded)
+
+
+def stream_of(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_adecode_stream():
+    values = [b"", b"\x01", b"x" * 100, [], [b"x" * 60, [b"y"]], 1024]
+    data = b"".join(rlp.encode(value) for value in values)
+
+    async def main():
+        return await collect(adecode_stream(stream_of(data)))
+
+    assert run(main()) == [rlp.decode(rlp.encode(value)) for value in values]
+
+
+def test_adecode_stream_sedes():
+    data = b"".join(rlp.encode(tx) for tx in transactions[:20])
+
+    async def main():
+        return await collect(
+            adecode_stream(stream_of(data), Transaction, inline_threshold=0)
+        )
+
+    assert run(main()) == transactions[:20]
+
+
+@pytest.mark.parametrize(
+    "data",
+    (b"\x83ab", b"\xb8", b"\xb9\x01\x00" + b"x" * 10, rlp.encode([1, 2])[:-1]),
+    ids=("short", "long-prefix", "long", "list"),
+)
+def test_adecode_stream_truncated(data):
+    async def main():
+        return await collect(adecode_stream(stream_of(rlp.encode(b"a") + data)))
+
+    with pytest.raises(DecodingError):
+        run(main())
+
+
+def test_adecode_stream_limits():
+    data = rlp.encode(b"x" * 10) + rlp.encode(b"x" * 100)
+    results = []
+
+    async def main():
+        reader = stream_of(data)
+        async for item in adecode_stream(reader, limits=DecodeLimits(max_bytes=50)):
+            results.append(item)
+
+    with pytest.raises(DecodingError):
+        run(main())
+    assert results == [b"x" * 10]
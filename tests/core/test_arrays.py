@@ -0,0 +1,142 @@
+import pytest
+
+import rlp
+from rlp import (
+    DecodingError,
+    DeserializationError,
+    SerializationError,
+)
+from rlp.sedes import (
+    Binary,
+    CountableList,
+    big_endian_int,
+)
+
+np = pytest.importorskip("numpy")
+arrays = pytest.importorskip("rlp.sedes.arrays")
+
+
+int_values = (
+    [],
+    [0],
+    [1],
+    [0x7F, 0x80, 0xFF, 0x100],
+    [0, 1, 2**63, 2**64 - 1, 21000, 10**18],
+    list(range(1000)),
+)
+
+
+@pytest.mark.parametrize("values", int_values)
+def test_int_array(values):
+    sedes = arrays.IntArray()
+    countable = CountableList(big_endian_int)
+    array = np.array(values, dtype=np.uint64)
+    encoded = rlp.encode(values, countable)
+
+    assert sedes.encode(array) == encoded
+    assert rlp.encode(array, sedes) == encoded
+
+    decoded = sedes.decode(encoded)
+    assert decoded.dtype == np.uint64
+    assert decoded.tolist() == values
+    assert rlp.decode(encoded, sedes).tolist() == values
+    assert sedes.deserialize(rlp.decode_lazy(encoded)).tolist() == values
+
+
+@pytest.mark.parametrize("width", (0, 1, 20, 32, 55, 56, 300))
+@pytest.mark.parametrize("count", (0, 1, 7))
+def test_bytes_array(width, count):
+    sedes = arrays.BytesArray(width)
+    countable = CountableList(Binary.fixed_length(width))
+    array = np.arange(count * width, dtype=np.uint8).reshape(count, width)
+    values = [bytes(row) for row in array]
+    encoded = rlp.encode(values, countable)
+
+    assert sedes.encode(array) == encoded
+    assert rlp.encode(array, sedes) == encoded
+
+    for decoded in (
+        sedes.decode(encoded),
+        rlp.decode(encoded, sedes),
+        sedes.deserialize(rlp.decode_lazy(encoded)),
+    ):
+        assert decoded.dtype == np.uint8
+        assert decoded.shape == (count, width)
+        assert [bytes(row) for row in decoded] == values
+
+
+def test_array_in_serializable():
+    class Body(rlp.Serializable):
+        fields = [
+            ("hashes", arrays.BytesArray(32)),
+            ("numbers", arrays.IntArray()),
+        ]
+
+    hashes = np.arange(64, dtype=np.uint8).reshape(2, 32)
+    numbers = np.array([5, 2**40], dtype=np.uint64)
+    encoded = rlp.encode(Body(hashes, numbers))
+    assert encoded == rlp.encode([[bytes(row) for row in hashes], [5, 2**40]])
+
+    body = Body.deserialize(rlp.decode_lazy(encoded))
+    assert (body.hashes == hashes).all()
+    assert (body.numbers == numbers).all()
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    (
+        rlp.encode([b"\x00"]),
+        rlp.encode([b"\x00\x01"]),
+        rlp.encode([b"\x01" * 9]),
+        rlp.encode([[]]),
+        rlp.encode([b"a" * 60]),
+        rlp.encode([1, [2]]),
+    ),
+)
+def test_int_array_invalid(encoded):
+    with pytest.raises(DeserializationError):
+        arrays.IntArray().decode(encoded)
+    with pytest.raises(DeserializationError):
+        rlp.decode(encoded, arrays.IntArray())
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    (
+        b"",
+        b"\xc2\x81\x05",
+        b"\xc2\x82\x05",
+        b"\xc1\x82\x05\x05",
+        b"\xc3\x81\x05\x05",
+    ),
+)
+def test_array_invalid_rlp(encoded):
+    with pytest.raises(DecodingError):
+        arrays.IntArray().decode(encoded)
+
+
+def test_bytes_array_invalid():
+    sedes = arrays.BytesArray(32)
+    for values in ([b"a" * 31], [b"a" * 32, b"a" * 33], [b"a" * 32, [b"a" * 31]]):
+        encoded = rlp.encode(values)
+        with pytest.raises(DeserializationError):
+            sedes.decode(encoded)
+        with pytest.raises(DeserializationError):
+            rlp.decode(encoded, sedes)
+
+    with pytest.raises(SerializationError):
+        sedes.encode(np.zeros((2, 31), np.uint8))
+    with pytest.raises(SerializationError):
+        sedes.encode(np.zeros((2, 32), np.int64))
+
+
+def test_array_max_length():
+    sedes = arrays.IntArray(max_length=2)
+    with pytest.raises(SerializationError):
+        sedes.encode(np.arange(3))
+    with pytest.raises(DeserializationError):
+        sedes.decode(rlp.encode([1, 2, 3]))
+    assert sedes.decode(rlp.encode([1, 2])).tolist() == [1, 2]
+
+    with pytest.raises(SerializationError):
+        arrays.IntArray().encode(np.array([-1, 2]))
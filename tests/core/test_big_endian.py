@@ -1,15 +1,30 @@
 import pytest
 import binascii
+import fractions
+import math
+import numbers
+import pickle
 
 from eth_utils import (
     int_to_big_endian,
 )
 
 from rlp import (
+    DeserializationError,
+    Serializable,
     SerializationError,
+    decode,
+    encode,
+    infer_sedes,
+)
+from rlp.codec import (
+    SMALL_INT_LIMIT,
+    SMALL_INT_RLP,
+    encode_raw,
 )
 from rlp.sedes import (
     BigEndianInt,
+    LazyInt,
     big_endian_int,
 )
 from rlp.utils import (
@@ -85,6 +100,141 @@ def test_fixedlength():
             s.serialize(i)
 
 
+def test_matches_eth_utils():
+    for n in (0,) + tuple(range(1, 300)) + random_integers:
+        expected = int_to_big_endian(n) if n else b""
+        assert big_endian_int.serialize(n) == expected
+        assert big_endian_int.deserialize(expected) == n
+
+    s = BigEndianInt(32)
+    for n in random_integers:
+        expected = int_to_big_endian(n).rjust(32, b"\x00")
+        assert s.serialize(n) == expected
+        assert s.deserialize(expected) == n
+
+
+def test_deserialize_non_bytes_atomics():
+    assert big_endian_int.deserialize(bytearray(b"\x01\x00")) == 256
+    assert big_endian_int.deserialize(bytearray()) == 0
+    assert BigEndianInt(2).deserialize(bytearray(b"\x00\x01")) == 1
+
+
+def test_small_int_encodings():
+    assert len(SMALL_INT_RLP) == SMALL_INT_LIMIT
+    for n, encoded in enumerate(SMALL_INT_RLP):
+        assert encoded == encode_raw(big_endian_int.serialize(n))
+        assert encode(n) is encoded
+        assert encode(n, big_endian_int) is encoded
+        assert decode(encoded, big_endian_int) == n
+
+    assert encode(SMALL_INT_LIMIT) == b"\x82\x04\x00"
+    assert encode(1, BigEndianInt(2)) == b"\x82\x00\x01"
+    assert encode(True) == b"\x01"
+
+
+def test_lazy_deserialization():
+    s = BigEndianInt(256, lazy=True)
+    serial = (2**2000 + 5).to_bytes(256, "big")
+    value = s.deserialize(serial)
+    assert isinstance(value, LazyInt)
+    assert value.serial is serial
+    assert value._value is None
+
+    assert s.serialize(value) is serial
+    assert value._value is None
+
+    assert value == 2**2000 + 5
+    assert value._value == 2**2000 + 5
+    assert hash(value) == hash(2**2000 + 5)
+
+    with pytest.raises(DeserializationError):
+        s.deserialize(serial[1:])
+    with pytest.raises(DeserializationError):
+        BigEndianInt(lazy=True).deserialize(b"\x00\x01")
+
+
+def test_lazy_int_behaves_like_int():
+    value = LazyInt(b"\x00\x05")
+    assert isinstance(value, numbers.Integral)
+    assert int(value) == 5
+    assert value == 5 and 5 == value
+    assert value == LazyInt(b"\x05")
+    assert value != 6
+    assert value < 6 and value <= 5 and value > 4 and value >= 5
+    assert value + 1 == 1 + value == 6
+    assert value - LazyInt(b"\x02") == 3
+    assert value * value == 25
+    assert divmod(17, value) == (3, 2)
+    assert value | 2 == 7 and value & 4 == 4 and value ^ 1 == 4
+    assert value << 1 == 10 and value >> 1 == 2
+    assert [0, 1, 2, 3, 4, 5][value] == 5
+    assert f"{value:#x}" == "0x5"
+    assert str(value) == "5"
+    assert bool(value)
+    assert not LazyInt(b"\x00\x00")
+    assert not LazyInt(b"")
+
+
+def test_lazy_int_integral_interface():
+    value = LazyInt(b"\x01\x00")
+    assert (value.numerator, value.denominator) == (256, 1)
+    assert (value.real, value.imag) == (256, 0)
+    assert value.conjugate() == 256
+    assert value.bit_length() == 9
+    assert value.to_bytes(3, "big") == b"\x00\x01\x00"
+    assert value.to_bytes(length=2, byteorder="little") == b"\x00\x01"
+    assert pow(value, 2, 1000) == 536
+    assert complex(value) == 256
+    assert fractions.Fraction(value, 3) == fractions.Fraction(256, 3)
+    assert math.gcd(value, 12) == 4
+
+
+def test_lazy_int_inferred_sedes():
+    value = LazyInt(b"\x00\x05")
+    assert infer_sedes(value) is big_endian_int
+    assert infer_sedes([value, 6]).element_sedes is big_endian_int
+    assert encode(value) == encode(5)
+    assert encode([value, [LazyInt(b"")]]) == encode([5, [0]])
+    assert encode([value, "a"]) == encode([5, "a"])
+
+
+def test_lazy_int_mixed_with_float():
+    value = LazyInt(b"\x01")
+    assert value + 1.5 == 1.5 + value == 2.5
+    assert value - 0.5 == 0.5 and 2.5 - value == 1.5
+    assert value * 1.5 == 1.5 and value / 2 == 0.5 and 3.0 // value == 3.0
+    assert value < 1.5 and value > 0.5 and not value >= 1.5
+    assert 1.5 > value and 0.5 <= value
+    assert value**0.5 == 1.0 and 2.0**value == 2.0
+    assert round(LazyInt(b"\x7b"), -1) == 120
+
+
+def test_lazy_int_serialization():
+    value = LazyInt(b"\x00\x05")
+    assert big_endian_int.serialize(value) == b"\x05"
+    assert BigEndianInt(2).serialize(value) == b"\x00\x05"
+    assert BigEndianInt(4).serialize(value) == b"\x00\x00\x00\x05"
+    with pytest.raises(SerializationError):
+        BigEndianInt(1).serialize(LazyInt(b"\x01\x00"))
+    assert pickle.loads(pickle.dumps(value)) == value
+
+
+def test_lazy_int_serializable_field():
+    class Header(Serializable):
+        fields = [
+            ("number", big_endian_int),
+            ("bloom", BigEndianInt(256, lazy=True)),
+        ]
+
+    header = Header(7, 2**1000)
+    encoded = encode(header)
+    decoded = decode(encoded, Header)
+    assert isinstance(decoded.bloom, LazyInt)
+    assert decoded == header
+    assert encode(decoded, cache=False) == encoded
+    assert encode(decoded.copy(number=8)) == encode(Header(8, 2**1000))
+
+
 def packl(lnum):
     """Packs the lnum (which must be convertable to a long) into a
     byte string 0 padded to a multiple of padmultiple bytes in size. 0
@@ -0,0 +1,112 @@
+import pytest
+
+import rlp
+from rlp import (
+    DecodingError,
+    ListBuilder,
+    SerializationError,
+)
+from rlp.sedes import (
+    CountableList,
+    big_endian_int,
+    binary,
+)
+
+
+class Transaction(rlp.Serializable):
+    fields = [
+        ("nonce", big_endian_int),
+        ("data", binary),
+    ]
+
+
+transactions = [Transaction(i, b"x" * i) for i in range(100)]
+
+
+def test_list_builder():
+    builder = ListBuilder(Transaction)
+    assert builder.encode() == rlp.encode([])
+    assert builder.encoded_size == 1
+    payload_size = 0
+    for index, tx in enumerate(transactions):
+        builder.append(tx)
+        payload_size += len(rlp.encode(tx))
+        assert len(builder) == index + 1
+        assert builder.payload_size == payload_size
+        assert builder.encoded_size == len(rlp.encode(transactions[: index + 1]))
+    assert builder.encode() == rlp.encode(transactions)
+    assert rlp.decode(builder.encode(), CountableList(Transaction)) == tuple(
+        transactions
+    )
+
+
+def test_list_builder_mixed():
+    values = [b"a", [b"b", b""], 5, b"x" * 100]
+    builder = ListBuilder()
+    builder.append(values[0])
+    builder.append_encoded(rlp.encode(values[1]))
+    builder.extend(values[2:3])
+    builder.extend_encoded([bytearray(rlp.encode(values[3]))])
+    assert builder.encode() == rlp.encode(values)
+    assert len(builder) == 4
+
+
+def test_list_builder_checkpoints():
+    builder = ListBuilder(big_endian_int)
+    builder.extend(range(10))
+    checkpoint = builder.checkpoint()
+    builder.extend(range(10, 1000))
+    assert builder.encode() == rlp.encode(list(range(1000)))
+    builder.truncate(checkpoint)
+    assert len(builder) == 10
+    assert builder.encode() == rlp.encode(list(range(10)))
+    assert builder.encoded_size == len(builder.encode())
+
+    builder.truncate(builder.checkpoint())
+    assert builder.encode() == rlp.encode(list(range(10)))
+    builder.truncate(ListBuilder().checkpoint())
+    with pytest.raises(ValueError):
+        builder.truncate(checkpoint)
+    assert builder.encode() == rlp.encode([])
+
+
+def test_list_builder_stale_checkpoint():
+    builder = ListBuilder()
+    builder.append(b"a")
+    first = builder.checkpoint()
+    builder.extend([b"b", b"c"])
+    second = builder.checkpoint()
+    builder.truncate(first)
+    # the same number of elements of the same size as before the truncation
+    builder.extend([b"x", b"y"])
+    assert builder.checkpoint()[:2] == second[:2]
+    with pytest.raises(ValueError):
+        builder.truncate(second)
+    assert builder.encode() == rlp.encode([b"a", b"x", b"y"])
+
+    builder.truncate(first)
+    builder.extend([b"x" * 10, b"y" * 10])
+    with pytest.raises(ValueError):
+        builder.truncate(second)
+    assert builder.encode() == rlp.encode([b"a", b"x" * 10, b"y" * 10])
+    builder.truncate(first)
+    assert builder.encode() == rlp.encode([b"a"])
+
+
+@pytest.mark.parametrize(
+    "rlp_", (b"", b"\x83ab", b"\x82abc", b"\xc1\x01\x02", b"\x81\x01")
+)
+def test_list_builder_invalid_encoded(rlp_):
+    builder = ListBuilder()
+    with pytest.raises(DecodingError):
+        builder.append_encoded(rlp_)
+    assert len(builder) == 0
+    assert builder.encode() == rlp.encode([])
+
+
+def test_list_builder_serialization_error():
+    builder = ListBuilder(big_endian_int)
+    builder.append(1)
+    with pytest.raises(SerializationError):
+        builder.append(-1)
+    assert builder.encode() == rlp.encode([1])
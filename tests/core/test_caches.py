@@ -0,0 +1,363 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+
+import rlp
+from rlp import (
+    DecodingCache,
+    DecodingError,
+    EncodingCache,
+    InternTable,
+    SerializationError,
+    cached_rlp_registry,
+)
+from rlp.sedes import (
+    BigEndianInt,
+    CountableList,
+    List,
+    big_endian_int,
+    binary,
+)
+
+
+class Header(rlp.Serializable):
+    fields = [
+        ("number", big_endian_int),
+        ("extra", binary),
+    ]
+
+
+class Block(rlp.Serializable):
+    fields = [
+        ("header", Header),
+        ("uncles", CountableList(Header)),
+        ("data", List([binary, CountableList(big_endian_int)])),
+    ]
+
+
+def make_block(number):
+    parent = Header(number - 1, b"parent")
+    return Block(Header(number, b"x" * 100), (parent, parent), (b"data", (1, 2, 3)))
+
+
+def test_encoding_cache_nested_objects():
+    block = make_block(10)
+    expected = rlp.encode(block, cache=False)
+    expected_nbytes = sum(
+        len(rlp.encode(obj, cache=False))
+        for obj in (block, block.header, block.uncles[0])
+    )
+
+    with EncodingCache() as cache:
+        assert rlp.encode(block, cache=False) == expected
+        # block, header and the first uncle miss, the second uncle hits
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert len(cache) == 3
+        assert cache.nbytes == expected_nbytes
+
+        assert rlp.encode(block, cache=False) == expected
+        assert (cache.hits, cache.misses) == (2, 3)
+
+        uncle_rlp = rlp.encode(block.uncles[0], cache=False)
+        assert rlp.encode(block.uncles[1], cache=False) is uncle_rlp
+        assert cache.hits == 4
+
+    assert block._cached_rlp is None
+    assert rlp.encode(make_block(10)) == expected
+    assert (cache.hits, cache.misses) == (4, 3)
+
+
+@pytest.mark.parametrize(
+    "value,sedes",
+    (
+        ((b"a", 1, (b"b", [2])), None),
+        ([b"a", 1, (b"b", [2])], None),
+        ([make_block(5), [make_block(5)]], None),
+        ((1, 2, 3), CountableList(big_endian_int)),
+        ((1, b"a"), List([big_endian_int, binary])),
+        (make_block(3), Block),
+        (0, None),
+        (True, None),
+        ("text", None),
+    ),
+)
+def test_encoding_cache_results(value, sedes):
+    expected = rlp.encode(value, sedes, cache=False)
+    with EncodingCache():
+        assert rlp.encode(value, sedes, cache=False) == expected
+        assert rlp.encode(value, sedes, cache=False) == expected
+
+
+def test_encoding_cache_content_keys():
+    with EncodingCache() as cache:
+        first = rlp.encode((b"a", (1, 2)))
+        assert rlp.encode((b"a", (1, 2))) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        assert rlp.encode(b"") == b"\x80"
+        assert rlp.encode(()) == b"\xc0"
+        assert cache.misses == 3
+
+        rlp.encode([b"a", (1, 2)])
+        assert cache.misses == 3
+
+
+class Short(rlp.Serializable):
+    fields = [("value", big_endian_int)]
+
+
+class Wide(rlp.Serializable):
+    fields = [("value", BigEndianInt(4))]
+
+
+def test_encoding_cache_equal_content_of_other_types():
+    # serializable objects of different classes compare equal if their fields do
+    assert (Short(1),) == (Wide(1),)
+    with EncodingCache():
+        assert rlp.encode((Short(1),)) == rlp.encode([[1]])
+        assert rlp.encode((Wide(1),)) == rlp.encode([[b"\x00\x00\x00\x01"]])
+        assert rlp.encode((b"", 1)) == rlp.encode([b"", 1])
+
+
+def test_encoding_cache_eviction():
+    headers = [Header(i, b"") for i in range(10)]
+    with EncodingCache(max_entries=3) as cache:
+        for header in headers:
+            rlp.encode(header, cache=False)
+        assert len(cache) == 3
+        assert cache.evictions == 7
+
+        rlp.encode(headers[7], cache=False)
+        rlp.encode(headers[0], cache=False)
+        assert (cache.hits, cache.misses) == (1, 11)
+        rlp.encode(headers[7], cache=False)
+        assert cache.hits == 2
+
+    encoding_length = len(rlp.encode(headers[0]))
+    with EncodingCache(max_entries=None, max_bytes=2 * encoding_length) as cache:
+        for header in headers:
+            rlp.encode(header, cache=False)
+        assert len(cache) == 2
+        assert cache.nbytes == 2 * encoding_length
+
+    cache.clear()
+    assert (len(cache), cache.nbytes, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_encoding_cache_errors():
+    with EncodingCache() as cache:
+        with pytest.raises(SerializationError) as error:
+            rlp.encode([make_block(2), Block(Header(-1, b""), (), (b"", ()))])
+        assert error.value.index == 1
+        with pytest.raises(TypeError):
+            rlp.encode((1, -1))
+    # only the objects of the valid block
+    assert len(cache) == 3
+
+
+def test_nested_encoding_caches():
+    header = Header(1, b"")
+    with EncodingCache() as outer:
+        with EncodingCache() as inner:
+            rlp.encode(header, cache=False)
+        rlp.encode(header, cache=False)
+    rlp.encode(header, cache=False)
+    assert inner.misses == 1
+    assert outer.misses == 1
+
+
+@pytest.fixture
+def rlp_budget():
+    yield cached_rlp_registry
+    cached_rlp_registry.set_budget(None)
+
+
+def test_cached_rlp_budget(rlp_budget):
+    headers = [Header(number, b"x" * 10) for number in range(1, 6)]
+    expected = rlp.encode(Header(1, b"x" * 10), cache=False)
+    size = len(expected)
+    rlp_budget.set_budget(3 * size)
+
+    for header in headers:
+        rlp.encode(header, cache=True)
+    assert len(rlp_budget) == 3
+    assert rlp_budget.nbytes == 3 * size
+    assert rlp_budget.evictions == 2
+    assert [header._cached_rlp is None for header in headers] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+    # dropped caches are recreated on demand
+    assert rlp.encode(headers[0], cache=True) == expected
+    assert headers[0]._cached_rlp is not None
+    assert headers[2]._cached_rlp is None
+    assert rlp_budget.nbytes == 3 * size
+
+
+def test_cached_rlp_budget_forgets_dead_objects(rlp_budget):
+    rlp_budget.set_budget(10**6)
+    header = Header(1, b"x")
+    rlp.encode(header, cache=True)
+    assert len(rlp_budget) == 1
+    del header
+    assert len(rlp_budget) == 0
+    assert rlp_budget.nbytes == 0
+
+
+def test_cached_rlp_budget_shrink_and_disable(rlp_budget):
+    rlp_budget.set_budget(10**6)
+    headers = [Header(number, b"") for number in range(4)]
+    for header in headers:
+        rlp.encode(header, cache=True)
+    rlp_budget.set_budget(0)
+    assert all(header._cached_rlp is None for header in headers)
+    assert rlp_budget.nbytes == 0
+
+    rlp_budget.set_budget(None)
+    for header in headers:
+        rlp.encode(header, cache=True)
+    assert all(header._cached_rlp is not None for header in headers)
+    assert len(rlp_budget) == 0
+
+
+def test_cached_rlp_budget_threads(rlp_budget):
+    # numbers of the same length, so that all encodings have the same size
+    headers = [Header(number, b"x" * 10) for number in range(256, 1256)]
+    size = len(rlp.encode(headers[0], cache=False))
+    rlp_budget.set_budget(100 * size)
+
+    def encode_all(offset):
+        return [rlp.encode(header) for header in headers[offset::4]]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = [
+            encoded for chunk in executor.map(encode_all, range(4)) for encoded in chunk
+        ]
+    assert sorted(results) == sorted(rlp.encode(header) for header in headers)
+    assert len(rlp_budget) == 100
+    assert rlp_budget.nbytes == 100 * size
+    assert sum(header._cached_rlp is not None for header in headers) == 100
+
+
+def test_intern_table_decode():
+    address = b"\x11" * 20
+    block = make_block(1)
+    encoded = rlp.encode([block, [address, b"", address, b"", b"x" * 33, b"x" * 33]])
+    table = InternTable()
+
+    decoded_block, values = rlp.decode(encoded, intern_table=table)
+    assert values[0] is values[2]
+    assert values[1] is values[3]
+    assert values[4] == values[5] and values[4] is not values[5]
+    assert Block.deserialize(decoded_block) == block
+
+    again = rlp.decode(rlp.encode([address]), CountableList(binary), intern_table=table)
+    assert again[0] is values[0]
+    assert table.hits >= 3
+    assert len(table) == table.misses
+
+
+def test_intern_table_countable_list():
+    table = InternTable()
+    sedes = CountableList(List([binary, binary]))
+    result = sedes.deserialize(
+        [["ab".encode(), "cd".encode()], ["ab".encode(), "cd".encode()]],
+        intern_table=table,
+    )
+    assert result == ((b"ab", b"cd"), (b"ab", b"cd"))
+    assert result[0][0] is result[1][0]
+    assert result[0][1] is result[1][1]
+    assert (table.hits, table.misses) == (2, 2)
+
+
+def test_intern_table_limits():
+    table = InternTable(max_entries=2)
+    for value in (b"a", b"b", b"c"):
+        table.intern(value)
+    assert len(table) == 2
+    assert table.evictions == 1
+
+    table = InternTable(max_bytes=5)
+    for value in (b"aaa", b"bbb"):
+        table.intern(value)
+    assert (len(table), table.nbytes, table.evictions) == (1, 3, 1)
+
+    table.clear()
+    assert (len(table), table.nbytes, table.hits, table.misses) == (0, 0, 0, 0)
+
+
+def test_decoding_cache():
+    block = make_block(7)
+    encoded = rlp.encode(block)
+
+    with DecodingCache() as cache:
+        first = rlp.decode(encoded, Block)
+        second = rlp.decode(bytearray(encoded), Block)
+    assert first is second
+    assert first == block
+    assert first._cached_rlp == encoded
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert cache.hit_rate == 0.5
+
+    # the cache is only used while it is active
+    assert rlp.decode(encoded, Block) is not first
+
+
+def test_decoding_cache_keys():
+    sedes = CountableList(big_endian_int)
+    other_sedes = CountableList(big_endian_int)
+    encoded = rlp.encode([1, 2, 3])
+
+    with DecodingCache() as cache:
+        assert rlp.decode(encoded, sedes) is rlp.decode(encoded, sedes)
+        assert rlp.decode(encoded, other_sedes) == (1, 2, 3)
+        # mutable results are not cached
+        assert rlp.decode(encoded) is not rlp.decode(encoded)
+        assert rlp.decode(encoded, List([binary] * 3)) == (b"\x01", b"\x02", b"\x03")
+
+        with pytest.raises(DecodingError):
+            rlp.decode(encoded + b"\x00", sedes)
+        assert rlp.decode(encoded + b"\x00", sedes, strict=False) == (1, 2, 3)
+        with pytest.raises(DecodingError):
+            rlp.decode(encoded + b"\x00", sedes)
+    assert cache.hits == 1
+    assert len(cache) == 4
+
+
+def test_decoding_cache_options():
+    non_canonical = rlp.encode([b"\x00\x05", b"a"])
+    encoded = rlp.encode(make_block(2))
+    table = InternTable()
+
+    with DecodingCache() as cache:
+        # results of trusted decoding are not checked, so they must not be served
+        # for untrusted input
+        assert rlp.decode(non_canonical, Header, trusted=True) == Header(5, b"a")
+        with pytest.raises(rlp.DeserializationError):
+            rlp.decode(non_canonical, Header)
+
+        first = rlp.decode(encoded, Block)
+        recursive = rlp.decode(encoded, Block, recursive_cache=True)
+        assert recursive is not first
+        assert recursive.header._cached_rlp == rlp.encode(recursive.header)
+        interned = rlp.decode(encoded, Block, intern_table=table)
+        assert interned is not first
+        assert len(table) > 0
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_decoding_cache_eviction():
+    with DecodingCache(max_entries=2) as cache:
+        for number in (1, 2, 3, 1):
+            rlp.decode(rlp.encode(number), big_endian_int)
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 4, 2)
+
+    with DecodingCache(max_entries=None, max_bytes=2) as cache:
+        rlp.decode(b"\x82ab", binary)
+        rlp.decode(b"a", binary)
+    assert (len(cache), cache.nbytes, cache.evictions) == (1, 1, 1)
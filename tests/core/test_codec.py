@@ -1,19 +1,35 @@
 import pytest
+import tracemalloc
 
 from eth_utils import (
     decode_hex,
+    keccak,
 )
 
 from rlp import (
     decode,
+    decode_lazy,
+    element_hashes,
     encode,
+    encode_iov,
+    split_list,
 )
 from rlp.codec import (
     consume_item,
     consume_length_prefix,
+    fixed_width_layout,
+    list_element_spans,
 )
 from rlp.exceptions import (
     DecodingError,
+    EncodingError,
+    SerializationError,
+)
+from rlp.sedes import (
+    CountableList,
+    Serializable,
+    big_endian_int,
+    binary,
 )
 
 EMPTYLIST = encode([])
@@ -74,3 +90,235 @@ def test_consume_item():
     ]
     assert end == 123
     assert per_item_rlp[0] == rlp
+
+
+@pytest.mark.parametrize("width", (0, 2, 32, 56))
+def test_consume_item_fixed_width(width):
+    obj = [bytes([i]) * width for i in range(5)]
+    rlp = encode(obj)
+    assert fixed_width_layout(rlp, len(rlp) - 5 * (width + 1 + (width >= 56)), len(rlp))
+
+    item, per_item_rlp, end = consume_item(rlp, 0)
+    assert item == obj
+    assert per_item_rlp == [rlp] + [[encode(value)] for value in obj]
+    assert end == len(rlp)
+
+
+@pytest.mark.parametrize(
+    "rlp",
+    (
+        # element with the common prefix but truncated
+        b"\xc5\x82ab\x82a",
+        # announced list length too short
+        b"\xc3\x82ab\x82ab",
+        # single byte encoded as short string after valid elements
+        b"\xc6\x82ab\x82ab\x81\x05",
+    ),
+)
+def test_consume_item_fixed_width_invalid(rlp):
+    with pytest.raises(DecodingError):
+        decode(rlp)
+
+
+@pytest.mark.parametrize("length", (33 * 10**9, 33 * 2**58), ids=("large", "huge"))
+def test_fixed_width_oversized_announced_length(length):
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    # a list announcing far more 32 byte strings than the input contains
+    rlp = bytes([0xF7 + len(length_bytes)]) + length_bytes + b"\xa0" + b"\x11" * 32
+    tracemalloc.start()
+    try:
+        assert fixed_width_layout(rlp, len(length_bytes) + 1, length) is None
+        with pytest.raises(DecodingError):
+            decode(rlp)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 10**6
+    with pytest.raises(DecodingError):
+        decode(rlp, trusted=True)
+    with pytest.raises(DecodingError):
+        split_list(rlp, strict=False)
+
+    nested = bytes([0xC0 + len(rlp)]) + rlp
+    with pytest.raises(DecodingError):
+        list_element_spans(nested, path=[0])
+    # lazy lists only notice the missing elements when they get to them
+    inner = decode_lazy(nested)[0]
+    assert inner[0] == b"\x11" * 32
+    with pytest.raises(IndexError):
+        inner[1]
+
+
+@pytest.mark.parametrize(
+    "obj",
+    (
+        b"",
+        b"\x05",
+        b"dog",
+        b"x" * 1000,
+        [],
+        [b"dog", [b"cat", [b""]], b"x" * 60],
+        [b"a" * 32] * 10,
+        [[b"a" * 100] * 3, []],
+    ),
+)
+def test_decode_trusted(obj):
+    rlp = encode(obj)
+    assert decode(rlp, trusted=True) == decode(rlp)
+    with pytest.raises(DecodingError):
+        decode(rlp + b"\x00", trusted=True)
+    assert decode(rlp + b"\x00", strict=False, trusted=True) == decode(rlp)
+
+
+@pytest.mark.parametrize(
+    "rlp",
+    (
+        b"",
+        b"\x83do",
+        b"\xb9\x01",
+        b"\xc3\x83dog",
+        b"\xc4\x83dog\x00",
+        b"\xf9\xff\xff\x00",
+    ),
+)
+def test_decode_trusted_checks_bounds(rlp):
+    with pytest.raises(DecodingError):
+        decode(rlp, trusted=True)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    (
+        [],
+        [b""],
+        [b"a" * 20] * 10,
+        [b"", b"a", b"\x80", b"a" * 60, [], [b"b", [b"c"]], [b"d" * 100]],
+    ),
+    ids=("empty", "single", "fixed-width", "mixed"),
+)
+def test_list_element_spans(obj):
+    encoded = encode(obj)
+    spans = list_element_spans(encoded)
+    assert [encoded[start:end] for start, end in spans] == [encode(e) for e in obj]
+    assert element_hashes(encoded) == [keccak(encode(e)) for e in obj]
+    assert element_hashes(bytearray(encoded), hash_function=len) == [
+        len(encode(e)) for e in obj
+    ]
+
+
+def test_list_element_spans_path():
+    body = [[b"tx1", b"tx" * 40, [b"nested"]], [], b"x"]
+    encoded = encode(body)
+    for path, expected in (([0], body[0]), ([1], []), ([0, 2], [b"nested"])):
+        spans = list_element_spans(encoded, path)
+        assert [encoded[start:end] for start, end in spans] == [
+            encode(e) for e in expected
+        ]
+    with pytest.raises(IndexError):
+        list_element_spans(encoded, [3])
+    with pytest.raises(IndexError):
+        list_element_spans(encoded, [2, 0])
+    with pytest.raises(DecodingError):
+        list_element_spans(encoded, [2])
+    with pytest.raises(DecodingError):
+        list_element_spans(encode(b"abc"))
+
+
+@pytest.mark.parametrize(
+    "rlp",
+    (
+        b"",
+        b"\xc3\x01\x02",
+        b"\xc2\x01\x82",
+        b"\xc3\x01\x82\x02",
+        b"\xc3\x01\x02\x03\x04",
+        b"\xc2\x81\x01",
+    ),
+    ids=("empty", "short", "element-too-long", "exceeds-list", "superfluous", "prefix"),
+)
+def test_list_element_spans_invalid(rlp):
+    with pytest.raises(DecodingError):
+        list_element_spans(rlp)
+
+
+def test_split_list():
+    body = [[b"tx1", b"tx" * 40, [b"nested"]], [], b"x"]
+    for encoded in (encode(body), bytearray(encode(body))):
+        elements = split_list(encoded)
+        assert all(isinstance(element, memoryview) for element in elements)
+        assert all(element.obj is encoded for element in elements)
+        assert [bytes(element) for element in elements] == [encode(e) for e in body]
+        assert split_list(encoded, spans=True) == list_element_spans(encoded)
+
+        nested = split_list(encoded, path=[0])
+        assert [bytes(element) for element in nested] == [encode(e) for e in body[0]]
+        nested_spans = split_list(encoded, path=[0], spans=True)
+        assert [encoded[start:end] for start, end in nested_spans] == [
+            encode(e) for e in body[0]
+        ]
+
+    with pytest.raises(DecodingError):
+        split_list(encode(body) + b"\x00")
+    assert len(split_list(encode(body) + b"\x00", strict=False)) == len(body)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    (
+        b"",
+        b"\x00",
+        b"\x80",
+        b"x" * 2000,
+        [],
+        [[], [[]]],
+        list(range(1000)),
+        [b"x" * 2000, [b"y" * 5000, b"z"], b"", bytearray(b"w" * 1024)],
+        [b"x" * 60, [b"x" * 1023]],
+    ),
+    ids=(
+        "empty",
+        "zero",
+        "single-byte",
+        "blob",
+        "empty-list",
+        "nested",
+        "ints",
+        "blobs",
+        "small",
+    ),
+)
+@pytest.mark.parametrize("threshold", (0, 1024, 10**6))
+def test_encode_iov(obj, threshold):
+    buffers = encode_iov(obj, threshold=threshold)
+    assert b"".join(buffers) == encode(obj)
+
+
+def test_encode_iov_references_payloads():
+    blobs = [b"x" * 2000, b"y" * 5000, bytearray(b"w" * 1024)]
+    obj = [1, blobs[0], [blobs[1], b"z"], 2, blobs[2]]
+    buffers = encode_iov(obj)
+    assert b"".join(buffers) == encode(obj)
+    # each blob is preceded by a separate buffer of small chunks
+    assert len(buffers) == 6
+    assert [buffers[1], buffers[3], buffers[5]] == blobs
+    assert all(buffer is blob for buffer, blob in zip(buffers[1::2], blobs))
+    assert encode_iov(list(range(100))) == [encode(list(range(100)))]
+
+
+def test_encode_iov_sedes():
+    class Message(Serializable):
+        fields = [("id", big_endian_int), ("blobs", CountableList(binary))]
+
+    blob = b"x" * 10000
+    message = Message(1, [blob, blob])
+    buffers = encode_iov(message)
+    assert b"".join(buffers) == encode(message, cache=False)
+    assert sum(buffer is blob for buffer in buffers) == 2
+    encode(message)
+    assert encode_iov(message) == [message._cached_rlp]
+    assert encode_iov([blob], CountableList(binary))[1] is blob
+
+    with pytest.raises(SerializationError):
+        encode_iov(-1, big_endian_int)
+    with pytest.raises(EncodingError):
+        encode_iov([1, {}], infer_serializer=False)
@@ -6,7 +6,9 @@ from rlp import (
     SerializationError,
 )
 from rlp.sedes import (
+    Binary,
     big_endian_int,
+    binary,
 )
 from rlp.sedes.lists import (
     CountableList,
@@ -51,3 +53,67 @@ def test_countable_list():
         with pytest.raises(DeserializationError):
             l3.deserialize(ll)
         assert len(ll._elements) == 3 + 1  # failed early, did not consume fully
+
+
+class Transaction(rlp.Serializable):
+    fields = [
+        ("nonce", big_endian_int),
+        ("to", Binary.fixed_length(20, allow_empty=True)),
+        ("data", binary),
+        ("access_list", CountableList(binary)),
+    ]
+
+
+transactions = [
+    Transaction(0, b"\x01" * 20, b"", ()),
+    Transaction(2**70, b"", b"\x00" * 100, (b"a", b"b")),
+    Transaction(5, b"\x02" * 20, b"data", ()),
+]
+
+
+@pytest.mark.parametrize("txs", (transactions, transactions[:1], []))
+def test_columns(txs):
+    sedes = CountableList(Transaction)
+    encoded = rlp.encode(txs, sedes)
+
+    columns = rlp.decode_columns(encoded, sedes)
+    assert list(columns) == list(Transaction._meta.field_names)
+    for name in Transaction._meta.field_names:
+        assert columns[name] == tuple(getattr(tx, name) for tx in txs)
+
+    assert rlp.encode_columns(columns, sedes) == encoded
+    assert sedes.deserialize_columns(rlp.decode_lazy(encoded)) == columns
+
+
+def test_columns_errors():
+    sedes = CountableList(Transaction)
+    columns = rlp.decode_columns(rlp.encode(transactions, sedes), sedes)
+
+    with pytest.raises(SerializationError):
+        rlp.encode_columns(dict(columns, nonce=(1, 2)), sedes)
+    with pytest.raises(SerializationError):
+        rlp.encode_columns({"nonce": columns["nonce"]}, sedes)
+    with pytest.raises(SerializationError, match="field to"):
+        rlp.encode_columns(dict(columns, to=(b"", b"", b"\x01")), sedes)
+    with pytest.raises(SerializationError):
+        rlp.encode_columns(columns, CountableList(Transaction, max_length=2))
+
+    invalid = [
+        [[b"", b"", b"", []], [b"\x00", b"", b"", []]],
+        [[b"", b"", b""]],
+        [b"not a list"],
+    ]
+    for serial in invalid:
+        with pytest.raises(DeserializationError) as columns_error:
+            rlp.decode_columns(rlp.encode(serial), sedes)
+        with pytest.raises(DeserializationError) as objects_error:
+            rlp.decode(rlp.encode(serial), sedes)
+        assert str(columns_error.value) == str(objects_error.value)
+        assert columns_error.value.index == objects_error.value.index
+
+    with pytest.raises(DeserializationError):
+        rlp.decode_columns(
+            rlp.encode(transactions, sedes), CountableList(Transaction, max_length=2)
+        )
+    with pytest.raises(TypeError):
+        rlp.decode_columns(rlp.encode([1, 2]), CountableList(big_endian_int))
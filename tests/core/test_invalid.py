@@ -1,9 +1,21 @@
 import pytest
 
+import rlp
 from rlp import (
     DecodingError,
+    DeserializationError,
     decode,
 )
+from rlp.exceptions import (
+    FastFailError,
+    ListDeserializationError,
+)
+from rlp.sedes import (
+    CountableList,
+    List,
+    big_endian_int,
+    binary,
+)
 
 invalid_rlp = (
     b"",
@@ -24,3 +36,54 @@ def test_invalid_rlp():
     for serial in invalid_rlp:
         with pytest.raises(DecodingError):
             decode(serial)
+
+
+def test_invalid_rlp_offset():
+    with pytest.raises(DecodingError) as excinfo:
+        decode(b"\xc4\x01\x81\x05\x02")
+    assert excinfo.value.offset == 2
+
+    with pytest.raises(DecodingError) as excinfo:
+        decode(b"\x83dogcat")
+    assert excinfo.value.offset == 4
+
+
+class Message(rlp.Serializable):
+    fields = [
+        ("sender", binary),
+        ("values", CountableList(List([big_endian_int, big_endian_int]))),
+    ]
+
+
+def test_nested_deserialization_error_path():
+    encoded = rlp.encode([b"me", [[1, 2], [3, 4], [5, b"\x00\x01"]]])
+    with pytest.raises(DeserializationError) as excinfo:
+        decode(encoded, Message)
+    error = excinfo.value
+    assert error.path == (1, 2, 1)
+    assert error.field == "values"
+    assert "field values" in str(error)
+    assert "element at index 2" in str(error)
+    assert "not minimal length" in repr(error)
+
+    assert ListDeserializationError("message", b"").path == ()
+
+
+def test_fast_fail():
+    for serial in invalid_rlp:
+        with pytest.raises(FastFailError):
+            decode(serial, fast_fail=True)
+
+    encoded = rlp.encode([b"me", [[1, b"\x00"]]])
+    with pytest.raises(DeserializationError) as first:
+        decode(encoded, Message, fast_fail=True)
+    with pytest.raises(DecodingError) as second:
+        decode(encoded, Message, fast_fail=True)
+    assert first.value is not second.value
+    assert str(first.value) == str(second.value) == FastFailError.message
+    assert first.value.rlp is None
+    assert first.value.__context__ is None
+    assert first.value.__cause__ is None
+
+    encoded = rlp.encode([b"me", [[1, 2]]])
+    assert decode(encoded, Message, fast_fail=True) == Message(b"me", [(1, 2)])
@@ -2,12 +2,18 @@ import pytest
 from collections.abc import (
     Sequence,
 )
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import sys
 
 import rlp
 from rlp import (
     DeserializationError,
 )
 from rlp.sedes import (
+    BigEndianInt,
+    Binary,
     CountableList,
     big_endian_int,
 )
@@ -119,3 +125,83 @@ def test_peek():
         with pytest.raises(IndexError):
             rlp.peek(nested, index)
     assert rlp.peek(nested, 2, CountableList(big_endian_int)) == (2, 3)
+
+
+@pytest.mark.parametrize("width", (0, 2, 32, 55, 56, 300))
+def test_fixed_width_list(width):
+    values = [bytes([i]) * width for i in range(10)]
+    encoded = rlp.encode(values)
+    lazy_list = rlp.decode_lazy(encoded)
+    assert lazy_list._get_layout()
+
+    assert len(lazy_list) == 10
+    assert lazy_list[3] == values[3]
+    assert lazy_list[-1] == values[-1]
+    assert lazy_list[2:5] == values[2:5]
+    assert lazy_list[8:] == values[8:]
+    assert list(lazy_list) == values
+    assert lazy_list.index == lazy_list.start
+    with pytest.raises(IndexError):
+        lazy_list[10]
+    with pytest.raises(IndexError):
+        lazy_list[-11]
+
+    assert rlp.peek(encoded, 4) == values[4]
+    sedes = CountableList(Binary.fixed_length(width, allow_empty=True))
+    assert sedes.deserialize(rlp.decode_lazy(encoded)) == tuple(values)
+
+
+def test_fixed_width_list_with_sedes():
+    values = [2**255 + i for i in range(5)]
+    sedes = BigEndianInt(32)
+    lazy_list = rlp.decode_lazy(rlp.encode(values, CountableList(sedes)), sedes)
+    assert lazy_list[4] == values[4]
+    assert list(lazy_list) == values
+
+
+def to_list(lazy_list):
+    return [to_list(e) if isinstance(e, rlp.lazy.LazyList) else e for e in lazy_list]
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        [b"a"],
+        [b"ab", b"a"],
+        [b"ab", b"abc", b"a"],
+        [b"ab", [b"a"]],
+        [b"ab", b"cd", b"", b"ef", b"\x00\x01"],
+        [b"a" * 60, b"b" * 58],
+        [[b"ab"], [b"ab"]],
+    ),
+)
+def test_not_fixed_width_list(value):
+    lazy_list = rlp.decode_lazy(rlp.encode(value))
+    assert not lazy_list._get_layout()
+    assert to_list(lazy_list) == value
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_shared_between_threads(frequent_thread_switches):
+    value = [[i, b"x" * (i % 7)] for i in range(500)]
+    sedes = rlp.sedes.List([big_endian_int, rlp.sedes.binary])
+    expected = [tuple(element) for element in value]
+    lazy_list = rlp.decode_lazy(rlp.encode(value), sedes)
+
+    def read(offset):
+        # every thread decodes from another position, so they overtake each other
+        results = [lazy_list[(i + offset) % len(value)] for i in range(len(value))]
+        return results[-offset:] + results[:-offset] if offset else results
+
+    with ThreadPoolExecutor(4) as executor:
+        for results in executor.map(read, (0, 100, 250, 499)):
+            assert results == expected
+    assert len(lazy_list) == len(value)
+    assert list(lazy_list) == expected
@@ -0,0 +1,141 @@
+import pytest
+
+import rlp
+from rlp import (
+    DecodeLimits,
+    DecodingError,
+)
+from rlp.codec import (
+    length_prefix,
+)
+from rlp.sedes import (
+    CountableList,
+    binary,
+)
+
+
+def evaluate(lazy_list):
+    if isinstance(lazy_list, rlp.LazyList):
+        return [evaluate(e) for e in lazy_list]
+    else:
+        return lazy_list
+
+
+def nested_list(depth):
+    encoded = rlp.encode(b"\x00")
+    for _ in range(depth):
+        encoded = length_prefix(len(encoded), 0xC0) + encoded
+    return encoded
+
+
+def count_items(value):
+    if isinstance(value, list):
+        return 1 + sum(count_items(element) for element in value)
+    return 1
+
+
+valid_values = (
+    b"",
+    b"dog",
+    [],
+    [b"a", [b"b", []], b"c" * 100],
+    [b"\x00" * 32] * 10,
+    [[b"x" * 20, b"", 1000], [[[]]]],
+)
+
+
+@pytest.mark.parametrize("value", valid_values)
+def test_within_limits(value):
+    encoded = rlp.encode(value)
+    limits = DecodeLimits(
+        max_bytes=len(encoded), max_items=100, max_depth=4, max_length=len(encoded)
+    )
+    assert rlp.decode(encoded, limits=limits) == rlp.decode(encoded)
+    assert evaluate(rlp.decode_lazy(encoded, limits=limits)) == rlp.decode(encoded)
+
+
+@pytest.mark.parametrize(
+    "encoded,limits,message",
+    (
+        (rlp.encode(b"a" * 100), DecodeLimits(max_bytes=100), "Input too long"),
+        (rlp.encode(b"a" * 100), DecodeLimits(max_length=99), "Item too long"),
+        (rlp.encode([b"a" * 100]), DecodeLimits(max_length=99), "Item too long"),
+        (rlp.encode([b"a" * 10] * 3), DecodeLimits(max_length=9), "Item too long"),
+        (rlp.encode([b"a", [b"b"]]), DecodeLimits(max_items=3), "Too many items"),
+        (rlp.encode([b"a"] * 10), DecodeLimits(max_items=10), "Too many items"),
+        (rlp.encode([b"ab"] * 10), DecodeLimits(max_items=10), "Too many items"),
+        (nested_list(5), DecodeLimits(max_depth=4), "Nesting too deep"),
+        (nested_list(10**5), DecodeLimits(max_depth=100), "Nesting too deep"),
+    ),
+    ids=[
+        "bytes",
+        "string_length",
+        "element_length",
+        "fixed_width_element_length",
+        "items",
+        "single_byte_items",
+        "fixed_width_items",
+        "depth",
+        "deep_nesting",
+    ],
+)
+def test_limits_exceeded(encoded, limits, message):
+    with pytest.raises(DecodingError, match=message):
+        rlp.decode(encoded, limits=limits)
+    with pytest.raises(DecodingError, match=message):
+        evaluate(rlp.decode_lazy(encoded, limits=limits))
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    (
+        b"\x83ab",
+        b"\xb9\xff\xffabc",
+        b"\xc3\x83abc",
+        b"\xc5\x82ab\xc3\x01",
+        b"\xfa\xff\xff\xff\x01",
+        b"\xb8",
+    ),
+)
+def test_announced_length_exceeds_input(encoded):
+    limits = DecodeLimits()
+    with pytest.raises(DecodingError):
+        rlp.decode(encoded, limits=limits)
+    with pytest.raises(DecodingError):
+        evaluate(rlp.decode_lazy(encoded, limits=limits))
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        [b"a" * 32, b"b" * 32],
+        [b"a" * 32] * 10,
+        [[b"a" * 32] * 10, b"x"],
+        [b"a", [b"b"]],
+    ),
+)
+def test_max_items_boundary(value):
+    encoded = rlp.encode(value)
+    count = count_items(value)
+    limits = DecodeLimits(max_items=count)
+    assert rlp.decode(encoded, limits=limits) == rlp.decode(encoded)
+    assert evaluate(rlp.decode_lazy(encoded, limits=limits)) == rlp.decode(encoded)
+    limits = DecodeLimits(max_items=count - 1)
+    with pytest.raises(DecodingError, match="Too many items"):
+        rlp.decode(encoded, limits=limits)
+    with pytest.raises(DecodingError, match="Too many items"):
+        evaluate(rlp.decode_lazy(encoded, limits=limits))
+
+
+def test_limits_with_sedes():
+    limits = DecodeLimits(max_items=5)
+    sedes = CountableList(binary)
+    encoded = rlp.encode([b"a", b"b", b"cd", b"e"])
+    assert rlp.decode(encoded, sedes, limits=limits) == (b"a", b"b", b"cd", b"e")
+    assert rlp.decode_lazy(encoded, binary, limits=limits)[3] == b"e"
+
+    encoded = rlp.encode([b"a", b"b", b"cd", b"e", b"f"])
+    with pytest.raises(DecodingError):
+        rlp.decode(encoded, sedes, limits=limits)
+    with pytest.raises(DecodingError):
+        sedes.deserialize(rlp.decode_lazy(encoded, limits=limits))
@@ -0,0 +1,188 @@
+import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+import rlp
+from rlp import (
+    DecodingError,
+    DeserializationError,
+    SerializationError,
+    decode_many,
+    encode_parallel,
+)
+from rlp.parallel import (
+    _dump_fields,
+    _with_cached_encodings,
+)
+from rlp.sedes import (
+    CountableList,
+    big_endian_int,
+    binary,
+)
+
+
+class Transaction(rlp.Serializable):
+    fields = [
+        ("nonce", big_endian_int),
+        ("to", binary),
+        ("data", CountableList(big_endian_int)),
+    ]
+
+
+transactions = [Transaction(i, b"\x11" * 20, list(range(i % 5))) for i in range(50)]
+encoded = [rlp.encode(tx) for tx in transactions]
+invalid = {
+    3: b"\xc5\x01",
+    10: rlp.encode([b"\x00\x01", b"", []]),
+    11: rlp.encode([1, b""]),
+}
+mixed = [invalid.get(index, item) for index, item in enumerate(encoded)]
+
+
+class OwnDeserializeTransaction(Transaction):
+    @classmethod
+    def deserialize(cls, serial):
+        return super().deserialize(serial)
+
+
+def test_decode_many_own_deserialize():
+    results = decode_many(encoded, OwnDeserializeTransaction, workers=2)
+    assert results == transactions
+    assert all(type(tx) is OwnDeserializeTransaction for tx in results)
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_decode_many(workers):
+    assert decode_many(encoded, Transaction, workers=workers) == transactions
+    assert decode_many(encoded, workers=workers) == [rlp.decode(e) for e in encoded]
+    assert decode_many([], Transaction, workers=workers) == []
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_decode_many_spans(workers):
+    buffer = bytearray(b"".join(encoded))
+    spans = []
+    position = 0
+    for item in encoded:
+        spans.append((position, position + len(item)))
+        position += len(item)
+    results = decode_many(spans, Transaction, workers=workers, buffer=buffer)
+    assert results == transactions
+    assert decode_many(spans[::-1], Transaction, workers=workers, buffer=buffer) == (
+        transactions[::-1]
+    )
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_decode_many_errors(workers):
+    results = decode_many(mixed, Transaction, workers=workers)
+    for index, result in enumerate(results):
+        if index == 3:
+            assert isinstance(result, DecodingError)
+            assert result.rlp == invalid[3]
+        elif index in invalid:
+            assert isinstance(result, DeserializationError)
+            assert result.serial == invalid[index]
+        else:
+            assert result == transactions[index]
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_decode_many_columns(workers):
+    columns = decode_many(mixed, Transaction, workers=workers, columns=True)
+    assert list(columns) == ["nonce", "to", "data"]
+    for name, column in columns.items():
+        assert len(column) == len(mixed)
+        for index, value in enumerate(column):
+            if index in invalid:
+                assert isinstance(value, (DecodingError, DeserializationError))
+                assert value is columns["nonce"][index]
+            else:
+                assert value == transactions[index][name]
+
+
+def test_decode_many_with_executor():
+    with ProcessPoolExecutor(2) as executor:
+        assert decode_many(encoded, Transaction, executor=executor) == transactions
+        assert decode_many(encoded[:3], executor=executor) == [
+            rlp.decode(e) for e in encoded[:3]
+        ]
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.parametrize(
+    "obj,sedes",
+    (
+        (transactions, None),
+        (tuple(transactions), None),
+        (transactions, CountableList(Transaction)),
+        (list(range(1000)), CountableList(big_endian_int)),
+        (range(1000), CountableList(big_endian_int)),
+        ([[b"a" * i, i] for i in range(100)], None),
+        ([], None),
+        ([b"a"], None),
+        (Transaction(1, b"", []), None),
+        (b"abc", binary),
+    ),
+    ids=(
+        "list",
+        "tuple",
+        "serializables",
+        "ints",
+        "range",
+        "inferred",
+        "empty",
+        "single",
+        "serializable",
+        "binary",
+    ),
+)
+def test_encode_parallel(obj, sedes, workers):
+    assert encode_parallel(obj, sedes, workers=workers) == rlp.encode(obj, sedes)
+
+
+def test_encode_parallel_with_executor():
+    with ThreadPoolExecutor(2) as executor:
+        assert encode_parallel(transactions, executor=executor) == rlp.encode(
+            transactions
+        )
+    with ProcessPoolExecutor(2) as executor:
+        assert encode_parallel(transactions, executor=executor) == rlp.encode(
+            transactions
+        )
+
+
+@pytest.mark.parametrize("sedes", (None, CountableList(Transaction)))
+def test_encode_parallel_sends_cached_encodings(sedes):
+    fresh = [Transaction(i, b"\x22" * 20, [i]) for i in range(10)]
+    decoded = [rlp.decode(item, Transaction) for item in encoded[:10]]
+    elements = fresh + decoded
+    chunk = _with_cached_encodings(elements, sedes and sedes.element_sedes)
+    data = _dump_fields(chunk)
+    assert all(item in data for item in encoded[:10])
+    assert not any(rlp.encode(tx, cache=False) in data for tx in fresh)
+
+    with ProcessPoolExecutor(2) as executor:
+        result = encode_parallel(elements, sedes, executor=executor)
+    assert result == rlp.encode(elements, sedes)
+
+    # caches are only sent for elements encoded with their own class as sedes
+    other_sedes = CountableList(rlp.sedes.List([big_endian_int, binary, binary]))
+    assert _with_cached_encodings(decoded, other_sedes.element_sedes) == decoded
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_encode_parallel_errors(workers):
+    with pytest.raises(SerializationError) as excinfo:
+        encode_parallel(
+            list(range(-1, 99)), CountableList(big_endian_int), workers=workers
+        )
+    assert excinfo.value.element_exception.obj == -1
+    with pytest.raises(TypeError):
+        encode_parallel(transactions + [-1], workers=workers)
+    with pytest.raises(SerializationError):
+        encode_parallel(list(range(3)), CountableList(big_endian_int, max_length=2))
+    with pytest.raises(SerializationError):
+        encode_parallel(["a", -1], CountableList(big_endian_int), workers=workers)
@@ -0,0 +1,92 @@
+import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+
+import rlp
+from rlp import (
+    DeserializationError,
+    Pipeline,
+)
+from rlp.sedes import (
+    big_endian_int,
+    binary,
+)
+
+
+class Transaction(rlp.Serializable):
+    fields = [
+        ("nonce", big_endian_int),
+        ("data", binary),
+    ]
+
+
+transactions = [Transaction(i, b"x" * (i % 10)) for i in range(200)]
+source = [rlp.encode(tx) for tx in transactions]
+
+
+@pytest.mark.parametrize("workers", (1, 3))
+def test_pipeline(workers):
+    stored = []
+    pipeline = (
+        Pipeline(source)
+        .decode(Transaction, workers=workers)
+        .stage(lambda tx: (tx.content_hash(), tx), name="hash", workers=workers)
+    )
+    assert pipeline.run(stored.append) == len(transactions)
+    assert stored == [(tx.content_hash(), tx) for tx in transactions]
+
+    assert list(pipeline.stats) == ["decode", "hash"]
+    for stats in pipeline.stats.values():
+        assert stats.items == len(transactions)
+        assert stats.busy_time > 0
+        assert stats.wall_time > 0
+        assert stats.rate > 0
+
+
+def test_pipeline_process_executor():
+    with ProcessPoolExecutor(2) as executor:
+        pipeline = Pipeline(source).decode(Transaction, executor=executor)
+        assert list(pipeline) == transactions
+
+
+def test_pipeline_backpressure():
+    produced = 0
+    consumed = 0
+    max_ahead = 0
+
+    def tracked():
+        nonlocal produced
+        for item in source:
+            produced += 1
+            yield item
+
+    def record(item):
+        nonlocal max_ahead
+        max_ahead = max(max_ahead, produced - consumed)
+        return item
+
+    pipeline = Pipeline(tracked()).stage(record, workers=2, queue_size=5).decode()
+    for _ in pipeline:
+        consumed += 1
+    assert consumed == len(source)
+    # the stage never takes more items than its queue holds
+    assert 1 < max_ahead <= 5
+
+
+def test_pipeline_stage_names():
+    pipeline = Pipeline([]).stage(len).stage(len).stage(abs, name="x")
+    assert list(pipeline.stats) == ["len", "len-1", "x"]
+    with pytest.raises(ValueError):
+        pipeline.stage(len, name="x")
+    assert pipeline.run() == 0
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_pipeline_errors(workers):
+    invalid = source[:10] + [rlp.encode([b"\x00", b""])] + source[10:]
+    results = []
+    with pytest.raises(DeserializationError):
+        for tx in Pipeline(invalid).decode(Transaction, workers=workers):
+            results.append(tx)
+    assert results == transactions[:10]
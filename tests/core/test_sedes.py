@@ -3,8 +3,15 @@ import pytest
 from rlp import (
     DeserializationError,
     SerializationError,
+    encode,
     infer_sedes,
 )
+from rlp.codec import (
+    encode_raw,
+)
+from rlp.exceptions import (
+    ListSerializationError,
+)
 from rlp.sedes import (
     CountableList,
     List,
@@ -33,7 +40,6 @@ from rlp.sedes import (
         ("你好世界", text),
         ("\u4f60\u597d\u4e16\u754c", text),
         ([], List()),
-        ([1, 2, 3], List((big_endian_int,) * 3)),
         ([[], b"asdf"], List(([], binary))),
         ([1, "asdf"], List((big_endian_int, text))),
     ),
@@ -48,6 +54,73 @@ def test_inference(value, expected):
             infer_sedes(value)
 
 
+def test_inference_of_homogeneous_sequences():
+    inferred = infer_sedes([1, 2, 3])
+    assert isinstance(inferred, CountableList)
+    assert inferred.element_sedes is big_endian_int
+
+    nested = infer_sedes([[b"a"], [b"b", b"c"]])
+    assert isinstance(nested, CountableList)
+    assert isinstance(nested.element_sedes, CountableList)
+    assert nested.element_sedes.element_sedes is binary
+
+    mixed = infer_sedes([[1], [b"a"], []])
+    assert isinstance(mixed, List)
+    assert mixed[0].element_sedes is big_endian_int
+    assert mixed[1].element_sedes is binary
+    assert mixed[2] == List()
+
+
+def test_inferred_sedes_are_not_shared():
+    value = [[True, False], ["a"]]
+    expected = encode(value)
+    assert infer_sedes(value) is not infer_sedes(value)
+
+    # modifying an inferred sedes doesn't affect later inference or encoding
+    inferred = infer_sedes(value)
+    inferred[0].element_sedes = text
+    inferred.append(binary)
+    assert len(infer_sedes(value)) == 2
+    assert infer_sedes(value)[0].element_sedes is boolean
+    assert encode(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        b"",
+        bytearray(b"asdf"),
+        0,
+        2**80,
+        [],
+        [0, 1, 256, b"", [[b"\x00"]], (b"a", 1)],
+        [True, "asdf", [False, 5]],
+        [[1, 2], ["a", "b"], [b"", []]],
+    ),
+)
+def test_encode_with_inferred_sedes(value):
+    assert encode(value) == encode_raw(infer_sedes(value).serialize(value))
+
+
+def test_encode_with_inferred_sedes_errors():
+    with pytest.raises(TypeError):
+        encode([1, [2, -1]])
+    with pytest.raises(TypeError):
+        encode([1, None])
+
+    class Unserializable:
+        @classmethod
+        def serialize(cls, obj):
+            raise SerializationError("Cannot serialize", obj)
+
+        @classmethod
+        def deserialize(cls, serial):
+            return cls()
+
+    with pytest.raises(ListSerializationError):
+        encode([b"a", [Unserializable()]])
+
+
 def test_list_sedes():
     l1 = List()
     l2 = List((big_endian_int, big_endian_int))
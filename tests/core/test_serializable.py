@@ -5,13 +5,19 @@ from multiprocessing import (
 import pickle
 import re
 
+from eth_utils import (
+    keccak,
+)
+
 from rlp import (
+    DeserializationError,
     SerializationError,
     decode,
     encode,
     infer_sedes,
 )
 from rlp.sedes import (
+    CountableList,
     List,
     big_endian_int,
     binary,
@@ -51,6 +57,26 @@ class RLPType4(RLPType3):
     pass
 
 
+class RLPTypeWithOwnDeserialize(Serializable):
+    fields = [("field1", big_endian_int)]
+
+    @classmethod
+    def deserialize(cls, serial):
+        return super().deserialize(serial)
+
+
+class RLPTypeWithOwnDeserializeParent(Serializable):
+    fields = [("child", RLPTypeWithOwnDeserialize)]
+
+
+class RLPTypeWithDeserializeArguments(Serializable):
+    fields = [("field1", big_endian_int)]
+
+    @classmethod
+    def deserialize(cls, serial, *, network):
+        return super().deserialize(serial)
+
+
 class RLPEmptyFieldsType(Serializable):
     fields = ()
 
@@ -228,6 +254,64 @@ def test_serializable_equality(type_1_a, type_1_b, type_2):
     assert type_2 != type_1_a
 
 
+def test_serializable_equality_uses_rlp_cache(type_1_a, type_1_b):
+    decoded_a = decode(encode(type_1_a), RLPType1)
+    assert decoded_a._cached_rlp is not None
+    assert decoded_a == type_1_a
+    assert type_1_a == decoded_a
+
+    decoded_b = decode(encode(type_1_b), RLPType1)
+    assert decoded_a != decoded_b
+
+    # identical caches are trusted without comparing the fields
+    decoded_b._cached_rlp = decoded_a._cached_rlp
+    assert decoded_a == decoded_b
+
+
+def test_serializable_equality_with_different_classes():
+    class IntType(Serializable):
+        fields = [("field", big_endian_int)]
+
+    class BinaryType(Serializable):
+        fields = [("field", binary)]
+
+    int_obj = decode(encode(IntType(1)), IntType)
+    binary_obj = decode(encode(BinaryType(b"\x01")), BinaryType)
+    assert int_obj._cached_rlp == binary_obj._cached_rlp
+    assert int_obj != binary_obj
+
+    assert RLPType3(1, 2, 3) == RLPType4(1, 2, 3)
+    assert RLPType3(1, 2, 3) != (2, 1, 3)
+
+
+def test_serializable_equality_without_hash_collisions(type_1_a, type_1_b):
+    type_1_a._hash_cache = hash(type_1_b)
+    assert hash(type_1_a) == hash(type_1_b)
+    assert type_1_a != type_1_b
+
+
+def test_serializable_content_hash(rlp_obj):
+    expected = keccak(encode(rlp_obj))
+    assert rlp_obj.content_hash() == expected
+    assert rlp_obj._content_hash_cache == expected
+
+    decoded = decode(encode(rlp_obj), type(rlp_obj))
+    assert decoded.content_hash() == expected
+
+
+def test_serializable_content_hash_across_processes(type_1_a):
+    pickled_obj = pickle.dumps(type_1_a)
+    for method in ["fork", "spawn"]:
+        ctx = get_context(method)
+        with ctx.Pool(1) as pool:
+            content_hash = pool.apply(_get_content_hash, (pickled_obj,))
+        assert content_hash == type_1_a.content_hash()
+
+
+def _get_content_hash(pickled_obj):
+    return pickle.loads(pickled_obj).content_hash()
+
+
 def test_serializable_pickling_across_processes(type_1_a):
     # Ensure the hash is what we expect *and* populate the cache.
     assert hash(type_1_a) == hash(tuple(type_1_a))
@@ -245,6 +329,65 @@ def _assert_hash_cache_equal(pickled_obj):
     assert hash(obj) == hash(tuple(obj))
 
 
+def test_serializable_pickles_as_rlp(rlp_obj):
+    rlp_code = encode(rlp_obj, cache=False)
+    pickled_obj = pickle.dumps(rlp_obj)
+    assert rlp_code in pickled_obj
+
+    unpickled_obj = pickle.loads(pickled_obj)
+    assert unpickled_obj == rlp_obj
+    assert type(unpickled_obj) is type(rlp_obj)
+    assert unpickled_obj._cached_rlp == rlp_code
+    assert unpickled_obj._hash_cache is None
+
+
+def test_serializable_pickling_custom_init():
+    obj = RLPType3(2, 1, 3)
+    unpickled_obj = pickle.loads(pickle.dumps(obj))
+    assert unpickled_obj == obj
+    assert (unpickled_obj.field1, unpickled_obj.field2) == (1, 2)
+
+
+class RLPTypeWithNote(Serializable):
+    fields = [("field1", big_endian_int)]
+
+    def __init__(self, field1, *, note):
+        super().__init__(field1)
+        self.note = note
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_serializable_pickling_keyword_only_init(protocol):
+    obj = RLPTypeWithNote(5, note="kept")
+    unpickled_obj = pickle.loads(pickle.dumps(obj, protocol))
+    assert unpickled_obj == obj
+    assert unpickled_obj.note == "kept"
+
+
+@pytest.mark.parametrize(
+    "obj", (RLPTypeWithOwnDeserialize(5), RLPTypeWithDeserializeArguments(5))
+)
+def test_serializable_pickling_own_deserialize(obj):
+    unpickled_obj = pickle.loads(pickle.dumps(obj))
+    assert unpickled_obj == obj
+    assert type(unpickled_obj) is type(obj)
+
+
+def test_serializable_pickling_unencodable():
+    obj = RLPType1(-1, b"a", (0, b""))
+    unpickled_obj = pickle.loads(pickle.dumps(obj))
+    assert tuple(unpickled_obj) == tuple(obj)
+    with pytest.raises(SerializationError):
+        encode(unpickled_obj)
+
+
+def test_serializable_pickling_keeps_extra_attributes(type_1_a):
+    type_1_a.extra = "not encoded"
+    unpickled_obj = pickle.loads(pickle.dumps(type_1_a))
+    assert unpickled_obj == type_1_a
+    assert unpickled_obj.extra == "not encoded"
+
+
 def test_serializable_sedes_inference(type_1_a, type_1_b, type_2):
     assert infer_sedes(type_1_a) == RLPType1
     assert infer_sedes(type_1_b) == RLPType1
@@ -289,6 +432,38 @@ def test_serializable_deserialization(type_1_a, type_1_b, type_2):
     assert res_type_2 == type_2
 
 
+def test_serializable_trusted_deserialization(type_1_a, type_2):
+    for obj in (type_1_a, type_2):
+        sedes = type(obj)
+        result = sedes.deserialize(sedes.serialize(obj), trusted=True)
+        assert result == obj
+        assert decode(encode(obj), sedes, trusted=True) == obj
+    assert decode(encode(type_2), RLPType2, trusted=True).field2_2[1].field2 == b"b"
+
+    # the serialization is not checked in trusted mode
+    serial = [b"\x00\x05", b"a", [b"", b""]]
+    with pytest.raises(DeserializationError):
+        RLPType1.deserialize(serial)
+    assert RLPType1.deserialize(serial, trusted=True) == RLPType1(5, b"a", (0, b""))
+
+    type_3 = RLPType3(2, 1, 3)
+    result = decode(encode(type_3), RLPType3, trusted=True)
+    assert (result.field1, result.field2, result.field3) == (1, 2, 3)
+
+    # superfluous bytes tolerated if not strict are not part of the cached encoding
+    result = decode(encode(type_1_a) + b"\x00", RLPType1, strict=False, trusted=True)
+    assert result._cached_rlp == encode(type_1_a)
+
+
+def test_serializable_trusted_with_own_deserialize():
+    obj = RLPTypeWithOwnDeserialize(5)
+    assert decode(encode(obj), RLPTypeWithOwnDeserialize, trusted=True) == obj
+    parent = RLPTypeWithOwnDeserializeParent(obj)
+    sedes = RLPTypeWithOwnDeserializeParent
+    assert decode(encode(parent), sedes, trusted=True) == parent
+    assert decode(encode([obj]), CountableList(type(obj)), trusted=True) == (obj,)
+
+
 def test_serializable_field_immutability(type_1_a, type_1_b, type_2):
     with pytest.raises(AttributeError, match=r"can't set attribute"):
         type_1_a.field1 += 1
@@ -0,0 +1,186 @@
+import pytest
+import random
+
+import rlp
+from rlp import (
+    DecodingError,
+    DeserializationError,
+    validate,
+)
+from rlp.sedes import (
+    BigEndianInt,
+    Binary,
+    CountableList,
+    List,
+    big_endian_int,
+    binary,
+    boolean,
+    raw,
+    text,
+)
+
+
+class Header(rlp.Serializable):
+    fields = [
+        ("number", big_endian_int),
+        ("hash", Binary.fixed_length(32)),
+        ("flag", boolean),
+        ("name", text),
+    ]
+
+
+class Block(rlp.Serializable):
+    fields = [
+        ("header", Header),
+        ("uncles", CountableList(Header, max_length=2)),
+        ("extra", raw),
+    ]
+
+
+def make_block():
+    header = Header(5, b"\x11" * 32, True, "name")
+    return Block(header, [header, Header(6, b"\x22" * 32, False, "")], [b"x", [b""]])
+
+
+def decodes(data, sedes=None, strict=True):
+    try:
+        rlp.decode(data, sedes, strict=strict)
+    except (DecodingError, DeserializationError):
+        return False
+    else:
+        return True
+
+
+valid_values = (
+    b"",
+    b"\x00",
+    b"\x7f",
+    b"\x80",
+    b"a" * 55,
+    b"a" * 56,
+    b"a" * 1024,
+    [],
+    [[], [[]], [b"a" * 60]],
+    [b"\x00"] * 100,
+)
+
+
+@pytest.mark.parametrize("value", valid_values)
+def test_validate_valid(value):
+    encoded = rlp.encode(value)
+    assert validate(encoded)
+    assert validate(bytearray(encoded))
+    assert validate(memoryview(encoded))
+    assert not validate(encoded + b"\x00")
+    assert validate(encoded + b"\x00", strict=False)
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    (
+        b"",
+        b"\x00\xab",
+        b"\x83dogcat",
+        b"\x83do",
+        b"\xc7\xc0\xc1\xc0\xc3\xc0\xc1\xc0\xff",
+        b"\xc7\xc0\xc1\xc0\xc3\xc0\xc1" b"\x81\x02",
+        b"\xb8\x00",
+        b"\xb9\x00\x00",
+        b"\xba\x00\x02\xff\xff",
+        b"\x81\x54",
+        b"\xb8\x37" + b"a" * 55,
+        b"\xf8\x01\x00",
+        b"\xc2\xc3\x00",
+    ),
+)
+def test_validate_invalid(encoded):
+    assert not validate(encoded)
+
+
+def test_validate_non_bytes():
+    assert not validate("abc")
+    assert not validate(None)
+
+
+def test_validate_matches_decode():
+    random.seed(0)
+    encodings = [rlp.encode(value) for value in valid_values] + [
+        rlp.encode(make_block())
+    ]
+    for encoded in encodings:
+        for _ in range(100):
+            mutated = bytearray(encoded)
+            position = random.randrange(len(mutated))
+            mutated[position] = random.randrange(256)
+            assert validate(bytes(mutated)) == decodes(bytes(mutated))
+            # decoding doesn't notice truncated strings if not strict
+            if validate(bytes(mutated), strict=False):
+                assert decodes(bytes(mutated), strict=False)
+
+
+@pytest.mark.parametrize(
+    "value,sedes",
+    (
+        (b"abc", binary),
+        (b"abc", Binary(min_length=3)),
+        (b"abc", Binary(max_length=2)),
+        (b"", Binary(min_length=3, allow_empty=True)),
+        ([b"abc"], binary),
+        (b"\x00\x01", big_endian_int),
+        (b"\x01\x01", big_endian_int),
+        (b"", big_endian_int),
+        (b"\x00\x01", BigEndianInt(2)),
+        (b"\x01", BigEndianInt(2)),
+        (b"", boolean),
+        (b"\x01", boolean),
+        (b"\x02", boolean),
+        (b"\x00", boolean),
+        ([b"a", b"b"], List([binary, binary])),
+        ([b"a"], List([binary, binary])),
+        ([b"a", b"b", b"c"], List([binary, binary])),
+        ([b"a", b"b", b"c"], List([binary, binary], strict=False)),
+        ([b"a", [b"b"]], List([binary, binary])),
+        ([[b"a"], [b"b"]], List([binary, binary])),
+        ([b"a", b"b", b"c"], CountableList(binary)),
+        ([b"a", b"b", b"c"], CountableList(binary, max_length=2)),
+        ([b"a", [b"b"]], CountableList(binary)),
+        ([b"a", [b"b"]], raw),
+        (b"\xff", text),
+        (b"abc", text),
+    ),
+)
+def test_validate_sedes(value, sedes):
+    encoded = rlp.encode(value)
+    assert validate(encoded, sedes) == decodes(encoded, sedes)
+
+
+def test_validate_serializable():
+    block = make_block()
+    encoded = rlp.encode(block)
+    assert validate(encoded, Block)
+    assert not validate(encoded, Header)
+
+    for invalid in (
+        [block.header, [block.header] * 3, []],
+        [block.header, [], []],
+        [list(block.header)[:3], [], []],
+        [[5, b"\x11" * 31, True, "name"], [], []],
+    ):
+        serialized = rlp.encode(invalid)
+        assert validate(serialized, Block) == decodes(serialized, Block)
+    assert validate(rlp.encode([block.header, [], []]), Block)
+
+    random.seed(1)
+    for _ in range(300):
+        mutated = bytearray(encoded)
+        position = random.randrange(len(mutated))
+        mutated[position] = random.randrange(256)
+        assert validate(bytes(mutated), Block) == decodes(bytes(mutated), Block)
+
+
+def test_validate_deep_nesting():
+    encoded = rlp.encode(b"")
+    for _ in range(10**4):
+        encoded = rlp.codec.length_prefix(len(encoded), 0xC0) + encoded
+    assert validate(encoded)
+    assert not validate(encoded[:-1])